@@ -1,3 +1,354 @@
+import re
+
+
+def cpet_outcomes(vo2_max, max_hr, max_power, max_rer, duration):
+    """
+    Summarise Cardiopulmonary Exercise Test (CPET) results.
+
+    Parameters:
+        vo2_max (float): VO₂ max in ml/kg/min
+        max_hr (int): Maximum heart rate in bpm
+        max_power (float): Maximum power in W
+        max_rer (float): Maximum respiratory exchange ratio
+        duration (str): Test duration as HH:MM:SS
+
+    Returns:
+        dict with the reported CPET values
+    """
+    return {
+        "VO₂ Max (ml/kg/min)": round(vo2_max, 1),
+        "Max HR (bpm)": int(max_hr),
+        "Max Power (W)": round(max_power, 1),
+        "Max RER": round(max_rer, 2),
+        "Test Duration": duration,
+    }
+
+
+# Header names used by common metabolic cart exports (compared after
+# lower-casing and dropping units in brackets and apostrophes)
+CPET_COLUMNS = {
+    "time": ("t", "time", "elapsed", "elapsed time", "sec"),
+    "vo2": ("vo2",),
+    "vco2": ("vco2",),
+    "ve": ("ve",),
+    "hr": ("hr", "heart rate"),
+    "power": ("power", "load", "wr", "work rate", "watts"),
+}
+
+
+def _column_key(header):
+    name = re.sub(r"\s*[\(\[].*?[\)\]]", "", header).replace("'", "").replace("’", "").strip().lower()
+    for key, names in CPET_COLUMNS.items():
+        if name in names:
+            return key
+    return None
+
+
+def _seconds(values):
+    """Elapsed time column as seconds; accepts numbers or [h:]mm:ss strings."""
+    import numpy as np
+
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        pass
+    seconds = np.empty(len(values))
+    for i, value in enumerate(values):
+        total = 0.0
+        for part in str(value).strip().split(":"):
+            total = total * 60 + float(part or "nan")
+        seconds[i] = total
+    return seconds
+
+
+def read_breath_csv(path, chunk_rows=50000):
+    """
+    Read a breath-by-breath CSV export in chunks.
+
+    Parameters:
+        path (str): CSV with a header row; time, VO2 and VCO2 columns are
+            required, VE, HR and power are used when present (see CPET_COLUMNS)
+        chunk_rows (int): rows per chunk
+
+    Yields:
+        dict of NumPy columns ("time", "vo2", "vco2", ...) per chunk
+    """
+    import csv
+    import numpy as np
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = {}
+        for i, name in enumerate(header):
+            key = _column_key(name)
+            if key and key not in keys:
+                keys[key] = i
+        missing = {"time", "vo2", "vco2"} - keys.keys()
+        if missing:
+            raise ValueError(f"CPET export is missing columns: {', '.join(sorted(missing))}")
+
+        def columns(rows):
+            chunk = {}
+            for key, i in keys.items():
+                values = [row[i] if i < len(row) and row[i].strip() else "nan" for row in rows]
+                chunk[key] = _seconds(values) if key == "time" else np.asarray(values, dtype=np.float64)
+            return chunk
+
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                yield columns(rows)
+                rows = []
+        if rows:
+            yield columns(rows)
+
+
+class BreathByBreath:
+    """
+    Collects breath-by-breath columns chunk by chunk for analyze_breaths.
+
+        data = BreathByBreath()
+        for chunk in read_breath_csv("cart_export.csv"):
+            data.add(chunk)
+        results = data.analyze(body_mass=72)
+    """
+
+    KEYS = ("time", "vo2", "vco2", "ve", "hr", "power")
+
+    def __init__(self):
+        self.chunks = {key: [] for key in self.KEYS}
+        self.rows = 0
+
+    def add(self, chunk):
+        import numpy as np
+
+        n = len(chunk["time"])
+        for key in self.KEYS:
+            values = chunk.get(key)
+            # A column missing from a chunk is kept aligned as NaN
+            self.chunks[key].append(np.full(n, np.nan) if values is None else np.asarray(values, dtype=np.float64))
+        self.rows += n
+
+    def columns(self):
+        import numpy as np
+
+        columns = {}
+        for key, parts in self.chunks.items():
+            column = np.concatenate(parts) if parts else np.empty(0)
+            columns[key] = None if key not in ("time", "vo2", "vco2") and np.isnan(column).all() else column
+        return columns
+
+    def analyze(self, **kwargs):
+        columns = self.columns()
+        return analyze_breaths(columns.pop("time"), columns.pop("vo2"), columns.pop("vco2"), **columns, **kwargs)
+
+
+def _rolling_mean(values, window):
+    """Centred moving average; the window shrinks at the ends."""
+    import numpy as np
+
+    n = len(values)
+    half = window // 2
+    cum = np.concatenate(([0.0], np.cumsum(values)))
+    idx = np.arange(n)
+    lo = np.maximum(idx - half, 0)
+    hi = np.minimum(idx + half + 1, n)
+    return (cum[hi] - cum[lo]) / (hi - lo)
+
+
+def _two_segment_breakpoint(x, y, min_fraction=0.15):
+    """
+    Best two-line fit of y on x (V-slope): the split of the x-sorted points
+    that minimises the summed squared error of both lines. Every candidate
+    split is scored at once from prefix sums.
+
+    Returns:
+        (x at the split, slope below, slope above), or None if there are too
+        few points or the slope does not increase
+    """
+    import numpy as np
+
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    n = len(x)
+    lo = max(3, int(n * min_fraction))
+    if n < 2 * lo:
+        return None
+
+    def prefix(v):
+        return np.concatenate(([0.0], np.cumsum(v)))
+
+    sx, sy, sxx, sxy, syy = prefix(x), prefix(y), prefix(x * x), prefix(x * y), prefix(y * y)
+    k = np.arange(lo, n - lo + 1)  # points [0, k) below, [k, n) above
+
+    def segment(a, b):
+        m = (b - a).astype(np.float64)
+        Sx, Sy = sx[b] - sx[a], sy[b] - sy[a]
+        Sxx = sxx[b] - sxx[a] - Sx * Sx / m
+        Sxy = sxy[b] - sxy[a] - Sx * Sy / m
+        Syy = syy[b] - syy[a] - Sy * Sy / m
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = Sxy / Sxx
+            sse = Syy - Sxy * slope
+        return np.where(Sxx > 0, sse, np.inf), slope
+
+    sse_low, slope_low = segment(np.zeros_like(k), k)
+    sse_high, slope_high = segment(k, np.full_like(k, n))
+    best = int(np.argmin(sse_low + sse_high))
+    if not np.isfinite(sse_low[best] + sse_high[best]) or slope_high[best] <= slope_low[best]:
+        return None
+    return float(x[k[best]]), float(slope_low[best]), float(slope_high[best])
+
+
+def _duration(seconds):
+    seconds = int(round(seconds))
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def analyze_breaths(time, vo2, vco2, ve=None, hr=None, power=None, body_mass=None, bin_s=15,
+                    rolling_breaths=7, outlier_sd=4.0, plateau_ml=150.0, plateau_window_s=60):
+    """
+    CPET outcomes from breath-by-breath data.
+
+    Breaths further than outlier_sd robust SDs from a 7-breath rolling median
+    of VO2 are dropped. VO2max, max RER and the plateau check use time-binned
+    means (bin_s seconds). The V-slope thresholds use the rolling-averaged
+    breaths up to the time of VO2max: VT1 is the VCO2-VO2 breakpoint and VT2
+    (respiratory compensation) the VE-VCO2 breakpoint above VT1, fitted on
+    the breaths that have a VE reading. A plateau is an increase of less than
+    plateau_ml from the last bin at least plateau_window_s before the VO2max
+    bin (bins are placed by time, so gaps in the recording are not skipped).
+
+    Parameters:
+        time (array): Elapsed time of each breath (s)
+        vo2, vco2 (array): ml/min (L/min exports are detected and converted)
+        ve (array, optional): Minute ventilation (L/min), for VT2
+        hr (array, optional): Heart rate (bpm)
+        power (array, optional): Work rate (W)
+        body_mass (float, optional): kg, for relative VO2max
+
+    Returns:
+        dict: the cpet_outcomes values plus absolute VO2max, plateau and
+        threshold figures (None where they cannot be determined)
+    """
+    import numpy as np
+
+    time = np.asarray(time, dtype=np.float64)
+    vo2 = np.asarray(vo2, dtype=np.float64)
+    vco2 = np.asarray(vco2, dtype=np.float64)
+    optional = {name: None if col is None else np.asarray(col, dtype=np.float64)
+                for name, col in (("ve", ve), ("hr", hr), ("power", power))}
+
+    keep = np.isfinite(time) & np.isfinite(vo2) & np.isfinite(vco2) & (vo2 > 0) & (vco2 > 0)
+    order = np.argsort(time[keep], kind="stable")
+    time, vo2, vco2 = time[keep][order], vo2[keep][order], vco2[keep][order]
+    optional = {name: None if col is None else col[keep][order] for name, col in optional.items()}
+    if len(time) < 2 * rolling_breaths:
+        raise ValueError("Too few valid breaths for CPET analysis.")
+    if np.median(vo2) < 10:  # litres per minute
+        vo2, vco2 = vo2 * 1000, vco2 * 1000
+
+    # Outlier breaths (coughs, swallows): distance from a rolling median, in robust SDs
+    from numpy.lib.stride_tricks import sliding_window_view
+    half = 3
+    local = np.median(sliding_window_view(np.pad(vo2, half, mode="edge"), 2 * half + 1), axis=1)
+    residual = vo2 - local
+    spread = 1.4826 * np.median(np.abs(residual - np.median(residual)))
+    clean = np.abs(residual) <= outlier_sd * spread if spread > 0 else np.ones(len(vo2), dtype=bool)
+    removed = int((~clean).sum())
+    time, vo2, vco2 = time[clean], vo2[clean], vco2[clean]
+    optional = {name: None if col is None else col[clean] for name, col in optional.items()}
+
+    # Time bins: one bincount per column
+    bins = ((time - time[0]) // bin_s).astype(np.intp)
+    counts = np.bincount(bins)
+    filled = counts > 0
+
+    def binned(col):
+        valid = np.isfinite(col)
+        sums = np.bincount(bins[valid], weights=col[valid], minlength=len(counts))
+        n = np.bincount(bins[valid], minlength=len(counts))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (sums / n)[filled]
+
+    bin_vo2, bin_vco2 = binned(vo2), binned(vco2)
+    filled_bins = np.flatnonzero(filled)  # bin number (time // bin_s) of each binned value
+    peak_bin = int(np.nanargmax(bin_vo2))
+    vo2_max = float(bin_vo2[peak_bin])
+    back = max(1, int(round(plateau_window_s / bin_s)))
+    earlier = int(np.searchsorted(filled_bins, filled_bins[peak_bin] - back, side="right")) - 1
+    plateau_delta = float(vo2_max - bin_vo2[earlier]) if earlier >= 0 else None
+
+    smooth_vo2 = _rolling_mean(vo2, rolling_breaths)
+    smooth_vco2 = _rolling_mean(vco2, rolling_breaths)
+    up_to_peak = bins <= filled_bins[peak_bin]
+
+    hr_col = optional["hr"]
+    smooth_hr = None
+    if hr_col is not None and np.isfinite(hr_col).any():
+        smooth_hr = _rolling_mean(np.where(np.isfinite(hr_col), hr_col, np.nanmean(hr_col)), rolling_breaths)
+
+    def hr_at(vo2_level):
+        if smooth_hr is None or vo2_level is None:
+            return None
+        i = int(np.argmin(np.abs(smooth_vo2[up_to_peak] - vo2_level)))
+        return int(round(smooth_hr[up_to_peak][i]))
+
+    vt1 = _two_segment_breakpoint(smooth_vo2[up_to_peak], smooth_vco2[up_to_peak])
+    vt1_vo2 = vt1[0] if vt1 else None
+    vt2_vo2 = None
+    ve_col = optional["ve"]
+    if vt1_vo2 is not None and ve_col is not None:
+        # Breaths without a VE reading are left out of the VE-VCO2 fit
+        has_ve = np.isfinite(ve_col)
+        smooth_ve = np.full(len(ve_col), np.nan)
+        smooth_ve[has_ve] = _rolling_mean(ve_col[has_ve], rolling_breaths)
+        above = up_to_peak & has_ve & (smooth_vo2 >= vt1_vo2)
+        vt2 = _two_segment_breakpoint(smooth_vco2[above], smooth_ve[above])
+        if vt2:
+            # Report VT2 as the VO2 at the breath nearest the VCO2 breakpoint
+            i = int(np.argmin(np.abs(smooth_vco2[above] - vt2[0])))
+            vt2_vo2 = float(smooth_vo2[above][i])
+
+    def pct(level):
+        return None if level is None else round(level / vo2_max * 100, 1)
+
+    power_col = optional["power"]
+    return {
+        "VO₂ Max (ml/kg/min)": round(vo2_max / body_mass, 1) if body_mass else None,
+        "Max HR (bpm)": int(round(np.nanmax(smooth_hr))) if smooth_hr is not None else None,
+        "Max Power (W)": round(float(np.nanmax(power_col)), 1)
+        if power_col is not None and np.isfinite(power_col).any() else None,
+        "Max RER": round(float(np.nanmax(bin_vco2 / bin_vo2)), 2),
+        "Test Duration": _duration(time[-1] - time[0]),
+        "VO₂ Max (ml/min)": round(vo2_max, 0),
+        "VO₂ Plateau": None if plateau_delta is None else bool(plateau_delta < plateau_ml),
+        "Plateau ΔVO₂ (ml/min)": None if plateau_delta is None else round(plateau_delta, 0),
+        "VT1 VO₂ (ml/min)": None if vt1_vo2 is None else round(vt1_vo2, 0),
+        "VT1 (% VO₂ Max)": pct(vt1_vo2),
+        "VT1 HR (bpm)": hr_at(vt1_vo2),
+        "VT2 VO₂ (ml/min)": None if vt2_vo2 is None else round(vt2_vo2, 0),
+        "VT2 (% VO₂ Max)": pct(vt2_vo2),
+        "VT2 HR (bpm)": hr_at(vt2_vo2),
+        "Breaths Analysed": int(len(time)),
+        "Breaths Removed": removed,
+    }
+
+
+def analyze_cpet_file(path, body_mass=None, chunk_rows=50000, **kwargs):
+    """analyze_breaths for a breath-by-breath CSV export, read in chunks."""
+    data = BreathByBreath()
+    for chunk in read_breath_csv(path, chunk_rows):
+        data.add(chunk)
+    return data.analyze(body_mass=body_mass, **kwargs)
+
+
 def cpet_test():
     print("=== Cardiopulmonary Exercise Test (CPET) ===")
 
@@ -7,12 +358,14 @@ def cpet_test():
     max_rer = float(input("Max RER (ratio): "))
     duration = input("Test Duration (HH:MM:SS): ")
 
+    results = cpet_outcomes(vo2_max, max_hr, max_power, max_rer, duration)
+
     print("\n--- CPET Results ---")
-    print(f"VO₂ Max       : {vo2_max:.1f} ml/kg/min")
-    print(f"Max HR        : {max_hr} bpm")
-    print(f"Max Power     : {max_power:.1f} W")
-    print(f"Max RER       : {max_rer:.2f}")
-    print(f"Test Duration : {duration}")
+    print(f"VO₂ Max       : {results['VO₂ Max (ml/kg/min)']:.1f} ml/kg/min")
+    print(f"Max HR        : {results['Max HR (bpm)']} bpm")
+    print(f"Max Power     : {results['Max Power (W)']:.1f} W")
+    print(f"Max RER       : {results['Max RER']:.2f}")
+    print(f"Test Duration : {results['Test Duration']}")
 
 
 if __name__ == "__main__":
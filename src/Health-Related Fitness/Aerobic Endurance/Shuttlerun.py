@@ -1,20 +1,54 @@
+from forgeon import shuttles
+
+
+def shuttle_run_outcomes(final_level, final_shuttles, total_shuttles=None):
+    """
+    Calculate 20m Shuttle Run Test outcomes.
+
+    Parameters:
+        final_level (int): Last level reached
+        final_shuttles (int): Shuttles completed in the final level
+        total_shuttles (int, optional): Total shuttles completed; counted
+            from the level table when not given
+
+    Returns:
+        dict with level, shuttles, distance, speed reached and estimated VO₂ max
+    """
+    table = shuttles.stage_table("beep-test")
+    # No shuttles in the final level leaves the athlete at the end of the one before
+    row = table.row(final_level, final_shuttles or 1) - (0 if final_shuttles else 1)
+    speed = table.speeds[table.first[final_level]]
+    distance = table.distances[row] if row >= 0 else 0.0
+
+    vo2_max = table.estimate_vo2max(speed, distance)
+
+    return {
+        "Final Level": final_level,
+        "Final Shuttles": final_shuttles,
+        "Total Shuttles": total_shuttles if total_shuttles else row + 1,
+        "Total Distance (m)": round(distance, 1),
+        "Speed Reached (km/h)": round(float(speed), 1),
+        "Estimated VO₂ Max (ml/kg/min)": round(float(vo2_max), 2),
+    }
+
+
 def shuttle_run_test():
     print("=== 20m Shuttle Run Test ===")
 
     final_level = int(input("Final Level: "))
     final_shuttles = int(input("Final Shuttles: "))
-    total_shuttles = int(input("Total Shuttles: "))
+    total_shuttles = input("Total Shuttles [Enter to count from the level table]: ").strip()
+    total_shuttles = int(total_shuttles) if total_shuttles else None
 
-    
-    speed = 8 + 0.5 * (final_level - 1)
+    results = shuttle_run_outcomes(final_level, final_shuttles, total_shuttles)
 
-    vo2_max = 31.025 + (3.238 * speed) - (3.248 * 0)  
     print("\n--- 20m Shuttle Run Results ---")
     print(f"Final Level      : {final_level}")
     print(f"Final Shuttles   : {final_shuttles}")
-    print(f"Total Shuttles   : {total_shuttles}")
-    print(f"Speed Reached    : {speed:.1f} km/h")
-    print(f"Estimated VO₂ Max: {vo2_max:.2f} ml/kg/min")
+    print(f"Total Shuttles   : {results['Total Shuttles']}")
+    print(f"Total Distance   : {results['Total Distance (m)']:.0f} m")
+    print(f"Speed Reached    : {results['Speed Reached (km/h)']:.1f} km/h")
+    print(f"Estimated VO₂ Max: {results['Estimated VO₂ Max (ml/kg/min)']:.2f} ml/kg/min")
 
 
 if __name__ == "__main__":
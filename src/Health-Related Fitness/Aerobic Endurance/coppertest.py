@@ -1,15 +1,314 @@
+def cooper_outcomes(distance, laps_completed):
+    """
+    Calculate Cooper 12-Minute Run Test outcomes.
+
+    Parameters:
+        distance (float): Total distance covered in meters
+        laps_completed (int): Total laps completed
+
+    Returns:
+        dict with distance, laps and estimated VO₂ max
+    """
+    vo2_max = (distance - 504.9) / 44.73
+
+    return {
+        "Distance Covered (m)": distance,
+        "Laps Completed": laps_completed,
+        "Estimated VO₂ Max (ml/kg/min)": round(vo2_max, 2),
+    }
+
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in metres between arrays of points (degrees)."""
+    import numpy as np
+
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GPSTrack:
+    """
+    Incremental Cooper-test distance for one athlete's GPS/GNSS fixes.
+
+    Fixes can be added in chunks of any size (in time order), so a squad
+    file never has to be held in memory. Fixes with a missing (NaN) or
+    out-of-range time or coordinate are dropped and counted as invalid.
+    Processing per chunk:
+
+    1. Spike filter: a fix that is more than jitter_m beyond where max_speed
+       could have taken the athlete, both from the fix before and to the fix
+       after, is a jump in the signal and is dropped.
+    2. The remaining fixes are averaged into smooth_s time bins, which damps
+       the position jitter that would otherwise add distance at 10-18 Hz.
+    3. Distance is the haversine sum between consecutive bin means; a step
+       implying more than max_speed is treated as a dropout and not counted.
+
+    Only the first duration_s seconds from the first fix (or start_time)
+    count. The state carried between chunks is two raw fixes, one open bin
+    and the last closed bin.
+    """
+
+    def __init__(self, max_speed=10.0, smooth_s=1.0, duration_s=720.0, start_time=None, jitter_m=3.0):
+        self.max_speed = max_speed
+        self.jitter_m = jitter_m
+        self.smooth_s = smooth_s
+        self.duration_s = duration_s
+        self.start = start_time
+        self.raw = None  # last two raw fixes (time, lat, lon), for the spike test
+        self.raw_decided = 0  # how many of them have already been classified
+        self.open_bin = None  # [bin index, time sum, lat sum, lon sum, count]
+        self.last = None  # last closed bin mean (time, lat, lon)
+        self.distance = 0.0
+        self.marks = []  # cumulative distance at each whole minute
+        self.fixes = 0
+        self.invalid = 0
+        self.rejected = 0
+        self.dropouts = 0
+        self.end_time = None
+
+    def add(self, time, lat, lon):
+        import numpy as np
+
+        time, lat, lon = (np.asarray(v, dtype=np.float64).ravel() for v in (time, lat, lon))
+        self.fixes += len(time)
+        # GNSS exports mark dropouts with empty or NaN fixes
+        valid = np.isfinite(time) & np.isfinite(lat) & np.isfinite(lon) & (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+        if not valid.all():
+            self.invalid += int(len(valid) - valid.sum())
+            time, lat, lon = time[valid], lat[valid], lon[valid]
+        if not len(time):
+            return
+        if self.start is None:
+            self.start = float(time[0])
+        if self.raw is not None:
+            time, lat, lon = (np.concatenate((carried, new)) for carried, new in zip(self.raw, (time, lat, lon)))
+        self._classify(time, lat, lon, final=False)
+
+    def _classify(self, time, lat, lon, final):
+        import numpy as np
+
+        # Spike test for every fix with a neighbour on both sides. Carried fixes
+        # may already be classified; the last fix waits for its successor.
+        n = len(time)
+        jump = haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]) > self.max_speed * np.diff(time) + self.jitter_m
+        spike = np.zeros(n, dtype=bool)
+        spike[1:-1] = jump[:-1] & jump[1:]
+        first = self.raw_decided if self.raw is not None else 0
+        last = n if final else n - 1
+        decided = slice(first, last)
+        self.rejected += int(spike[decided].sum())
+        keep = ~spike[decided]
+        self._bin(time[decided][keep], lat[decided][keep], lon[decided][keep])
+        tail = max(0, n - 2)
+        self.raw = (time[tail:], lat[tail:], lon[tail:])
+        self.raw_decided = max(0, last - tail)
+
+    def _bin(self, time, lat, lon):
+        import numpy as np
+
+        inside = (time >= self.start) & (time <= self.start + self.duration_s)
+        time, lat, lon = time[inside], lat[inside], lon[inside]
+        if not len(time):
+            return
+        bins = ((time - self.start) // self.smooth_s).astype(np.intp)
+        if self.open_bin is not None and bins[0] < self.open_bin[0]:
+            raise ValueError("GPS fixes must be added in time order.")
+        base = bins[0] if self.open_bin is None else self.open_bin[0]
+        offset = bins - base
+        size = offset[-1] + 1
+        sums = [np.bincount(offset, weights=v, minlength=size) for v in (time, lat, lon)]
+        counts = np.bincount(offset, minlength=size).astype(np.float64)
+        if self.open_bin is not None:
+            for i in range(3):
+                sums[i][0] += self.open_bin[i + 1]
+            counts[0] += self.open_bin[4]
+
+        filled = np.flatnonzero(counts)
+        closed = filled[:-1]
+        tail = filled[-1]
+        self.open_bin = [base + tail, sums[0][tail], sums[1][tail], sums[2][tail], counts[tail]]
+        self._steps(*(v[closed] / counts[closed] for v in sums))
+
+    def _steps(self, time, lat, lon):
+        import numpy as np
+
+        if not len(time):
+            return
+        if self.last is not None:
+            time, lat, lon = (np.concatenate(([prev], new)) for prev, new in zip(self.last, (time, lat, lon)))
+        self.last = (time[-1], lat[-1], lon[-1])
+        self.end_time = time[-1]
+        if len(time) < 2:
+            return
+        step = haversine(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        dropout = step / np.diff(time) > self.max_speed
+        self.dropouts += int(dropout.sum())
+        cumulative = self.distance + np.concatenate(([0.0], np.cumsum(np.where(dropout, 0.0, step))))
+
+        # Distance at each whole minute passed in this stretch, by interpolation
+        elapsed = time - self.start
+        minutes = np.arange(len(self.marks) + 1, int(elapsed[-1] // 60) + 1)
+        if len(minutes):
+            self.marks.extend(np.interp(minutes * 60.0, elapsed, cumulative).tolist())
+        self.distance = float(cumulative[-1])
+
+    def finish(self, athlete=None, lap_length=None):
+        """
+        Close the track and return the Cooper outcomes.
+
+        Returns:
+            dict: cooper_outcomes values plus the pace profile (distance and
+            pace for each minute), average pace and filter counts
+        """
+        if self.raw is not None:
+            self._classify(*self.raw, final=True)
+            self.raw = None
+        if self.open_bin is not None:
+            _, t, la, lo, c = self.open_bin
+            self.open_bin = None
+            self._steps(*([v / c] for v in (t, la, lo)))
+
+        distance = round(self.distance, 1)
+        laps = int(distance // lap_length) if lap_length else 0
+        result = {"Athlete": athlete, **cooper_outcomes(distance, laps)}
+        splits = []
+        previous = 0.0
+        for minute, mark in enumerate(self.marks, 1):
+            split = mark - previous
+            previous = mark
+            splits.append({
+                "Minute": minute,
+                "Distance (m)": round(split, 1),
+                "Pace (min/km)": round(1000 / split, 2) if split > 0 else None,
+            })
+        elapsed = float(self.end_time - self.start) if self.end_time is not None else 0.0
+        result["Pace Profile"] = splits
+        result["Average Pace (min/km)"] = round(elapsed / 60 / (self.distance / 1000), 2) if self.distance > 0 else None
+        result["Track Duration (s)"] = round(elapsed, 1)
+        result["Complete"] = bool(elapsed >= self.duration_s - self.smooth_s)
+        result["Fixes"] = self.fixes
+        result["Invalid Fixes"] = self.invalid
+        result["Spikes Removed"] = self.rejected
+        result["Dropouts"] = self.dropouts
+        return result
+
+
+def cooper_track_outcomes(time, lat, lon, athlete=None, lap_length=None, **kwargs):
+    """
+    Cooper outcomes from one athlete's GPS track.
+
+    Parameters:
+        time (array): Fix times (s)
+        lat, lon (array): Degrees
+        lap_length (float, optional): Track lap length (m), for laps completed
+        **kwargs: GPSTrack options (max_speed, smooth_s, duration_s, start_time)
+    """
+    track = GPSTrack(**kwargs)
+    track.add(time, lat, lon)
+    return track.finish(athlete, lap_length)
+
+
+def read_gps_chunks(path, chunk_rows=100000):
+    """
+    Read a multi-athlete GPS file in chunks.
+
+    A ``.npy`` file holds a structured array with fields athlete, time, lat
+    and lon and is memory-mapped; anything else is read as CSV with those
+    column headers (time in seconds). Either way only one chunk is in memory.
+
+    Yields:
+        (athlete, time, lat, lon) arrays per chunk
+    """
+    import numpy as np
+
+    if str(path).endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        for start in range(0, len(data), chunk_rows):
+            block = data[start:start + chunk_rows]
+            yield (np.asarray(block["athlete"]).astype(str), np.asarray(block["time"], dtype=np.float64),
+                   np.asarray(block["lat"], dtype=np.float64), np.asarray(block["lon"], dtype=np.float64))
+        return
+
+    import csv
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        missing = {"athlete", "time", "lat", "lon"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"GPS file is missing columns: {', '.join(sorted(missing))}")
+        rows = []
+        for row in reader:
+            rows.append((row["athlete"], row["time"], row["lat"], row["lon"]))
+            if len(rows) >= chunk_rows:
+                yield _gps_columns(rows)
+                rows = []
+        if rows:
+            yield _gps_columns(rows)
+
+
+def _gps_columns(rows):
+    import numpy as np
+
+    athlete, time, lat, lon = zip(*rows)
+    return (np.array(athlete), _float_column(time), _float_column(lat), _float_column(lon))
+
+
+def _float_column(values):
+    """Floats from CSV cells; empty or unparsable cells become NaN (dropped by GPSTrack)."""
+    import numpy as np
+
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        return np.array([_float_or_nan(v) for v in values])
+
+
+def _float_or_nan(value):
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def cooper_squad_file(path, lap_length=None, chunk_rows=100000, **kwargs):
+    """
+    Cooper outcomes for every athlete in a squad GPS file (see read_gps_chunks).
+
+    Returns:
+        list of dict, one per athlete in order of first appearance
+    """
+    import numpy as np
+
+    tracks = {}
+    for athlete, time, lat, lon in read_gps_chunks(path, chunk_rows):
+        names, first, inverse = np.unique(athlete, return_index=True, return_inverse=True)
+        # Stable sort by athlete keeps each athlete's fixes in file order
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(names) + 1))
+        for k in np.argsort(first):
+            rows = order[bounds[k]:bounds[k + 1]]
+            track = tracks.get(names[k])
+            if track is None:
+                track = tracks[names[k]] = GPSTrack(**kwargs)
+            track.add(time[rows], lat[rows], lon[rows])
+    return [track.finish(str(name), lap_length) for name, track in tracks.items()]
+
+
 def cooper_test():
     print("=== Cooper 12-Minute Run Test ===")
 
     distance = float(input("Enter total distance covered (m): "))
     laps_completed = int(input("Enter total laps completed: "))
 
-    vo2_max = (distance - 504.9) / 44.73
+    results = cooper_outcomes(distance, laps_completed)
 
     print("\n--- Cooper Test Results ---")
     print(f"Distance Covered : {distance} m")
     print(f"Laps Completed   : {laps_completed}")
-    print(f"Estimated VO₂ Max: {vo2_max:.2f} ml/kg/min")
+    print(f"Estimated VO₂ Max: {results['Estimated VO₂ Max (ml/kg/min)']:.2f} ml/kg/min")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,24 @@
+def ift_outcomes(final_speed, total_distance, max_heart_rate=None, coach_notes=None):
+    """
+    Summarise 30-15 Intermittent Fitness Test (30-15 IFT) results.
+
+    Parameters:
+        final_speed (float): Final speed reached in km/h
+        total_distance (float): Total distance covered in meters
+        max_heart_rate (int, optional): Maximum heart rate in bpm
+        coach_notes (str, optional): Free-text coach notes
+
+    Returns:
+        dict with the reported 30-15 IFT values
+    """
+    return {
+        "Final Speed (km/h)": final_speed,
+        "Total Distance (m)": total_distance,
+        "Max Heart Rate": max_heart_rate if max_heart_rate else "Not provided",
+        "Coach Notes": coach_notes if coach_notes else "None",
+    }
+
+
 def thirty_fifteen_ift():
     print("=== 30-15 Intermittent Fitness Test (30-15 IFT) ===")
 
@@ -7,14 +28,14 @@ def thirty_fifteen_ift():
     max_heart_rate_input = input("Enter Max Heart Rate (bpm) [optional]: ")
     coach_notes = input("Enter Coach Notes [optional]: ")
 
-    max_heart_rate = max_heart_rate_input if max_heart_rate_input.strip() else "Not provided"
-    coach_notes = coach_notes if coach_notes.strip() else "None"
+    results = ift_outcomes(final_speed, total_distance,
+                           max_heart_rate_input.strip(), coach_notes.strip())
 
     print("\n--- 30-15 IFT Results ---")
     print(f"Final Speed     : {final_speed} km/h")
     print(f"Total Distance  : {total_distance} m")
-    print(f"Max Heart Rate  : {max_heart_rate}")
-    print(f"Coach Notes     : {coach_notes}")
+    print(f"Max Heart Rate  : {results['Max Heart Rate']}")
+    print(f"Coach Notes     : {results['Coach Notes']}")
 
 
 if __name__ == "__main__":
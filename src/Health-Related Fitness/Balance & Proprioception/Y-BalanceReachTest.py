@@ -1,3 +1,34 @@
+def y_balance_outcomes(leg_tested, anterior, posteromedial, posterolateral):
+    """
+    Calculate Y-Balance Reach Test outcomes.
+
+    Parameters:
+        leg_tested (str): Leg tested (Left/Right)
+        anterior (list[float]): Anterior reach trials (cm)
+        posteromedial (list[float]): Posteromedial reach trials (cm)
+        posterolateral (list[float]): Posterolateral reach trials (cm)
+
+    Returns:
+        dict with per-direction averages and the composite reach score
+    """
+    if not anterior or not posteromedial or not posterolateral:
+        raise ValueError("Provide at least one reach trial for each direction.")
+
+    anterior_avg = sum(anterior) / len(anterior)
+    posteromedial_avg = sum(posteromedial) / len(posteromedial)
+    posterolateral_avg = sum(posterolateral) / len(posterolateral)
+
+    composite_score = (anterior_avg + posteromedial_avg + posterolateral_avg) / 3
+
+    return {
+        "Leg Tested": leg_tested,
+        "Anterior Avg (cm)": round(anterior_avg, 2),
+        "Posteromedial Avg (cm)": round(posteromedial_avg, 2),
+        "Posterolateral Avg (cm)": round(posterolateral_avg, 2),
+        "Composite Reach Score (cm)": round(composite_score, 2),
+    }
+
+
 def y_balance_test():
     print("=== Y-Balance Reach Test ===")
 
@@ -20,18 +51,14 @@ def y_balance_test():
         float(input("Enter Posterolateral Reach 2 (cm): "))
     ]
 
-    anterior_avg = sum(anterior) / len(anterior)
-    posteromedial_avg = sum(posteromedial) / len(posteromedial)
-    posterolateral_avg = sum(posterolateral) / len(posterolateral)
-
-    composite_score = (anterior_avg + posteromedial_avg + posterolateral_avg) / 3
+    results = y_balance_outcomes(leg_tested, anterior, posteromedial, posterolateral)
 
     print("\n--- Y-Balance Test Results ---")
     print(f"Leg Tested            : {leg_tested}")
-    print(f"Anterior Avg          : {anterior_avg:.2f} cm")
-    print(f"Posteromedial Avg     : {posteromedial_avg:.2f} cm")
-    print(f"Posterolateral Avg    : {posterolateral_avg:.2f} cm")
-    print(f"Composite Reach Score : {composite_score:.2f} cm")
+    print(f"Anterior Avg          : {results['Anterior Avg (cm)']:.2f} cm")
+    print(f"Posteromedial Avg     : {results['Posteromedial Avg (cm)']:.2f} cm")
+    print(f"Posterolateral Avg    : {results['Posterolateral Avg (cm)']:.2f} cm")
+    print(f"Composite Reach Score : {results['Composite Reach Score (cm)']:.2f} cm")
 
 
 if __name__ == "__main__":
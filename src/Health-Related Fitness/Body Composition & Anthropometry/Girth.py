@@ -16,6 +16,20 @@ def us_navy_bodyfat(sex, waist, neck, hip=None, height=None):
     else:
         return None
 
+def girth_outcomes(waist, hip, neck, chest, arm_relaxed, arm_flexed, sex=None, height=None):
+    whr = waist_to_hip(waist, hip)
+    wcr = waist_to_chest(waist, chest)
+    result = {
+        "Waist-to-Hip Ratio": round(whr, 2) if whr is not None else None,
+        "Waist-to-Chest Ratio": round(wcr, 2) if wcr is not None else None,
+        "Arm Difference (cm)": round(arm_difference(arm_relaxed, arm_flexed), 2),
+    }
+    if sex and height:
+        bf = us_navy_bodyfat(sex, waist, neck, hip, height)
+        if bf:
+            result["Body Fat % (US Navy)"] = round(bf, 1)
+    return result
+
 if __name__ == "__main__":
     print("=== Girth Measurements Calculator ===")
 
@@ -11,6 +11,15 @@ def body_density_8site(sum8, age, sex="male"):
 def body_fat_percent(body_density):
     return (495 / body_density) - 450
 
+def skinfold_8site_outcomes(chest, axilla, tricep, subscap, abdomen, suprailiac, thigh, calf, age, sex="male"):
+    sum8 = chest + axilla + tricep + subscap + abdomen + suprailiac + thigh + calf
+    bd = body_density_8site(sum8, age, sex)
+    return {
+        "Sum of 8 Skinfolds (mm)": round(sum8, 1),
+        "Body Density (g/cm³)": round(bd, 4),
+        "Body Fat %": round(body_fat_percent(bd), 1),
+    }
+
 if __name__ == "__main__":
     print("=== 8-Site Skinfold Test Calculator ===")
 
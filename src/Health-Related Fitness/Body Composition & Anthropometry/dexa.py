@@ -4,6 +4,16 @@ def body_fat_percent(total_mass, fat_mass):
 def bone_mass(total_mass, fat_mass, lean_mass):
     return total_mass - (fat_mass + lean_mass)
 
+def dexa_outcomes(total_mass, fat_mass, lean_mass, bmd):
+    return {
+        "Total Mass (kg)": round(total_mass, 2),
+        "Fat Mass (kg)": round(fat_mass, 2),
+        "Lean Mass (kg)": round(lean_mass, 2),
+        "Bone Mass (kg)": round(bone_mass(total_mass, fat_mass, lean_mass), 2),
+        "Body Fat %": round(body_fat_percent(total_mass, fat_mass), 1),
+        "Bone Mineral Density (g/cm²)": round(bmd, 3),
+    }
+
 if __name__ == "__main__":
     print("=== Simple DEXA Calculator ===")
 
@@ -9,6 +9,15 @@ def body_density_7site(sum7, age, sex="male"):
 def body_fat_percent(body_density):
     return (495 / body_density) - 450
 
+def skinfold_7site_outcomes(chest, axilla, tricep, subscap, abdomen, suprailiac, thigh, age, sex="male"):
+    sum7 = chest + axilla + tricep + subscap + abdomen + suprailiac + thigh
+    bd = body_density_7site(sum7, age, sex)
+    return {
+        "Sum of 7 Skinfolds (mm)": round(sum7, 1),
+        "Body Density (g/cm³)": round(bd, 4),
+        "Body Fat %": round(body_fat_percent(bd), 1),
+    }
+
 if __name__ == "__main__":
     print("=== 7-Site Skinfold Test Calculator ===")
 
@@ -1,3 +1,60 @@
+def fms_outcomes(deep_squat, hurdle_step_L, hurdle_step_R, in_line_lunge_L, in_line_lunge_R,
+                 shoulder_mobility_L, shoulder_mobility_R, leg_raise_L, leg_raise_R,
+                 trunk_stability, rotary_stability_L, rotary_stability_R):
+    """
+    Score a Functional Movement Screen (FMS).
+
+    Each argument is a 0-3 score; for left/right tests the lower side counts.
+
+    Returns:
+        dict with the counted score per test, the total (max 21) and an
+        interpretation
+    """
+    scores = [deep_squat, hurdle_step_L, hurdle_step_R, in_line_lunge_L, in_line_lunge_R,
+              shoulder_mobility_L, shoulder_mobility_R, leg_raise_L, leg_raise_R,
+              trunk_stability, rotary_stability_L, rotary_stability_R]
+    if any(s not in (0, 1, 2, 3) for s in scores):
+        raise ValueError("FMS scores must be between 0 and 3.")
+
+    # Apply FMS rules: for left-right tests, take the lower score
+    hurdle_step = min(hurdle_step_L, hurdle_step_R)
+    in_line_lunge = min(in_line_lunge_L, in_line_lunge_R)
+    shoulder_mobility = min(shoulder_mobility_L, shoulder_mobility_R)
+    leg_raise = min(leg_raise_L, leg_raise_R)
+    rotary_stability = min(rotary_stability_L, rotary_stability_R)
+
+    # Total FMS score (max = 21)
+    total_score = (
+        deep_squat +
+        hurdle_step +
+        in_line_lunge +
+        shoulder_mobility +
+        leg_raise +
+        trunk_stability +
+        rotary_stability
+    )
+
+    # Quick interpretation
+    if total_score < 14:
+        interpretation = "High risk of injury (score < 14)"
+    elif total_score <= 17:
+        interpretation = "Average movement quality"
+    else:
+        interpretation = "Excellent movement quality"
+
+    return {
+        "Deep Squat": deep_squat,
+        "Hurdle Step (min)": hurdle_step,
+        "In-Line Lunge (min)": in_line_lunge,
+        "Shoulder Mobility (min)": shoulder_mobility,
+        "Leg Raise (min)": leg_raise,
+        "Trunk Stability": trunk_stability,
+        "Rotary Stability (min)": rotary_stability,
+        "Total FMS Score": total_score,
+        "Interpretation": interpretation,
+    }
+
+
 def fms_test():
     print("=== Functional Movement Screen (FMS) ===")
     print("Please enter scores for each test (0-3)")
@@ -22,41 +79,27 @@ def fms_test():
     rotary_stability_L = int(input("Rotary Stability (L) (0-3): "))
     rotary_stability_R = int(input("Rotary Stability (R) (0-3): "))
 
-    # Apply FMS rules: for left-right tests, take the lower score
-    hurdle_step = min(hurdle_step_L, hurdle_step_R)
-    in_line_lunge = min(in_line_lunge_L, in_line_lunge_R)
-    shoulder_mobility = min(shoulder_mobility_L, shoulder_mobility_R)
-    leg_raise = min(leg_raise_L, leg_raise_R)
-    rotary_stability = min(rotary_stability_L, rotary_stability_R)
-
-    # Total FMS score (max = 21)
-    total_score = (
-        deep_squat +
-        hurdle_step +
-        in_line_lunge +
-        shoulder_mobility +
-        leg_raise +
-        trunk_stability +
-        rotary_stability
-    )
+    results = fms_outcomes(deep_squat, hurdle_step_L, hurdle_step_R, in_line_lunge_L, in_line_lunge_R,
+                           shoulder_mobility_L, shoulder_mobility_R, leg_raise_L, leg_raise_R,
+                           trunk_stability, rotary_stability_L, rotary_stability_R)
+    total_score = results["Total FMS Score"]
 
     print("\n--- FMS Results ---")
-    print(f"Deep Squat               : {deep_squat}")
-    print(f"Hurdle Step (min)        : {hurdle_step}")
-    print(f"In-Line Lunge (min)      : {in_line_lunge}")
-    print(f"Shoulder Mobility (min)  : {shoulder_mobility}")
-    print(f"Leg Raise (min)          : {leg_raise}")
-    print(f"Trunk Stability          : {trunk_stability}")
-    print(f"Rotary Stability (min)   : {rotary_stability}")
+    print(f"Deep Squat               : {results['Deep Squat']}")
+    print(f"Hurdle Step (min)        : {results['Hurdle Step (min)']}")
+    print(f"In-Line Lunge (min)      : {results['In-Line Lunge (min)']}")
+    print(f"Shoulder Mobility (min)  : {results['Shoulder Mobility (min)']}")
+    print(f"Leg Raise (min)          : {results['Leg Raise (min)']}")
+    print(f"Trunk Stability          : {results['Trunk Stability']}")
+    print(f"Rotary Stability (min)   : {results['Rotary Stability (min)']}")
     print(f"\n✅ Total FMS Score       : {total_score}/21")
 
-    # Quick interpretation
     if total_score < 14:
-        print("⚠️ High risk of injury (score < 14)")
+        print(f"⚠️ {results['Interpretation']}")
     elif total_score <= 17:
-        print("✅ Average movement quality")
+        print(f"✅ {results['Interpretation']}")
     else:
-        print("💪 Excellent movement quality")
+        print(f"💪 {results['Interpretation']}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,28 @@
+def joint_rom_record(joint, side, active_rom, passive_rom, pain_present, coach_notes=None):
+    """
+    Build one Joint-Specific ROM record.
+
+    Parameters:
+        joint (str): Joint measured (e.g., Shoulder, Knee)
+        side (str): Side measured (L/R)
+        active_rom (float): Active range of motion (°)
+        passive_rom (float): Passive range of motion (°)
+        pain_present (str): Yes/No
+        coach_notes (str, optional): Free-text notes
+
+    Returns:
+        dict: ROM record
+    """
+    return {
+        "Joint": joint,
+        "Side": side.upper(),
+        "Active ROM (°)": active_rom,
+        "Passive ROM (°)": passive_rom,
+        "Pain Present": pain_present.capitalize(),
+        "Coach Notes": coach_notes if coach_notes else "-"
+    }
+
+
 def joint_specific_rom():
     print("=== Joint-Specific ROM Assessment ===")
     print("Enter data for each joint measured (type 'done' to finish)\n")
@@ -15,15 +40,7 @@ def joint_specific_rom():
         pain_present = input("Pain Present (Yes/No): ")
         coach_notes = input("Coach Notes (Optional): ")
 
-        record = {
-            "Joint": joint,
-            "Side": side.upper(),
-            "Active ROM (°)": active_rom,
-            "Passive ROM (°)": passive_rom,
-            "Pain Present": pain_present.capitalize(),
-            "Coach Notes": coach_notes if coach_notes else "-"
-        }
-        records.append(record)
+        records.append(joint_rom_record(joint, side, active_rom, passive_rom, pain_present, coach_notes))
         print("\n✅ Entry recorded!\n")
 
     print("\n--- Joint-Specific ROM Results ---")
@@ -1,3 +1,27 @@
+def sit_and_reach_outcomes(reach_distance, trial1, trial2, trial3):
+    """
+    Calculate Sit-and-Reach Flexibility Test outcomes.
+
+    Parameters:
+        reach_distance (float): Recorded reach distance (cm)
+        trial1, trial2, trial3 (float): Trial reaches (cm)
+
+    Returns:
+        dict with the trials, their average and the best trial
+    """
+    avg_trial = (trial1 + trial2 + trial3) / 3
+    best_trial = max(trial1, trial2, trial3)
+
+    return {
+        "Reach Distance (cm)": round(reach_distance, 2),
+        "Trial 1 (cm)": round(trial1, 2),
+        "Trial 2 (cm)": round(trial2, 2),
+        "Trial 3 (cm)": round(trial3, 2),
+        "Average of Trials (cm)": round(avg_trial, 2),
+        "Best Trial Score (cm)": round(best_trial, 2),
+    }
+
+
 def sit_and_reach_test():
     print("=== Sit-and-Reach Flexibility Test ===")
 
@@ -7,16 +31,15 @@ def sit_and_reach_test():
     trial3 = float(input("Enter Trial 3 (cm): "))
 
     # Auto-calculations
-    avg_trial = (trial1 + trial2 + trial3) / 3
-    best_trial = max(trial1, trial2, trial3)
+    results = sit_and_reach_outcomes(reach_distance, trial1, trial2, trial3)
 
     print("\n--- Sit-and-Reach Test Results ---")
     print(f"Reach Distance Recorded : {reach_distance:.2f} cm")
     print(f"Trial 1                 : {trial1:.2f} cm")
     print(f"Trial 2                 : {trial2:.2f} cm")
     print(f"Trial 3                 : {trial3:.2f} cm")
-    print(f"Average of Trials       : {avg_trial:.2f} cm")
-    print(f"Best Trial Score        : {best_trial:.2f} cm")
+    print(f"Average of Trials       : {results['Average of Trials (cm)']:.2f} cm")
+    print(f"Best Trial Score        : {results['Best Trial Score (cm)']:.2f} cm")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,37 @@
+def one_rm_record(athlete, body_mass, lift_type, warmup_weight, one_rm, rpe=None, form_notes=None):
+    """
+    Build one 1RM test record.
+
+    Parameters:
+        athlete (str): Athlete name
+        body_mass (float): Body mass (kg)
+        lift_type (str): Lift tested (e.g., Squat, Bench Press, Deadlift)
+        warmup_weight (float): Warm-up weight (kg)
+        one_rm (float): One repetition maximum (kg)
+        rpe (str, optional): Rate of perceived exertion (1-10)
+        form_notes (str, optional): Form notes
+
+    Returns:
+        dict: 1RM record including relative strength
+    """
+    if body_mass <= 0:
+        raise ValueError("Body mass must be positive.")
+
+    # Auto-calculation: Relative Strength
+    relative_strength = round(one_rm / body_mass, 2)
+
+    return {
+        "Athlete": athlete,
+        "Body Mass (kg)": body_mass,
+        "Lift Type": lift_type,
+        "Warm-up Weight (kg)": warmup_weight,
+        "1RM (kg)": one_rm,
+        "RPE": rpe,
+        "Form Notes": form_notes if form_notes else "-",
+        "Relative Strength (kg/kg)": relative_strength
+    }
+
+
 def one_rm_testing():
     print("=== 1RM Testing (One Repetition Maximum) ===")
     print("Enter athlete data (type 'done' to finish)\n")
@@ -16,20 +50,7 @@ def one_rm_testing():
         rpe = input("RPE (Rate of Perceived Exertion 1–10): ")
         form_notes = input("Form Notes [optional]: ")
 
-        # Auto-calculation: Relative Strength
-        relative_strength = round(one_rm / body_mass, 2)
-
-        record = {
-            "Athlete": athlete,
-            "Body Mass (kg)": body_mass,
-            "Lift Type": lift_type,
-            "Warm-up Weight (kg)": warmup_weight,
-            "1RM (kg)": one_rm,
-            "RPE": rpe,
-            "Form Notes": form_notes if form_notes else "-",
-            "Relative Strength (kg/kg)": relative_strength
-        }
-        records.append(record)
+        records.append(one_rm_record(athlete, body_mass, lift_type, warmup_weight, one_rm, rpe, form_notes))
         print("\n✅ Entry recorded!\n")
 
     print("\n--- 1RM Test Results ---")
@@ -1,3 +1,160 @@
+def imtp_record(athlete, peak_force, trial1, trial2, trial3, rfd=None):
+    """
+    Build one IMTP Peak Force record.
+
+    Parameters:
+        athlete (str): Athlete name
+        peak_force (float): Reported peak force (N)
+        trial1, trial2, trial3 (float): Trial peak forces (N)
+        rfd (float, optional): RFD over 0-200 ms (N/s)
+
+    Returns:
+        dict: Record including the best trial peak force
+    """
+    best_peak_force = max(trial1, trial2, trial3)
+
+    return {
+        "Athlete": athlete,
+        "Peak Force (N)": peak_force,
+        "Trial 1 (N)": trial1,
+        "Trial 2 (N)": trial2,
+        "Trial 3 (N)": trial3,
+        "Best Peak Force (N)": best_peak_force,
+        "RFD (N/s)": rfd if rfd else "-"
+    }
+
+
+RFD_WINDOWS_MS = (50, 100, 200)
+
+
+def _pad_trials(trials):
+    """
+    Trials as one 2-D float array, shorter trials padded with NaN at the end.
+
+    Returns:
+        (force, per-trial lengths)
+    """
+    import numpy as np
+
+    if isinstance(trials, np.ndarray) and trials.dtype != object:
+        force = trials.astype(np.float64, copy=False)
+        if force.ndim == 1:
+            force = force[None, :]
+        return force, np.full(len(force), force.shape[-1] if force.ndim == 2 else 0)
+    rows = [np.asarray(trial, dtype=np.float64).ravel() for trial in trials]
+    if rows and all(np.ndim(trial) == 0 for trial in trials):
+        rows = [np.asarray(trials, dtype=np.float64)]  # a single trace given as a flat list
+    lengths = np.array([len(row) for row in rows], dtype=np.intp)
+    force = np.full((len(rows), lengths.max() if len(rows) else 0), np.nan)
+    for i, row in enumerate(rows):
+        force[i, :len(row)] = row
+    return force, lengths
+
+
+def analyze_imtp_traces(trials, sampling_rate, body_mass=None, baseline_ms=1000, onset_sd=5.0,
+                        windows_ms=RFD_WINDOWS_MS):
+    """
+    Onset, peak force, windowed RFD and impulse for raw IMTP force traces.
+
+    Each trace starts with the athlete standing still on the plate. The
+    baseline (system weight) is the mean of the first baseline_ms, and onset
+    is the first sample above baseline + onset_sd baseline SDs. A single
+    cumulative sum of net force per trace gives the impulse over every window,
+    so all metrics for all trials come from one vectorised pass.
+
+    Parameters:
+        trials (array-like): Force (N), one trial per row; trials may differ in
+            length (shorter ones are padded with NaN, which no metric uses)
+        sampling_rate (float): Sampling rate in Hz (typically 1000-2000)
+        body_mass (float or array, optional): kg, for relative peak force
+        baseline_ms (float): Quiet-standing period used for the baseline
+        onset_sd (float): Onset threshold in baseline standard deviations
+        windows_ms (tuple): RFD/impulse windows measured from onset
+
+    Returns:
+        dict of NumPy columns, one element per trial. Trials with no onset, or
+        windows that run past the end of the trace, hold NaN.
+    """
+    import numpy as np
+
+    force, lengths = _pad_trials(trials)
+    if force.ndim != 2 or not len(lengths) or lengths.min() < 2 or sampling_rate <= 0:
+        raise ValueError("Invalid input: provide force traces of at least 2 samples and a positive sampling rate.")
+    n_trials, n_samples = force.shape
+    padded = lengths.min() < n_samples
+
+    base_n = int(min(lengths.min(), max(1, round(baseline_ms * sampling_rate / 1000))))
+    baseline = force[:, :base_n].mean(axis=1)
+    baseline_sd = force[:, :base_n].std(axis=1)
+    threshold = baseline + onset_sd * baseline_sd
+
+    above = force > threshold[:, None]  # False on the NaN padding
+    has_onset = above.any(axis=1)
+    onset = above.argmax(axis=1)
+    rows = np.arange(n_trials)
+
+    peak_index = (np.where(np.isnan(force), -np.inf, force) if padded else force).argmax(axis=1)
+    peak = force[rows, peak_index]
+
+    # cum[:, k] = force summed over samples 0..k-1, so any window's impulse is one
+    # subtraction (less baseline * window samples for net impulse)
+    cum = np.zeros((n_trials, n_samples + 1))
+    np.cumsum(np.nan_to_num(force) if padded else force, axis=1, out=cum[:, 1:])
+
+    result = {
+        "Onset Index": np.where(has_onset, onset, -1),
+        "Baseline Force (N)": np.round(baseline, 2),
+        "Peak Force (N)": np.round(peak, 2),
+        "Net Peak Force (N)": np.round(peak - baseline, 2),
+        "Time to Peak Force (ms)": np.round(
+            np.where(has_onset & (peak_index >= onset), (peak_index - onset) / sampling_rate * 1000, np.nan), 2),
+    }
+    if body_mass is not None:
+        result["Relative Peak Force (N/kg)"] = np.round(peak / np.asarray(body_mass, dtype=np.float64), 2)
+
+    for ms in windows_ms:
+        width = int(round(ms * sampling_rate / 1000))
+        end = onset + width
+        valid = has_onset & (end < lengths)
+        end = np.minimum(end, lengths - 1)
+        rfd = (force[rows, end] - force[rows, onset]) / (width / sampling_rate)
+        impulse = (cum[rows, end] - cum[rows, onset] - baseline * (end - onset)) / sampling_rate
+        result[f"RFD 0-{ms} ms (N/s)"] = np.round(np.where(valid, rfd, np.nan), 1)
+        result[f"Impulse 0-{ms} ms (N·s)"] = np.round(np.where(valid, impulse, np.nan), 2)
+
+    return result
+
+
+def imtp_trace_outcomes(trials, sampling_rate, athlete=None, body_mass=None):
+    """
+    IMTP results for one athlete's raw force traces.
+
+    Parameters:
+        trials (list): Force traces (N), one list per trial
+        sampling_rate (float): Sampling rate in Hz
+        athlete (str, optional): Athlete name
+        body_mass (float, optional): kg
+
+    Returns:
+        dict: Per-trial metrics and the best trial (highest peak force)
+    """
+    import numpy as np
+
+    columns = analyze_imtp_traces(trials, sampling_rate, body_mass)
+    per_trial = [
+        {key: (None if np.isnan(col[i]) else col[i].item()) for key, col in columns.items()}
+        for i in range(len(columns["Peak Force (N)"]))
+    ]
+    best = max(range(len(per_trial)), key=lambda i: per_trial[i]["Peak Force (N)"])
+    return {
+        "Athlete": athlete,
+        "Trials": per_trial,
+        "Best Trial": best + 1,
+        "Best Peak Force (N)": per_trial[best]["Peak Force (N)"],
+        "RFD (N/s)": per_trial[best]["RFD 0-200 ms (N/s)"],
+    }
+
+
 def imtp_peak_force():
     print("=== IMTP Peak Force Test (Isometric Mid-Thigh Pull) ===")
     print("Enter athlete trial data (type 'done' to finish)\n")
@@ -18,18 +175,7 @@ def imtp_peak_force():
         rfd = input("RFD (0–200ms) (N/s) [optional]: ")
         rfd = float(rfd) if rfd.strip() else None
 
-        best_peak_force = max(trial1, trial2, trial3)
-
-        record = {
-            "Athlete": athlete,
-            "Peak Force (N)": peak_force,
-            "Trial 1 (N)": trial1,
-            "Trial 2 (N)": trial2,
-            "Trial 3 (N)": trial3,
-            "Best Peak Force (N)": best_peak_force,
-            "RFD (N/s)": rfd if rfd else "-"
-        }
-        records.append(record)
+        records.append(imtp_record(athlete, peak_force, trial1, trial2, trial3, rfd))
         print("\n✅ Entry recorded!\n")
 
     print("\n--- IMTP Peak Force Results ---")
@@ -1,3 +1,198 @@
+from forgeon import durations
+
+
+def pushup_record(athlete, total_reps, duration, form_breakdown=None):
+    """
+    Build one Push-Up Endurance record.
+
+    Parameters:
+        athlete (str): Athlete name
+        total_reps (int): Total repetitions
+        duration (str): Test duration (mm:ss); "Test Duration (s)" is None
+            when it is free text
+        form_breakdown (str, optional): Form breakdown point
+
+    Returns:
+        dict: Push-up record
+    """
+    return {
+        "Athlete": athlete,
+        "Total Repetitions": total_reps,
+        "Test Duration": duration,
+        "Test Duration (s)": durations.duration_seconds(duration),
+        "Form Breakdown Point": form_breakdown if form_breakdown else "-",
+    }
+
+
+class RepCounter:
+    """
+    Count push-ups from a wearable accelerometer (upper back or chest), fed
+    in chunks with ``add`` and read with ``finish``.
+
+    The vertical acceleration (along gravity, taken from a ``gravity_s``
+    moving average) is smoothed and run through a Schmitt trigger at
+    +/-``threshold`` m/s². Each rep is a low -> high -> low cycle: the top
+    of the push-up is the middle of a low period, where the trunk is still,
+    so acceleration is integrated twice between two tops, with the velocity
+    pinned to zero at both ends, to give the rep's depth. Only the samples
+    since the last top are kept.
+
+    A rep is partial when it is shallower than ``partial_ratio`` times the
+    athlete's median depth or ``min_depth_cm``, or faster than ``min_rep_s``.
+    Cycles slower than ``max_rep_s`` are dropped as not being push-ups.
+    """
+
+    def __init__(self, scale=None, threshold=0.3, smooth_s=0.2, gravity_s=5.0, partial_ratio=0.6,
+                 min_depth_cm=5.0, min_rep_s=0.5, max_rep_s=5.0, pause_s=1.0):
+        self.scale = scale
+        self.threshold = threshold
+        self.smooth_s = smooth_s
+        self.gravity_s = gravity_s
+        self.partial_ratio = partial_ratio
+        self.min_depth_cm = min_depth_cm
+        self.min_rep_s = min_rep_s
+        self.max_rep_s = max_rep_s
+        self.pause_s = pause_s
+        self.gravity = self.smooth = None
+        self.state = 0
+        self.t_down = None     # when the current low period began
+        self.from_rest = False  # ... and whether it began from rest rather than a rep
+        self.rep_start = None  # top the open rep started from
+        self.times = self.accel = None
+        self.last_time = None
+        self.cycles = []       # (start, end, depth cm)
+
+    def add(self, time, acc):
+        import numpy as np
+        from forgeon import imu
+
+        time = np.asarray(time, dtype=np.float64)
+        acc = np.asarray(acc, dtype=np.float64).reshape(-1, 3)
+        if not len(time):
+            return
+        if self.gravity is None:
+            rate = imu.sample_rate(time)
+            self.scale = imu.to_ms2(acc, self.scale)
+            self.gravity = imu.MovingAverage(self.gravity_s * rate)
+            self.smooth = imu.MovingAverage(self.smooth_s * rate)
+            self.times = time[:0]
+            self.accel = time[:0]
+        acc = acc * self.scale
+        down = self.gravity(acc)
+        g = np.linalg.norm(down, axis=1)
+        up = self.smooth(np.einsum("ij,ij->i", acc, down) / g - g)
+
+        self.times = np.concatenate((self.times, time))
+        self.accel = np.concatenate((self.accel, up))
+        self.last_time = time[-1]
+
+        level = np.where(up > self.threshold, 1, np.where(up < -self.threshold, -1, 0))
+        last = np.maximum.accumulate(np.where(level != 0, np.arange(len(level)), -1))
+        state = np.where(last >= 0, level[np.maximum(last, 0)], self.state)
+        previous = np.concatenate(([self.state], state[:-1]))
+        flips = np.flatnonzero(state != previous)
+        self.state = int(state[-1])
+
+        for i in flips:
+            if state[i] == -1:
+                self.t_down = time[i]
+                self.from_rest = previous[i] == 0
+                continue
+            # Entering a high period: the low period before it held the top of the push-up
+            if self.t_down is None:
+                self.rep_start = None  # recording began mid-rep
+                continue
+            middle = (self.t_down + time[i]) / 2
+            if self.rep_start is not None:
+                self._close(min(middle, self.t_down + self.pause_s))
+            if self.from_rest:  # first descent: the low period is the descent itself
+                self.rep_start = max(self.t_down, time[i] - self.max_rep_s / 2)
+            else:
+                self.rep_start = max(middle, time[i] - self.pause_s)
+            self.t_down = None
+
+        now = self.last_time
+        if self.rep_start is not None:
+            if self.state == -1 and now >= self.t_down + 2 * self.pause_s:
+                self._close(self.t_down + self.pause_s)  # resting at the top
+                self.rep_start = None
+            elif now - self.rep_start > self.max_rep_s:
+                self.rep_start = None
+        keep = self.rep_start if self.rep_start is not None else now - self.pause_s
+        start = np.searchsorted(self.times, keep)
+        self.times, self.accel = self.times[start:], self.accel[start:]
+
+    def _close(self, end):
+        import numpy as np
+
+        lo, hi = np.searchsorted(self.times, [self.rep_start, end], side="left")
+        t, a = self.times[lo:hi + 1], self.accel[lo:hi + 1]
+        if len(t) < 3 or end - self.rep_start > self.max_rep_s:
+            return
+        dt = np.diff(t)
+        v = np.concatenate(([0.0], np.cumsum((a[1:] + a[:-1]) / 2 * dt)))
+        v -= v[-1] * (t - t[0]) / (t[-1] - t[0])  # still at both tops
+        d = np.concatenate(([0.0], np.cumsum((v[1:] + v[:-1]) / 2 * dt)))
+        self.cycles.append((float(t[0]), float(t[-1]), float(d.max() - d.min()) * 100))
+
+    def finish(self, athlete=None, form_breakdown=None):
+        import numpy as np
+
+        if self.rep_start is not None and self.state == -1 and self.t_down is not None:
+            self._close(min(self.last_time, self.t_down + self.pause_s))
+            self.rep_start = None
+        if not self.cycles:
+            record = pushup_record(athlete, 0, durations.format_duration(0), form_breakdown)
+            record.update({"Test Duration (s)": 0.0, "Partial Repetitions": 0, "Mean Depth (cm)": None,
+                           "Rep Depths (cm)": [], "Cadence (reps/min)": None})
+            return record
+
+        start, end, depth = (np.array(col) for col in zip(*self.cycles))
+        paced = end - start >= self.min_rep_s
+        reference = float(np.median(depth[paced])) if paced.any() else 0.0
+        full = paced & (depth >= self.partial_ratio * reference) & (depth >= self.min_depth_cm)
+        reps = int(full.sum())
+        duration = float(end[-1] - start[0])
+        if not form_breakdown and not full.all():
+            form_breakdown = f"First partial rep after {int(full[:np.argmin(full)].sum())} full reps"
+
+        record = pushup_record(athlete, reps, durations.format_duration(duration), form_breakdown)
+        record.update({
+            "Test Duration (s)": round(duration, 2),
+            "Partial Repetitions": int(len(full) - reps),
+            "Mean Depth (cm)": round(float(depth[full].mean()), 1) if reps else None,
+            "Rep Depths (cm)": [round(float(x), 1) for x in depth],
+            "Cadence (reps/min)": round(reps / duration * 60, 1) if duration > 0 else None,
+        })
+        return record
+
+
+def pushup_imu_outcomes(time, acc, athlete=None, form_breakdown=None, **kwargs):
+    """
+    Push-up count from one accelerometer recording.
+
+    Parameters:
+        time (array): Sample times (s)
+        acc (array): (n, 3) acceleration, m/s² or g
+
+    Returns:
+        dict: Push-up record with partial reps, depths and cadence
+    """
+    counter = RepCounter(**kwargs)
+    counter.add(time, acc)
+    return counter.finish(athlete, form_breakdown)
+
+
+def pushup_imu_file(path, athlete=None, form_breakdown=None, chunk_rows=50000, **kwargs):
+    """pushup_imu_outcomes for a recording file (see forgeon.imu.read_imu), read in chunks."""
+    from forgeon import imu
+
+    counter = RepCounter(**kwargs)
+    for time, acc in imu.read_imu(path, chunk_rows):
+        counter.add(time, acc)
+    return counter.finish(athlete, form_breakdown)
+
+
 def pushup_endurance_test():
     print("=== Push-Up Endurance Test ===")
     print("Enter athlete data (type 'done' to finish)\n")
@@ -13,13 +208,7 @@ def pushup_endurance_test():
         duration = input("Test Duration (mm:ss): ")
         form_breakdown = input("Form Breakdown Point [optional]: ")
 
-        record = {
-            "Athlete": athlete,
-            "Total Repetitions": total_reps,
-            "Test Duration": duration,
-            "Form Breakdown Point": form_breakdown if form_breakdown else "-",
-        }
-        records.append(record)
+        records.append(pushup_record(athlete, total_reps, duration, form_breakdown))
         print("\n✅ Entry recorded!\n")
 
     print("\n--- Push-Up Endurance Test Results ---")
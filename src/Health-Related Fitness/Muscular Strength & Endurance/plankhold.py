@@ -1,3 +1,191 @@
+from forgeon import durations
+
+
+def plank_record(athlete, hold_time, form_notes=None):
+    """
+    Build one Plank Hold record.
+
+    Parameters:
+        athlete (str): Athlete name
+        hold_time (str or float): Hold time (mm:ss, or seconds)
+        form_notes (str, optional): Form notes
+
+    Returns:
+        dict: Plank record; "Hold Time" is kept as typed and "Hold Time (s)"
+        holds it as a number (None when it is free text)
+    """
+    return {
+        "Athlete": athlete,
+        "Hold Time": hold_time,
+        "Hold Time (s)": durations.duration_seconds(hold_time),
+        "Form Notes": form_notes if form_notes else "-",
+    }
+
+
+class PlankHold:
+    """
+    Time a plank from a wearable accelerometer (lower back or hips), fed in
+    chunks with ``add`` and read with ``finish``.
+
+    Everything is judged on a trailing ``window_s`` window: its mean gives
+    the sensor's orientation against gravity and the spread of the
+    acceleration magnitude gives how much the athlete is moving. Only that
+    window is carried between chunks, so memory does not grow with the
+    length of the hold.
+
+    The hold starts once the athlete has been still for ``settle_s`` (start
+    the recording as they get into position); the orientation then is the
+    reference. A form break is a stretch of at least ``min_break_s`` tilted
+    more than ``tilt_deg`` from the reference (hips sagging or piking) or
+    moving more than ``motion_sd``. A break lasting ``max_break_s`` ends the
+    hold at the moment it began.
+    """
+
+    def __init__(self, scale=None, window_s=0.5, settle_s=2.0, still_sd=0.5, tilt_deg=10.0,
+                 motion_sd=1.5, min_break_s=0.5, max_break_s=2.0):
+        self.scale = scale
+        self.window_s = window_s
+        self.settle_s = settle_s
+        self.still_sd = still_sd
+        self.tilt_deg = tilt_deg
+        self.motion_sd = motion_sd
+        self.min_break_s = min_break_s
+        self.max_break_s = max_break_s
+        self.window = None
+        self.still_since = None   # start of the current still stretch, before the hold
+        self.start = None
+        self.reference = None
+        self.break_start = None   # open form break: start time, worst tilt, moved
+        self.break_tilt = 0.0
+        self.break_moved = False
+        self.end = None
+        self.last_time = None
+        self.events = []
+
+    def add(self, time, acc):
+        import numpy as np
+        from forgeon import imu
+        from forgeon.signals import runs
+
+        time = np.asarray(time, dtype=np.float64)
+        acc = np.asarray(acc, dtype=np.float64).reshape(-1, 3)
+        if not len(time) or self.end is not None:
+            return
+        if self.window is None:
+            self.scale = imu.to_ms2(acc, self.scale)
+            self.window = imu.MovingAverage(self.window_s * imu.sample_rate(time))
+        acc = acc * self.scale
+        magnitude = np.linalg.norm(acc, axis=1)
+        mean = self.window(np.column_stack((acc, magnitude, magnitude ** 2)))
+        sd = np.sqrt(np.maximum(mean[:, 4] - mean[:, 3] ** 2, 0.0))
+        self.last_time = time[-1]
+
+        if self.start is None:
+            begun = self._settle(time, mean, sd)
+            if begun is None:
+                return
+            time, mean, sd = time[begun:], mean[begun:], sd[begun:]
+
+        down = mean[:, :3] / np.linalg.norm(mean[:, :3], axis=1)[:, None]
+        tilt = np.degrees(np.arccos(np.clip(down @ self.reference, -1.0, 1.0)))
+        moved = sd > self.motion_sd
+        starts, ends = runs((tilt > self.tilt_deg) | moved)
+        if self.break_start is not None and (not len(starts) or starts[0] > 0):
+            self._close_break(time[0], False)  # the open break ended with the last chunk
+        for lo, hi in zip(starts, ends):
+            if self.break_start is None:
+                self.break_start = time[lo]
+            self.break_tilt = max(self.break_tilt, float(tilt[lo:hi].max()))
+            self.break_moved |= bool(moved[lo:hi].any())
+            # A run touching the end of the chunk stays open for the next one
+            self._close_break(time[hi] if hi < len(time) else time[-1], hi == len(time))
+            if self.end is not None:
+                return
+
+    def _settle(self, time, mean, sd):
+        """Look for `settle_s` of stillness; returns the index the hold is judged from, or None."""
+        import numpy as np
+        from forgeon.signals import runs
+
+        still = sd < self.still_sd
+        starts, ends = runs(still)
+        for lo, hi in zip(starts, ends):
+            since = self.still_since if lo == 0 and self.still_since is not None else time[lo]
+            ready = np.searchsorted(time, since + self.settle_s)
+            if ready < hi:
+                self.start = since
+                self.reference = mean[ready, :3] / np.linalg.norm(mean[ready, :3])
+                self.still_since = None
+                return ready
+            self.still_since = since if hi == len(time) else None
+        if not len(starts) or ends[-1] < len(time):
+            self.still_since = None
+        return None
+
+    def _close_break(self, at, still_open):
+        duration = at - self.break_start
+        if duration >= self.max_break_s:
+            self.end = self.break_start  # the hold is over; this break is not part of it
+            return
+        if still_open:
+            return
+        if duration >= self.min_break_s:
+            self.events.append({
+                "At (s)": round(float(self.break_start - self.start), 2),
+                "Duration (s)": round(float(duration), 2),
+                "Max Tilt (deg)": round(self.break_tilt, 1),
+                "Movement": self.break_moved,
+            })
+        self.break_start = None
+        self.break_tilt = 0.0
+        self.break_moved = False
+
+    def finish(self, athlete=None, form_notes=None):
+        if self.start is None:
+            raise ValueError("No steady plank position found in the recording.")
+        if self.end is None and self.break_start is not None:
+            self._close_break(self.last_time, False)
+        ended_by = "Form break" if self.end is not None else "End of recording"
+        hold = (self.end if self.end is not None else self.last_time) - self.start
+
+        record = plank_record(athlete, durations.format_duration(hold), form_notes)
+        record.update({
+            "Hold Time (s)": round(float(hold), 2),
+            "Form Breaks": len(self.events),
+            "Form Break Events": self.events,
+            "Ended By": ended_by,
+        })
+        return record
+
+
+def plank_imu_outcomes(time, acc, athlete=None, form_notes=None, **kwargs):
+    """
+    Plank hold time and form breaks from one accelerometer recording.
+
+    Parameters:
+        time (array): Sample times (s)
+        acc (array): (n, 3) acceleration, m/s² or g
+
+    Returns:
+        dict: Plank record with form break events
+    """
+    hold = PlankHold(**kwargs)
+    hold.add(time, acc)
+    return hold.finish(athlete, form_notes)
+
+
+def plank_imu_file(path, athlete=None, form_notes=None, chunk_rows=50000, **kwargs):
+    """plank_imu_outcomes for a recording file (see forgeon.imu.read_imu), read in chunks."""
+    from forgeon import imu
+
+    hold = PlankHold(**kwargs)
+    for time, acc in imu.read_imu(path, chunk_rows):
+        hold.add(time, acc)
+        if hold.end is not None:
+            break
+    return hold.finish(athlete, form_notes)
+
+
 def plank_hold_test():
     print("=== Plank Hold Test ===")
     print("Enter athlete data (type 'done' to finish)\n")
@@ -12,12 +200,7 @@ def plank_hold_test():
         hold_time = input("Hold Time (mm:ss): ")
         form_notes = input("Form Notes [optional]: ")
 
-        record = {
-            "Athlete": athlete,
-            "Hold Time": hold_time,
-            "Form Notes": form_notes if form_notes else "-",
-        }
-        records.append(record)
+        records.append(plank_record(athlete, hold_time, form_notes))
         print("\n✅ Entry recorded!\n")
 
     print("\n--- Plank Hold Test Results ---")
@@ -1,17 +1,82 @@
+import asyncio
+import selectors
 import time
 import random
+from array import array
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 
 
 class DrillResult:
-    def __init__(self, trial: int, value: int):
-        self.id = f"result-{trial}"
-        self.metric = "reaction_time"
-        self.value = value
-        self.unit = "ms"
-        self.timestamp = datetime.now()
+    """One trial. timestamp is a time.monotonic() reading taken when it was recorded."""
+
+    __slots__ = ("trial", "value", "timestamp")
+    metric = "reaction_time"
+    unit = "ms"
+
+    def __init__(self, trial: int, value: int, timestamp: Optional[float] = None):
         self.trial = trial
+        self.value = value
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+
+    @property
+    def id(self) -> str:
+        return f"result-{self.trial}"
+
+
+class TrialLog:
+    """
+    Column store for a drill's trials (trial number, value in ms, monotonic
+    timestamp), 24 bytes per trial on 64-bit Linux, with running aggregates
+    kept up to date on every append so summaries never rescan the trials.
+
+    Behaves as a sequence of DrillResult; indexing builds the record on demand.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.trials = array("l")
+        self.values = array("l")
+        self.timestamps = array("d")
+        self.hit_time_sum = 0   # sum of values for answered trials (< 2000 ms)
+        self.best = None
+        self.successes = 0      # trials under 1000 ms
+
+    def record(self, trial: int, value: int, timestamp: Optional[float] = None):
+        self.trials.append(trial)
+        self.values.append(value)
+        self.timestamps.append(time.monotonic() if timestamp is None else timestamp)
+        if value < 2000:
+            self.hit_time_sum += value
+        if value < 1000:
+            self.successes += 1
+        if self.best is None or value < self.best:
+            self.best = value
+
+    def append(self, result: DrillResult):
+        self.record(result.trial, result.value, result.timestamp)
+
+    def copy(self) -> "TrialLog":
+        log = TrialLog()
+        log.trials = array("l", self.trials)
+        log.values = array("l", self.values)
+        log.timestamps = array("d", self.timestamps)
+        log.hit_time_sum = self.hit_time_sum
+        log.best = self.best
+        log.successes = self.successes
+        return log
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> DrillResult:
+        return DrillResult(self.trials[index], self.values[index], self.timestamps[index])
+
+    def __iter__(self):
+        for trial, value, timestamp in zip(self.trials, self.values, self.timestamps):
+            yield DrillResult(trial, value, timestamp)
 
 
 class DrillSession:
@@ -21,7 +86,7 @@ class DrillSession:
         self.athlete_id = athlete_id
         self.start_time = datetime.now()
         self.end_time = None
-        self.results: List[DrillResult] = []
+        self.results = TrialLog()
         self.status = "in_progress"
 
     def complete(self):
@@ -43,8 +108,8 @@ class DrillExecution:
         }
         self.phase = "setup"
         self.current_trial = 0
-        self.results: List[DrillResult] = []
-        self.session: DrillSession | None = None
+        self.results = TrialLog()
+        self.session: Optional[DrillSession] = None
         self.accuracy = 0
 
     def start(self, athlete_id="athlete-1"):
@@ -72,13 +137,36 @@ class DrillExecution:
         response = self.get_response(trial_start)
         if response is None:
             print("⏱️ Missed response (2000ms)")
-            result = DrillResult(self.current_trial, 2000)
+            self.record_trial(None)
         else:
             rt = int((response - trial_start) * 1000)
             print(f"Reaction Time: {rt}ms")
-            result = DrillResult(self.current_trial, rt)
+            self.record_trial(rt)
+
+    def record_trial(self, rt: Optional[int]):
+        """Score one trial; rt is the reaction time in ms, or None for a miss."""
+        if rt is None:
+            self.results.record(self.current_trial, 2000)
+        else:
+            self.results.record(self.current_trial, rt)
             self.accuracy += 10 if rt < 500 else 5
-        self.results.append(result)
+
+    def replay(self, responses: List[Optional[int]], athlete_id="athlete-1"):
+        """
+        Run the drill from reaction times captured elsewhere (e.g. by the
+        frontend) instead of prompting: no stimulus delay, no rest, no input().
+        """
+        self.phase = "running"
+        self.session = DrillSession(self.drill_id, athlete_id)
+        self.current_trial = 0
+        self.results.clear()
+        self.accuracy = 0
+        for rt in responses[:self.config["trials"]]:
+            self.current_trial += 1
+            self.record_trial(None if rt is None else int(rt))
+        self.session.results = self.results.copy()
+        self.phase = "completed"
+        self.session.complete()
 
     def get_response(self, trial_start: float):
         start_wait = time.time()
@@ -88,24 +176,180 @@ class DrillExecution:
         return None
 
     def summary(self) -> Dict[str, Any]:
-        avg_rt = (
-            sum(r.value for r in self.results if r.value < 2000) / len(self.results)
-            if self.results else 0
-        )
-        best_time = min((r.value for r in self.results), default=2000)
-        success_rate = (
-            sum(1 for r in self.results if r.value < 1000) / len(self.results) * 100
-            if self.results else 0
-        )
+        results = self.results
+        count = len(results)
+        avg_rt = results.hit_time_sum / count if count else 0
+        best_time = results.best if count else 2000
+        success_rate = results.successes / count * 100 if count else 0
         return {
             "avg_reaction_time": avg_rt,
             "best_time": best_time,
             "success_rate": success_rate,
-            "trials_completed": len(self.results),
+            "trials_completed": count,
             "score": self.accuracy
         }
 
 
+# ---------------------------------------------------------------------------
+# Asyncio drill runtime: one coroutine per session, many sessions per process
+# ---------------------------------------------------------------------------
+
+class DrillSessionRunner:
+    """
+    Runs one DrillExecution as a coroutine.
+
+    Stimulus delays and rests are asyncio sleeps, and a response is whatever
+    calls tap() while the response window is open, so the process can serve
+    other sessions while this one waits. Events ("waiting", "stimulus",
+    "trial") are reported through on_event(runner, event_dict).
+    """
+
+    response_window = 2.0  # seconds before a trial counts as missed
+
+    def __init__(self, drill: DrillExecution, athlete_id: str,
+                 on_event: Optional[Callable[["DrillSessionRunner", Dict[str, Any]], None]] = None,
+                 rng: Optional[random.Random] = None):
+        self.drill = drill
+        self.athlete_id = athlete_id
+        self.on_event = on_event
+        self.rng = rng or random.Random()
+        self._response: Optional[asyncio.Future] = None
+
+    def tap(self) -> bool:
+        """Register a response; returns False if no stimulus is showing (e.g. a false start)."""
+        if self._response is None or self._response.done():
+            return False
+        self._response.set_result(asyncio.get_running_loop().time())
+        return True
+
+    def _emit(self, event: str, **data):
+        if self.on_event:
+            self.on_event(self, {"event": event, "trial": self.drill.current_trial, **data})
+
+    async def run(self) -> Dict[str, Any]:
+        drill = self.drill
+        loop = asyncio.get_running_loop()
+        drill.phase = "running"
+        drill.session = DrillSession(drill.drill_id, self.athlete_id)
+        drill.current_trial = 0
+        drill.results.clear()
+        drill.accuracy = 0
+        start_time = loop.time()
+        while loop.time() - start_time < drill.config["duration"] and drill.current_trial < drill.config["trials"]:
+            await self.run_trial()
+            await asyncio.sleep(drill.config["rest_between_trials"])
+        drill.phase = "completed"
+        drill.session.results = drill.results.copy()
+        drill.session.complete()
+        return drill.summary()
+
+    async def run_trial(self):
+        drill = self.drill
+        loop = asyncio.get_running_loop()
+        drill.current_trial += 1
+        self._emit("waiting")
+        await asyncio.sleep(self.rng.uniform(2, 5))
+
+        self._response = loop.create_future()
+        shown_at = loop.time()
+        self._emit("stimulus")
+        try:
+            tapped_at = await asyncio.wait_for(self._response, self.response_window)
+            rt = int((tapped_at - shown_at) * 1000)
+        except asyncio.TimeoutError:
+            rt = None
+        finally:
+            self._response = None
+
+        drill.record_trial(rt)
+        self._emit("trial", value=drill.results[-1].value)
+
+
+class DrillRuntime:
+    """Hosts many concurrent drill sessions in one event loop, keyed by session key."""
+
+    def __init__(self):
+        self.runners: Dict[str, DrillSessionRunner] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self, key: str, drill: DrillExecution, athlete_id: str, **runner_kwargs) -> DrillSessionRunner:
+        if key in self.tasks and not self.tasks[key].done():
+            raise ValueError(f"Session '{key}' is already running.")
+        runner = DrillSessionRunner(drill, athlete_id, **runner_kwargs)
+        self.runners[key] = runner
+        self.tasks[key] = asyncio.get_running_loop().create_task(runner.run())
+        return runner
+
+    def tap(self, key: str) -> bool:
+        runner = self.runners.get(key)
+        return runner.tap() if runner else False
+
+    async def wait(self) -> Dict[str, Dict[str, Any]]:
+        """Wait for every started session and return their summaries by key."""
+        keys = list(self.tasks)
+        summaries = await asyncio.gather(*(self.tasks[k] for k in keys))
+        return dict(zip(keys, summaries))
+
+
+class SimulatedAthlete:
+    """
+    on_event callback that taps after a random reaction time, for simulations
+    and tests. Reaction times are normal(mean_ms, sd_ms); miss_rate of the
+    stimuli get no response.
+    """
+
+    def __init__(self, mean_ms=350, sd_ms=60, miss_rate=0.0, rng: Optional[random.Random] = None):
+        self.mean_ms = mean_ms
+        self.sd_ms = sd_ms
+        self.miss_rate = miss_rate
+        self.rng = rng or random.Random()
+
+    def __call__(self, runner: DrillSessionRunner, event: Dict[str, Any]):
+        if event["event"] != "stimulus" or self.rng.random() < self.miss_rate:
+            return
+        delay = max(0.05, self.rng.gauss(self.mean_ms, self.sd_ms) / 1000)
+        asyncio.get_running_loop().call_later(delay, runner.tap)
+
+
+class _SkipAheadSelector(selectors.DefaultSelector):
+    """Selector that, instead of blocking until the next timer, moves the loop's virtual clock there."""
+
+    def __init__(self, loop: "VirtualClockEventLoop"):
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if timeout is not None and timeout > 0:
+            self._loop._virtual_now += timeout
+            timeout = 0
+        return super().select(timeout)
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop on a virtual clock: whenever every task is waiting on a timer,
+    time jumps straight to the next one. asyncio.sleep, wait_for and
+    call_later all follow the virtual clock, so drill sessions run unchanged
+    but complete in milliseconds of wall time.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._virtual_now = start
+        super().__init__(_SkipAheadSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_now
+
+
+def run_simulated(coro):
+    """Run a coroutine to completion on a fresh VirtualClockEventLoop."""
+    loop = VirtualClockEventLoop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
 if __name__ == "__main__":
     drill = DrillExecution(drill_id="d1", name="Reaction Training", estimated_duration=30)
     drill.start(athlete_id="player1")
@@ -19,6 +19,22 @@ def calculate_jump_height(flight_time_ms):
     return round(jump_height_m * 100, 2)  # in cm
 
 
+def flight_test_outcomes(flight_time_ms):
+    """
+    Calculate Flight Time Jump Test results.
+
+    Parameters:
+        flight_time_ms (float): Flight time in milliseconds
+
+    Returns:
+        dict: Flight time and jump height
+    """
+    return {
+        "Flight Time (ms)": round(flight_time_ms, 2),
+        "Jump Height (cm)": calculate_jump_height(flight_time_ms),
+    }
+
+
 def main():
     print("=== Flight Time Jump Test ===")
     flight_time_ms = float(input("Enter Flight Time (ms): "))
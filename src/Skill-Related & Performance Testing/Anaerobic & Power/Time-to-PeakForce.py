@@ -15,12 +15,13 @@ def time_to_peak_force(force_values, sampling_rate):
     # Baseline (first 100 ms or so); here take average of first 50 samples
     baseline = sum(force_values[:50]) / min(50, len(force_values))
 
-    # Force onset = first point exceeding baseline + 5% of peak (common method)
     peak_force = max(force_values)
-    threshold = baseline + 0.05 * (peak_force - baseline)
-    
-    onset_index = next((i for i, f in enumerate(force_values) if f >= threshold), 0)
     peak_index = force_values.index(peak_force)
+
+    # Force onset = first point exceeding baseline + 5% of peak (common method).
+    # The peak itself clears the threshold, so the scan can stop there.
+    threshold = baseline + 0.05 * (peak_force - baseline)
+    onset_index = next((i for i in range(peak_index + 1) if force_values[i] >= threshold), 0)
     
     # Time difference in ms
     time_to_peak = (peak_index - onset_index) / sampling_rate * 1000
@@ -33,6 +34,109 @@ def time_to_peak_force(force_values, sampling_rate):
     }
 
 
+def analyze_force_trials(trials, sampling_rate, calibration=1.0):
+    """
+    Vectorised TTPF for many equal-length trials at once.
+
+    Same method as time_to_peak_force, applied along each row. The work is
+    done in the raw sample units (e.g. int16 ADC counts) and only the
+    per-trial results are scaled by the calibration factor, so the traces
+    are never converted to floats.
+
+    Parameters:
+        trials (array-like): 2-D array, one trial per row (raw units)
+        sampling_rate (float): Sampling rate in Hz
+        calibration (float): Newtons per raw unit (must be positive)
+
+    Returns:
+        dict of NumPy columns, one element per trial, with the same keys as
+        time_to_peak_force
+    """
+    import numpy as np
+
+    trials = np.asarray(trials)
+    if trials.ndim != 2 or trials.shape[1] == 0 or sampling_rate <= 0:
+        raise ValueError("Invalid input: provide a 2-D trial array and positive sampling rate.")
+    if calibration <= 0:
+        raise ValueError("Calibration factor must be positive.")
+
+    baseline = trials[:, :50].mean(axis=1, dtype=np.float64)
+    peak_index = trials.argmax(axis=1)
+    peak_raw = np.take_along_axis(trials, peak_index[:, None], axis=1)[:, 0].astype(np.float64)
+
+    threshold = baseline + 0.05 * (peak_raw - baseline)
+    onset_index = (trials >= threshold[:, None]).argmax(axis=1)
+
+    time_to_peak = (peak_index - onset_index) / sampling_rate * 1000
+
+    return {
+        "Peak Force (N)": np.round(peak_raw * calibration, 2),
+        "Onset Index": onset_index,
+        "Peak Index": peak_index,
+        "Time-to-Peak Force (ms)": np.round(time_to_peak, 2),
+    }
+
+
+def time_to_peak_force_file(path, sampling_rate, samples_per_trial, dtype="float32",
+                            calibration=1.0, offset=0, max_block_bytes=64 * 1024 * 1024):
+    """
+    TTPF for every trial in a raw binary force-plate file.
+
+    The file holds back-to-back trials of samples_per_trial little-endian
+    samples each (float32 or int16, optionally after an offset-byte header).
+    It is read through numpy.memmap in blocks of whole trials, so memory stays
+    bounded by max_block_bytes (or one trial, if a trial is larger than that)
+    regardless of session length.
+
+    Parameters:
+        path (str): Path to the binary file
+        sampling_rate (float): Sampling rate in Hz
+        samples_per_trial (int): Number of samples in each trial
+        dtype (str): Sample type, "float32" or "int16"
+        calibration (float): Newtons per raw unit
+        offset (int): Bytes to skip at the start of the file
+        max_block_bytes (int): Upper bound on raw bytes analysed at once
+
+    Returns:
+        dict of NumPy columns, one element per trial
+    """
+    import numpy as np
+
+    dtype = np.dtype(dtype).newbyteorder("<")
+    if dtype.kind not in "fi":
+        raise ValueError("dtype must be a float or signed integer sample type.")
+    if samples_per_trial <= 0:
+        raise ValueError("samples_per_trial must be positive.")
+
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset)
+    n_trials = data.size // samples_per_trial
+    if n_trials == 0:
+        raise ValueError("File holds less than one trial.")
+    trials = data[:n_trials * samples_per_trial].reshape(n_trials, samples_per_trial)
+
+    # The boolean onset mask costs one byte per sample on top of the raw block
+    rows_per_block = max(1, max_block_bytes // (samples_per_trial * (dtype.itemsize + 1)))
+    blocks = [
+        analyze_force_trials(trials[start:start + rows_per_block], sampling_rate, calibration)
+        for start in range(0, n_trials, rows_per_block)
+    ]
+    return {key: np.concatenate([b[key] for b in blocks]) for key in blocks[0]}
+
+
+def trial_records(columns):
+    """
+    Split the columns from analyze_force_trials or time_to_peak_force_file
+    into one time_to_peak_force-style dict per trial.
+
+    Returns:
+        list of dict with plain Python numbers
+    """
+    return [
+        {key: col[i].item() for key, col in columns.items()}
+        for i in range(len(columns["Peak Force (N)"]))
+    ]
+
+
 def main():
     print("=== Time-to-Peak Force (TTPF) Calculator ===")
     
@@ -1,5 +1,18 @@
 import math
 
+G = 9.81  # gravity constant m/s^2
+
+
+def jump_height(flight_time):
+    """Jump height (m) from flight time (s): h = g * t^2 / 8. Works on floats and NumPy arrays."""
+    return (G * (flight_time ** 2)) / 8
+
+
+def sayers_peak_power(jump_height_m, body_mass):
+    """Peak power (W) by the Sayers regression (jump height in cm). Works on floats and NumPy arrays."""
+    return (60.7 * (jump_height_m * 100)) + (45.3 * body_mass) - 2055
+
+
 def cmj_outcomes(flight_time, body_mass, contact_time=None):
     """
     Calculate CMJ (Countermovement Jump) outcomes.
@@ -15,31 +28,154 @@ def cmj_outcomes(flight_time, body_mass, contact_time=None):
     if flight_time <= 0 or body_mass <= 0:
         raise ValueError("Flight time and body mass must be positive values.")
 
-    g = 9.81  # gravity constant m/s^2
-
     # Jump height from flight time
-    jump_height = (g * (flight_time ** 2)) / 8  # meters
+    height = jump_height(flight_time)  # meters
 
     # Peak power (Sayers regression, jump height in cm)
-    peak_power = (60.7 * (jump_height * 100)) + (45.3 * body_mass) - 2055
+    peak_power = sayers_peak_power(height, body_mass)
 
     # Relative peak power
     relative_power = peak_power / body_mass
 
     results = {
-        "Jump Height (m)": round(jump_height, 3),
-        "Jump Height (cm)": round(jump_height * 100, 1),
+        "Jump Height (m)": round(height, 3),
+        "Jump Height (cm)": round(height * 100, 1),
         "Peak Power (W)": round(peak_power, 2),
         "Relative Peak Power (W/kg)": round(relative_power, 2),
     }
 
     if contact_time and contact_time > 0:
-        rsi = jump_height / contact_time
+        rsi = height / contact_time
         results["Reactive Strength Index (RSI)"] = round(rsi, 3)
 
     return results
 
 
+def analyze_jump_force(force, sampling_rate, body_mass=None, flight_threshold=20.0,
+                       min_flight_ms=100, max_contact_ms=1000):
+    """
+    Find every jump in a raw vertical ground-reaction-force (vGRF) recording.
+
+    Samples below flight_threshold (N) count as airborne; each airborne run of
+    at least min_flight_ms is a jump, with takeoff at its first sample and
+    landing at the first sample back on the plate. Contact time is the ground
+    time since the previous landing, for rebound jumps that take off again
+    within max_contact_ms (otherwise NaN, e.g. a CMJ from standing). Jump
+    height, Sayers peak power and RSI then use the same formulas as
+    cmj_outcomes, applied to all jumps at once.
+
+    Parameters:
+        force (array-like): vGRF samples (N) for the whole session
+        sampling_rate (float): Sampling rate in Hz
+        body_mass (float, optional): kg; estimated from the first second of
+            quiet standing if omitted
+        flight_threshold (float): Force below which the athlete is airborne (N)
+        min_flight_ms (float): Shorter unloaded runs are ignored as noise
+        max_contact_ms (float): Longest ground contact counted for RSI
+
+    Returns:
+        dict of NumPy columns, one element per jump
+    """
+    import numpy as np
+
+    force = np.asarray(force, dtype=np.float64).ravel()
+    if force.size < 2 or sampling_rate <= 0:
+        raise ValueError("Invalid input: provide force samples and a positive sampling rate.")
+    if body_mass is None:
+        body_mass = np.median(force[:max(1, int(sampling_rate))]) / G
+    return _jumps(force < flight_threshold, sampling_rate, body_mass, min_flight_ms, max_contact_ms)
+
+
+def _jumps(airborne, sampling_rate, body_mass, min_flight_ms, max_contact_ms):
+    """analyze_jump_force from the per-sample airborne flags."""
+    import numpy as np
+
+    if body_mass <= 0:
+        raise ValueError("Body mass must be a positive value.")
+
+    # Edges of the airborne runs: +1 at takeoff, -1 at landing
+    edges = np.diff(airborne.astype(np.int8))
+    takeoff = np.flatnonzero(edges == 1) + 1
+    landing = np.flatnonzero(edges == -1) + 1
+
+    # Drop a run already in progress at the start or still open at the end
+    if landing.size and (not takeoff.size or landing[0] < takeoff[0]):
+        landing = landing[1:]
+    takeoff = takeoff[:landing.size]
+
+    flight_samples = landing - takeoff
+    jumps = flight_samples >= min_flight_ms * sampling_rate / 1000
+    takeoff, landing, flight_samples = takeoff[jumps], landing[jumps], flight_samples[jumps]
+
+    flight_time = flight_samples / sampling_rate
+    contact_time = np.full(takeoff.size, np.nan)
+    if takeoff.size > 1:
+        contact = (takeoff[1:] - landing[:-1]) / sampling_rate
+        contact_time[1:] = np.where(contact <= max_contact_ms / 1000, contact, np.nan)
+
+    height = jump_height(flight_time)
+    peak_power = sayers_peak_power(height, body_mass)
+    return {
+        "Takeoff Index": takeoff,
+        "Landing Index": landing,
+        "Flight Time (s)": np.round(flight_time, 4),
+        "Contact Time (s)": np.round(contact_time, 4),
+        "Jump Height (m)": np.round(height, 3),
+        "Jump Height (cm)": np.round(height * 100, 1),
+        "Peak Power (W)": np.round(peak_power, 2),
+        "Relative Peak Power (W/kg)": np.round(peak_power / body_mass, 2),
+        "Reactive Strength Index (RSI)": np.round(height / contact_time, 3),
+    }
+
+
+def jump_force_outcomes(force, sampling_rate, body_mass=None):
+    """
+    Jump results from one raw vGRF recording.
+
+    Returns:
+        dict: Per-jump metrics (NaN as None), jump count and best jump height
+    """
+    import numpy as np
+
+    columns = analyze_jump_force(force, sampling_rate, body_mass)
+    jumps = [
+        {key: (None if np.isnan(col[i]) else col[i].item()) for key, col in columns.items()}
+        for i in range(len(columns["Takeoff Index"]))
+    ]
+    return {
+        "Jumps": jumps,
+        "Jump Count": len(jumps),
+        "Best Jump Height (cm)": max((j["Jump Height (cm)"] for j in jumps), default=None),
+    }
+
+
+def analyze_jump_file(path, sampling_rate, dtype="float32", calibration=1.0, offset=0, body_mass=None,
+                      flight_threshold=20.0, min_flight_ms=100, max_contact_ms=1000, block_samples=1 << 20):
+    """
+    analyze_jump_force for a raw binary force-plate file of little-endian
+    samples (float32 or int16 after an optional offset-byte header), read
+    through numpy.memmap. calibration is Newtons per raw unit.
+
+    The file is calibrated and thresholded block_samples at a time, so only
+    one airborne flag per sample (1 byte) is held for the whole recording.
+    """
+    import numpy as np
+
+    data = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r", offset=offset)
+    if data.size < 2 or sampling_rate <= 0:
+        raise ValueError("Invalid input: provide force samples and a positive sampling rate.")
+    if body_mass is None:
+        body_mass = np.median(np.asarray(data[:max(1, int(sampling_rate))], dtype=np.float64) * calibration) / G
+
+    airborne = np.empty(data.size, dtype=bool)
+    for start in range(0, data.size, block_samples):
+        block = np.asarray(data[start:start + block_samples], dtype=np.float64)
+        if calibration != 1.0:
+            block *= calibration
+        np.less(block, flight_threshold, out=airborne[start:start + block_samples])
+    return _jumps(airborne, sampling_rate, body_mass, min_flight_ms, max_contact_ms)
+
+
 def main():
     print("=== Vertical Jump (CMJ) Calculator ===")
     
@@ -1,14 +1,18 @@
 # Indoor Obstacle Course Test (IOCT) Calculator
+from typing import Optional
 
-def calculate_ioct(time_sec: float, penalties: int, cutoff_male: float = 155.0, cutoff_female: float = 170.0, gender: str = "male") -> dict:
+from forgeon import norms
+
+
+def calculate_ioct(time_sec: float, penalties: int, cutoff_male: Optional[float] = None, cutoff_female: Optional[float] = None, gender: str = "male") -> dict:
     """
     Calculate IOCT performance results.
 
     Args:
         time_sec (float): Raw completion time in seconds.
         penalties (int): Number of penalties (missed/failed obstacles).
-        cutoff_male (float): Male cutoff time (default: 155 sec).
-        cutoff_female (float): Female cutoff time (default: 170 sec).
+        cutoff_male (float): Male cutoff time (default: the norms table, 155 sec).
+        cutoff_female (float): Female cutoff time (default: the norms table, 170 sec).
         gender (str): 'male' or 'female'.
 
     Returns:
@@ -23,7 +27,12 @@ def calculate_ioct(time_sec: float, penalties: int, cutoff_male: float = 155.0,
     cutoff = cutoff_male if gender.lower() == "male" else cutoff_female
 
     # Determine pass/fail
-    status = "PASS" if adjusted_time <= cutoff else "FAIL"
+    if cutoff is None:
+        band = norms.norm_band("ioct", gender)
+        cutoff = band.cutoffs[0]
+        status = band.rate(adjusted_time)["Performance Rating"]
+    else:
+        status = "PASS" if adjusted_time <= cutoff else "FAIL"
 
     return {
         "Raw Time (s)": time_sec,
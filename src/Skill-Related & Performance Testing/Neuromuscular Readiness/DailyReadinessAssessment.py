@@ -1,30 +1,331 @@
+import bisect
 import csv
-from datetime import datetime
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND alone
+    fcntl = None
+
+# Questions
+QUESTIONS = {
+    "Sleep Quality": "How was your sleep quality? (1=very poor, 5=excellent): ",
+    "Fatigue": "How fatigued do you feel? (1=very tired, 5=fully energized): ",
+    "Muscle Soreness": "How sore are your muscles? (1=very sore, 5=no soreness): ",
+    "Stress Levels": "How stressed are you? (1=very high, 5=very low): ",
+    "Mood": "How is your mood? (1=very bad, 5=excellent): "
+}
+
+
+def readiness_outcomes(scores):
+    """
+    Score a Daily Readiness Assessment.
+
+    Parameters:
+        scores (dict): 1-5 rating for each item in QUESTIONS
+
+    Returns:
+        dict with the item scores, total, readiness % and status
+    """
+    missing = [k for k in QUESTIONS if k not in scores]
+    if missing:
+        raise ValueError(f"Missing readiness scores: {', '.join(missing)}")
+    if any(not 1 <= scores[k] <= 5 for k in QUESTIONS):
+        raise ValueError("Readiness scores must be between 1 and 5.")
+
+    total = sum(scores[k] for k in QUESTIONS)
+    max_score = len(QUESTIONS) * 5
+    readiness_percent = (total / max_score) * 100
+
+    if readiness_percent >= 80:
+        status = "High Readiness"
+    elif readiness_percent >= 60:
+        status = "Moderate Readiness"
+    else:
+        status = "Low Readiness"
+
+    return {
+        "Scores": {k: scores[k] for k in QUESTIONS},
+        "Total Score": total,
+        "Max Score": max_score,
+        "Readiness %": round(readiness_percent, 1),
+        "Status": status,
+    }
+
+
+STATUS_ICONS = {"High Readiness": "✅", "Moderate Readiness": "⚠️", "Low Readiness": "❌"}
+
+
+# ---------------------------------------------------------------------------
+# Readiness log: fixed-size binary records with a per-athlete index
+# ---------------------------------------------------------------------------
+
+STATUSES = list(STATUS_ICONS)
+
+# timestamp (epoch s), athlete id (utf-8, NUL padded), one byte per item score,
+# total, readiness %, status code
+RECORD = struct.Struct(f"<d32s{len(QUESTIONS)}BBfB")
+ATHLETE_ID_BYTES = 32
+
+# Index file header: magic, record size, the log's size and mtime (ns) when the
+# index was saved, records covered, athlete count. The last covered record
+# follows the header, so an index is only reused for the log it was built from.
+INDEX_MAGIC = b"RLIX"
+INDEX_HEADER = struct.Struct("<4sIqqqq")
+
+
+class ReadinessLog:
+    """
+    Append-only readiness log.
+
+    Each assessment is one fixed-size binary record, written with a single
+    O_APPEND write under an exclusive file lock, so several processes can log
+    to the same file at once. The log keeps an in-memory index of record
+    numbers and timestamps per athlete; it is saved next to the log
+    (``<path>.idx``) by save_index() and brought up to date by reading only
+    records appended since, so window queries read just that athlete's rows.
+    An index that does not match the log (different record layout, or a log
+    that was replaced or truncated since) is ignored and the log rescanned.
+    """
+
+    def __init__(self, path="daily_readiness_log.bin"):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._indexed = 0  # records covered by the index
+        self._records = {}  # athlete -> array of record numbers, in time order
+        self._times = {}  # athlete -> array of timestamps, parallel to _records
+        self._load_index()
+
+    def close(self):
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, athlete, results, when=None):
+        """
+        Log one assessment.
+
+        Parameters:
+            athlete (str): athlete id, at most 32 bytes of UTF-8
+            results (dict): output of readiness_outcomes()
+            when (datetime): assessment time (default: now)
+        """
+        self._write(self._pack(athlete, results, when or datetime.now()))
+
+    def import_csv(self, csv_path, athlete):
+        """
+        Copy the rows of an old daily_readiness_log.csv into the log.
+
+        The CSV has no athlete column, so every row is logged for `athlete`.
+        Rows are rescored from their item scores; rows already in the log
+        (same athlete and time) are skipped, so an import can be re-run.
+
+        Returns:
+            dict with the "Imported" count and the "Skipped" CSV line numbers
+        """
+        self.refresh()
+        known = set(self._times.get(athlete, ()))
+        records, skipped = [], []
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    when = datetime.strptime(row["Date"].strip(), "%Y-%m-%d %H:%M:%S")
+                    results = readiness_outcomes({k: int(row[k]) for k in QUESTIONS})
+                except (KeyError, TypeError, ValueError):
+                    skipped.append(line_no)
+                    continue
+                if when.timestamp() not in known:
+                    known.add(when.timestamp())
+                    records.append(self._pack(athlete, results, when))
+        if records:
+            self._write(b"".join(records))
+        return {"Imported": len(records), "Skipped": skipped}
+
+    def _pack(self, athlete, results, when):
+        key = athlete.encode("utf-8")
+        if not key or len(key) > ATHLETE_ID_BYTES or b"\0" in key:
+            raise ValueError(f"Athlete id must be 1-{ATHLETE_ID_BYTES} bytes of UTF-8.")
+        return RECORD.pack(
+            when.timestamp(), key,
+            *(results["Scores"][k] for k in QUESTIONS),
+            results["Total Score"], results["Readiness %"], STATUSES.index(results["Status"]),
+        )
+
+    def _write(self, records):
+        self._lock()
+        try:
+            os.write(self._fd, records)
+        finally:
+            self._unlock()
+        self.refresh()
+
+    def refresh(self):
+        """Index records appended (by any process) since the last refresh."""
+        complete = os.fstat(self._fd).st_size // RECORD.size  # ignore a write still in progress
+        if complete <= self._indexed:
+            return
+        data = os.pread(self._fd, (complete - self._indexed) * RECORD.size, self._indexed * RECORD.size)
+        for offset in range(0, len(data), RECORD.size):
+            timestamp, key = struct.unpack_from("<d32s", data, offset)
+            self._add(key.rstrip(b"\0").decode("utf-8"), self._indexed, timestamp)
+            self._indexed += 1
+
+    def _add(self, athlete, record_no, timestamp):
+        records = self._records.setdefault(athlete, array("q"))
+        times = self._times.setdefault(athlete, array("d"))
+        pos = len(times)
+        if pos and times[-1] > timestamp:  # back-dated entry
+            pos = bisect.bisect_right(times, timestamp)
+        records.insert(pos, record_no)
+        times.insert(pos, timestamp)
+
+    def athletes(self):
+        self.refresh()
+        return list(self._records)
+
+    def entries(self, athlete, start=None, end=None):
+        """
+        Return an athlete's assessments with start <= time < end, oldest first.
+
+        Each entry is a dict with "Date" plus the readiness_outcomes() keys.
+        """
+        self.refresh()
+        times = self._times.get(athlete)
+        if not times:
+            return []
+        lo = 0 if start is None else bisect.bisect_left(times, start.timestamp())
+        hi = len(times) if end is None else bisect.bisect_left(times, end.timestamp())
+        return [self._read(n) for n in self._records[athlete][lo:hi]]
+
+    def _read(self, record_no):
+        timestamp, _, *fields = RECORD.unpack(os.pread(self._fd, RECORD.size, record_no * RECORD.size))
+        *scores, total, readiness_percent, status = fields
+        return {
+            "Date": datetime.fromtimestamp(timestamp),
+            "Scores": dict(zip(QUESTIONS, scores)),
+            "Total Score": total,
+            "Max Score": len(QUESTIONS) * 5,
+            "Readiness %": round(readiness_percent, 1),
+            "Status": STATUSES[status],
+        }
+
+    def window(self, athlete, days, end=None):
+        """
+        Summarise the assessments in the `days` days up to `end` (default: now).
+
+        Returns:
+            dict with the entry count and mean/min readiness % (None if empty)
+        """
+        end = end or datetime.now()
+        entries = self.entries(athlete, end - timedelta(days=days), end)
+        values = [e["Readiness %"] for e in entries]
+        return {
+            "Days": days,
+            "Entries": len(values),
+            "Mean Readiness %": round(sum(values) / len(values), 1) if values else None,
+            "Min Readiness %": min(values) if values else None,
+        }
+
+    def acute_chronic(self, athlete, end=None, acute_days=7, chronic_days=28):
+        """
+        Compare the acute (7-day) and chronic (28-day) mean readiness.
+
+        Returns:
+            dict with both windows and their ratio (None without data)
+        """
+        end = end or datetime.now()
+        acute = self.window(athlete, acute_days, end)
+        chronic = self.window(athlete, chronic_days, end)
+        ratio = None
+        if acute["Mean Readiness %"] is not None and chronic["Mean Readiness %"]:
+            ratio = round(acute["Mean Readiness %"] / chronic["Mean Readiness %"], 2)
+        return {"Acute": acute, "Chronic": chronic, "Acute:Chronic Ratio": ratio}
+
+    def save_index(self):
+        """Write the per-athlete index next to the log (atomically replacing the old one)."""
+        self.refresh()
+        stat = os.fstat(self._fd)
+        tail = os.pread(self._fd, RECORD.size, (self._indexed - 1) * RECORD.size) if self._indexed else b""
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, RECORD.size, stat.st_size, stat.st_mtime_ns,
+                                      self._indexed, len(self._records)))
+            f.write(tail.ljust(RECORD.size, b"\0"))
+            for athlete, records in self._records.items():
+                key = athlete.encode("utf-8")
+                f.write(struct.pack("<Bq", len(key), len(records)) + key)
+                f.write(records.tobytes())
+                f.write(self._times[athlete].tobytes())
+        os.replace(tmp, self.index_path)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                self._parse_index(f.read())
+        except (OSError, ValueError, struct.error):  # no usable index: rescan the log
+            self._indexed, self._records, self._times = 0, {}, {}
+        self.refresh()
+
+    def _parse_index(self, data):
+        magic, record_size, log_size, log_mtime, indexed, count = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC or record_size != RECORD.size:
+            raise ValueError("Not a readiness log index.")
+        stat = os.fstat(self._fd)
+        offset = INDEX_HEADER.size
+        tail = data[offset:offset + RECORD.size]
+        offset += RECORD.size
+        if (indexed * RECORD.size > log_size
+                or stat.st_size < log_size
+                or (stat.st_size == log_size and stat.st_mtime_ns != log_mtime)
+                or (indexed and os.pread(self._fd, RECORD.size, (indexed - 1) * RECORD.size) != tail)):
+            raise ValueError("Index is for a different version of the log.")
+        records, times = {}, {}
+        for _ in range(count):
+            key_len, n = struct.unpack_from("<Bq", data, offset)
+            offset += 9
+            athlete = data[offset:offset + key_len].decode("utf-8")
+            offset += key_len
+            records[athlete] = array("q", data[offset:offset + n * 8])
+            offset += n * 8
+            times[athlete] = array("d", data[offset:offset + n * 8])
+            offset += n * 8
+            if len(records[athlete]) != n or len(times[athlete]) != n:
+                raise ValueError("Index is truncated.")
+        if sum(map(len, records.values())) != indexed:
+            raise ValueError("Index is truncated.")
+        self._records, self._times, self._indexed = records, times, indexed
+
+    def _lock(self):
+        if fcntl:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def _unlock(self):
+        if fcntl:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
 
 def daily_readiness():
     print("=== Daily Readiness Assessment ===")
     print("Rate each item from 1 (worst) to 5 (best)\n")
 
-    # Questions
-    questions = {
-        "Sleep Quality": "How was your sleep quality? (1=very poor, 5=excellent): ",
-        "Fatigue": "How fatigued do you feel? (1=very tired, 5=fully energized): ",
-        "Muscle Soreness": "How sore are your muscles? (1=very sore, 5=no soreness): ",
-        "Stress Levels": "How stressed are you? (1=very high, 5=very low): ",
-        "Mood": "How is your mood? (1=very bad, 5=excellent): "
-    }
-
     scores = {}
-    total = 0
 
     # Collect responses
-    for key, question in questions.items():
+    for key, question in QUESTIONS.items():
         while True:
             try:
                 score = int(input(question))
                 if 1 <= score <= 5:
                     scores[key] = score
-                    total += score
                     break
                 else:
                     print("⚠️ Please enter a number between 1 and 5.")
@@ -32,15 +333,11 @@ def daily_readiness():
                 print("⚠️ Invalid input. Please enter a number between 1 and 5.")
 
     # Calculations
-    max_score = len(questions) * 5
-    readiness_percent = (total / max_score) * 100
-
-    if readiness_percent >= 80:
-        status = "High Readiness ✅"
-    elif readiness_percent >= 60:
-        status = "Moderate Readiness ⚠️"
-    else:
-        status = "Low Readiness ❌"
+    results = readiness_outcomes(scores)
+    total = results["Total Score"]
+    max_score = results["Max Score"]
+    readiness_percent = results["Readiness %"]
+    status = f"{results['Status']} {STATUS_ICONS[results['Status']]}"
 
     # Display results
     print("\n=== Results ===")
@@ -49,23 +346,38 @@ def daily_readiness():
     print(f"\nTotal Score: {total}/{max_score}")
     print(f"Readiness: {readiness_percent:.1f}% → {status}")
 
-    # Optional: Save to CSV
-    save = input("\nSave results to CSV? (y/n): ").lower()
+    # Optional: Save to the readiness log
+    save = input("\nSave results to the readiness log? (y/n): ").lower()
     if save == "y":
-        filename = "daily_readiness_log.csv"
-        header = ["Date"] + list(scores.keys()) + ["Total Score", "Readiness %", "Status"]
-        row = [datetime.now().strftime("%Y-%m-%d %H:%M:%S")] + list(scores.values()) + [total, round(readiness_percent, 1), status]
-
+        athlete = input("Athlete ID: ").strip()
         try:
-            with open(filename, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                if file.tell() == 0:  # Write header if file is empty
-                    writer.writerow(header)
-                writer.writerow(row)
-            print(f"✅ Results saved to {filename}")
+            with ReadinessLog() as log:
+                log.append(athlete, results)
+                log.save_index()
+                trend = log.acute_chronic(athlete)
+            print(f"✅ Results saved to {log.path}")
+            if trend["Acute:Chronic Ratio"] is not None:
+                print(f"7-day mean: {trend['Acute']['Mean Readiness %']}% | "
+                      f"28-day mean: {trend['Chronic']['Mean Readiness %']}% | "
+                      f"Acute:Chronic {trend['Acute:Chronic Ratio']}")
         except Exception as e:
             print(f"⚠️ Could not save results: {e}")
 
 
+def import_csv_log(athlete, csv_path="daily_readiness_log.csv", log_path="daily_readiness_log.bin"):
+    """Move an old CSV readiness log into the binary log (see ReadinessLog.import_csv)."""
+    with ReadinessLog(log_path) as log:
+        outcome = log.import_csv(csv_path, athlete)
+        log.save_index()
+    print(f"✅ Imported {outcome['Imported']} assessments from {csv_path} into {log_path}")
+    if outcome["Skipped"]:
+        print(f"⚠️ Skipped unreadable CSV lines: {', '.join(map(str, outcome['Skipped']))}")
+    return outcome
+
+
 if __name__ == "__main__":
-    daily_readiness()
+    # python DailyReadinessAssessment.py import <athlete id> [daily_readiness_log.csv]
+    if len(sys.argv) >= 3 and sys.argv[1] == "import":
+        import_csv_log(*sys.argv[2:4])
+    else:
+        daily_readiness()
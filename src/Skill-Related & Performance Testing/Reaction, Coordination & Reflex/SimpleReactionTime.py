@@ -1,4 +1,6 @@
+import math
 import statistics
+from fractions import Fraction
 
 def analyze_reaction_times(trial_times):
     """
@@ -24,6 +26,174 @@ def analyze_reaction_times(trial_times):
         "Consistency (SD, ms)": round(consistency, 2)
     }
 
+def reaction_time_outcomes(light_trials, sound_trials):
+    """
+    Analyze light, sound and combined reaction time trials.
+
+    Parameters:
+        light_trials (list): Light reaction times in milliseconds
+        sound_trials (list): Sound reaction times in milliseconds
+
+    Returns:
+        dict: analyze_reaction_times result (or None) per stimulus and combined
+    """
+    return {
+        "Light": analyze_reaction_times(light_trials),
+        "Sound": analyze_reaction_times(sound_trials),
+        "Combined": analyze_reaction_times(list(light_trials) + list(sound_trials)),
+    }
+
+def _add_partial(partials, x):
+    """Add x to an exact running sum held as non-overlapping float partials (Shewchuk)."""
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+class ReactionTimeStats:
+    """
+    Running count, mean, variance (Welford) and best time for a stream of
+    reaction times, at O(1) cost per trial. Partial results from parallel
+    workers combine with merge().
+
+    The total is also kept exactly (as a few float partials) so the reported
+    mean is the correctly rounded one statistics.mean would give; the SD comes
+    from the Welford sum of squares and agrees with statistics.pstdev to
+    within float rounding.
+    """
+
+    __slots__ = ("count", "mean", "m2", "best", "total")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, best=None, total=None):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2  # sum of squared deviations from the mean
+        self.best = best
+        self.total = list(total) if total else []  # exact sum as float partials
+
+    def add(self, rt):
+        self.count += 1
+        delta = rt - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (rt - self.mean)
+        if self.best is None or rt < self.best:
+            self.best = rt
+        _add_partial(self.total, rt)
+
+    def extend(self, trials):
+        """Add a chunk of trials: summarise the chunk, then merge it in."""
+        trials = list(trials)
+        if not trials:
+            return
+        mean = math.fsum(trials) / len(trials)
+        chunk = ReactionTimeStats(len(trials), mean, math.fsum((t - mean) ** 2 for t in trials), min(trials))
+        for t in trials:
+            _add_partial(chunk.total, t)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Fold another accumulator's trials into this one (Chan et al. parallel update)."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2, self.best = other.count, other.mean, other.m2, other.best
+            self.total = list(other.total)
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.best = min(self.best, other.best)
+        for x in other.total:
+            _add_partial(self.total, x)
+
+    def copy(self):
+        return ReactionTimeStats(self.count, self.mean, self.m2, self.best, self.total)
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2, "best": self.best, "total": self.total}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["count"], state["mean"], state["m2"], state["best"], state.get("total"))
+
+    def summary(self):
+        """
+        Same figures as analyze_reaction_times (without the trial list).
+
+        Returns:
+            dict, or None if no trials have been added
+        """
+        if not self.count:
+            return None
+        avg_time = float(sum(map(Fraction, self.total), Fraction(0)) / self.count)
+        consistency = math.sqrt(max(self.m2, 0.0) / self.count) if self.count > 1 else 0.0
+        return {
+            "Trial Count": self.count,
+            "Average Reaction Time (ms)": round(avg_time, 2),
+            "Best Reaction Time (ms)": round(self.best, 2),
+            "Consistency (SD, ms)": round(consistency, 2)
+        }
+
+
+class ReactionTimeAccumulator:
+    """Streaming light/sound/combined breakdown, as in reaction_time_outcomes."""
+
+    def __init__(self):
+        self.light = ReactionTimeStats()
+        self.sound = ReactionTimeStats()
+
+    def add(self, stimulus, rt):
+        """Add one trial; stimulus is 'light' or 'sound'."""
+        self._stats(stimulus).add(rt)
+
+    def extend(self, stimulus, trials):
+        self._stats(stimulus).extend(trials)
+
+    def _stats(self, stimulus):
+        stimulus = stimulus.lower()
+        if stimulus == "light":
+            return self.light
+        if stimulus == "sound":
+            return self.sound
+        raise ValueError("Stimulus must be 'light' or 'sound'.")
+
+    @property
+    def combined(self):
+        combined = self.light.copy()
+        combined.merge(self.sound)
+        return combined
+
+    def merge(self, other):
+        self.light.merge(other.light)
+        self.sound.merge(other.sound)
+
+    def to_dict(self):
+        return {"light": self.light.to_dict(), "sound": self.sound.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        acc = cls()
+        acc.light = ReactionTimeStats.from_dict(state["light"])
+        acc.sound = ReactionTimeStats.from_dict(state["sound"])
+        return acc
+
+    def outcomes(self):
+        return {
+            "Light": self.light.summary(),
+            "Sound": self.sound.summary(),
+            "Combined": self.combined.summary(),
+        }
+
 def main():
     print("=== Simple Reaction Time Test (Light vs Sound) ===")
     
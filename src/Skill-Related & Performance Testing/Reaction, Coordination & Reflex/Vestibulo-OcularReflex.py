@@ -20,18 +20,151 @@ def calculate_vor_gain(eye_velocity_deg_s, head_velocity_deg_s):
 
     vor_gain = eye_velocity_deg_s / head_velocity_deg_s
     results["VOR Gain"] = round(vor_gain, 2)
+    results["Interpretation"] = [interpret_gain(vor_gain)]
+    return results
 
-    # Interpretation
-    interpretation = []
+
+def interpret_gain(vor_gain):
     if 0.8 <= vor_gain <= 1.0:
-        interpretation.append("Normal VOR gain (compensated eye movement).")
+        return "Normal VOR gain (compensated eye movement)."
     elif vor_gain < 0.8:
-        interpretation.append("Reduced VOR gain – possible vestibular hypofunction.")
+        return "Reduced VOR gain – possible vestibular hypofunction."
     elif vor_gain > 1.2:
-        interpretation.append("High VOR gain – may indicate central adaptation or calibration issues.")
+        return "High VOR gain – may indicate central adaptation or calibration issues."
     else:
-        interpretation.append("Borderline VOR values – monitor clinically.")
-    
+        return "Borderline VOR values – monitor clinically."
+
+
+def segment_impulses(head_velocity, rate_hz, onset_deg_s=20.0, min_peak_deg_s=100.0, max_impulse_s=0.3):
+    """
+    Find head impulses in a head velocity trace.
+
+    An impulse is a stretch with |head velocity| above `onset_deg_s` that
+    peaks at `min_peak_deg_s` or more and is over within `max_impulse_s`.
+
+    Returns:
+        (start, end (exclusive), peak index) sample indices, one per impulse
+    """
+    import numpy as np
+    from forgeon.signals import runs
+
+    speed = np.abs(head_velocity)
+    start, end = runs(speed > onset_deg_s)
+    if not len(start):
+        return start, end, start
+    peak = start + np.array([np.argmax(speed[a:b]) for a, b in zip(start, end)], dtype=np.intp)
+    keep = (speed[peak] >= min_peak_deg_s) & (end - start <= max_impulse_s * rate_hz)
+    return start[keep], end[keep], peak[keep]
+
+
+def analyze_head_impulses(head_velocity, eye_velocity, time=None, rate_hz=None, method="area",
+                          eye_sign=-1.0, right_positive=True, onset_deg_s=20.0, min_peak_deg_s=100.0,
+                          max_impulse_s=0.3, saccade_accel=5000.0, saccade_pad_s=0.01, follow_s=0.4,
+                          asymmetry_limit=10.0):
+    """
+    VOR gain from video head-impulse (vHIT) traces.
+
+    Impulses are found in the head velocity trace (segment_impulses). For all
+    impulses at once, the eye and head samples of each impulse are gathered
+    into one padded matrix. Samples where the eye's acceleration differs from
+    the head's by more than `saccade_accel` deg/s² (widened by
+    `saccade_pad_s`) are saccades; the eye trace is bridged across them with
+    a straight line before the gain is taken, and impulses that are mostly
+    saccade get no gain.
+    The gain is then:
+        "area"        desaccaded eye velocity area / head velocity area
+        "regression"  slope through the origin of eye on head velocity
+    A saccade inside the impulse is covert. One within `follow_s` of onset
+    but after the head has stopped is overt.
+
+    Parameters:
+        head_velocity, eye_velocity (array): deg/s, same samples
+        time (array, optional): Sample times (s); or give rate_hz
+        eye_sign (float): -1 when the compensatory eye movement is recorded
+            opposite to the head (the raw convention), 1 when already inverted
+        right_positive (bool): Positive head velocity is a rightward impulse,
+            which tests the right horizontal canal
+
+    Returns:
+        dict: Per-side gains, asymmetry, saccade rates and interpretation
+    """
+    import numpy as np
+
+    head = np.asarray(head_velocity, dtype=np.float64)
+    eye = np.asarray(eye_velocity, dtype=np.float64) * eye_sign
+    if head.shape != eye.shape:
+        raise ValueError("Head and eye velocity traces must have the same length.")
+    if method not in ("area", "regression"):
+        raise ValueError("method must be 'area' or 'regression'.")
+    if rate_hz is None:
+        if time is None or len(time) < 2:
+            raise ValueError("Provide sample times or a sampling rate.")
+        rate_hz = 1.0 / float(np.median(np.diff(np.asarray(time, dtype=np.float64))))
+
+    start, end, peak = segment_impulses(head, rate_hz, onset_deg_s, min_peak_deg_s, max_impulse_s)
+    if not len(start):
+        raise ValueError("No head impulses found in the recording.")
+
+    # Saccades: eye acceleration far from the head's, widened to cover their edges
+    pad = int(round(saccade_pad_s * rate_hz))
+    saccade = np.abs(np.gradient(eye - head) * rate_hz) > saccade_accel
+    if pad:
+        saccade = np.convolve(saccade, np.ones(2 * pad + 1), mode="same") > 0
+    # Desaccade: bridge each saccade with a straight line between the eye samples either side
+    samples = np.arange(len(eye))
+    if saccade.any() and not saccade.all():
+        eye = eye.copy()
+        eye[saccade] = np.interp(samples[saccade], samples[~saccade], eye[~saccade])
+
+    # One row per impulse, out to the follow-up window (clipped at the next impulse)
+    follow = np.minimum(start + int(round(follow_s * rate_hz)), np.append(start[1:], len(head)))
+    index = start[:, None] + np.arange(int((follow - start).max()))[None, :]
+    in_follow = index < follow[:, None]
+    index = np.minimum(index, len(head) - 1)
+    in_impulse = index < end[:, None]
+    sac = saccade[index] & in_follow
+    h, e = np.where(in_impulse, head[index], 0.0), np.where(in_impulse, eye[index], 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if method == "area":
+            gain = e.sum(axis=1) / h.sum(axis=1)
+        else:
+            gain = (e * h).sum(axis=1) / (h * h).sum(axis=1)
+    gain[(sac & in_impulse).sum(axis=1) > 0.5 * in_impulse.sum(axis=1)] = np.nan  # mostly saccade
+
+    onset = sac & ~np.pad(sac, ((0, 0), (1, 0)))[:, :-1]
+    covert = (onset & in_impulse).any(axis=1)
+    overt = (onset & ~in_impulse).any(axis=1)
+    right = (head[peak] > 0) == right_positive
+
+    results = {"Impulses": int(len(start)), "Gain Method": method}
+    interpretation = []
+    side_gain = {}
+    for side, mask in (("Left", ~right), ("Right", right)):
+        gains = gain[mask & np.isfinite(gain)]
+        side_gain[side] = float(np.median(gains)) if len(gains) else None
+        results[f"{side} Impulses"] = int(mask.sum())
+        results[f"{side} VOR Gain"] = None if side_gain[side] is None else round(side_gain[side], 2)
+        results[f"{side} Gain SD"] = round(float(np.std(gains, ddof=1)), 3) if len(gains) > 1 else None
+        results[f"{side} Peak Head Velocity (deg/s)"] = (
+            round(float(np.median(np.abs(head[peak[mask]]))), 1) if mask.any() else None)
+        results[f"{side} Covert Saccades (%)"] = round(float(covert[mask].mean() * 100), 1) if mask.any() else None
+        results[f"{side} Overt Saccades (%)"] = round(float(overt[mask].mean() * 100), 1) if mask.any() else None
+        if side_gain[side] is not None:
+            interpretation.append(f"{side}: {interpret_gain(side_gain[side])}")
+
+    finite = gain[np.isfinite(gain)]
+    results["VOR Gain"] = round(float(np.median(finite)), 2) if len(finite) else None
+    left, right_gain = side_gain["Left"], side_gain["Right"]
+    if left is not None and right_gain is not None and left + right_gain > 0:
+        asymmetry = abs(right_gain - left) / (right_gain + left) * 100
+        results["Gain Asymmetry (%)"] = round(asymmetry, 1)
+        if asymmetry > asymmetry_limit:
+            weaker = "left" if left < right_gain else "right"
+            interpretation.append(f"Gain asymmetry above {asymmetry_limit:g}% – weaker {weaker} side.")
+    else:
+        results["Gain Asymmetry (%)"] = None
+    results["Per-Impulse Gain"] = [None if np.isnan(g) else round(float(g), 3) for g in gain]
     results["Interpretation"] = interpretation
     return results
 
@@ -1,3 +1,6 @@
+from forgeon import norms
+
+
 def classify_performance(time_sec, gender="male"):
     """
     Classify Illinois Agility Test performance based on normative data.
@@ -10,28 +13,27 @@ def classify_performance(time_sec, gender="male"):
     Returns:
         str: Performance category
     """
-    if gender.lower() == "male":
-        if time_sec < 15.2:
-            return "Excellent"
-        elif time_sec < 16.1:
-            return "Good"
-        elif time_sec < 18.1:
-            return "Average"
-        elif time_sec < 19.3:
-            return "Below Average"
-        else:
-            return "Poor"
-    else:  # female
-        if time_sec < 17.0:
-            return "Excellent"
-        elif time_sec < 17.9:
-            return "Good"
-        elif time_sec < 21.0:
-            return "Average"
-        elif time_sec < 23.0:
-            return "Below Average"
-        else:
-            return "Poor"
+    return norms.rate("illinois-agility", time_sec, gender)["Performance Rating"]
+
+
+def illinois_outcomes(time_sec, gender="male"):
+    """
+    Calculate Illinois Agility Test results.
+
+    Parameters:
+        time_sec (float): Completion time in seconds
+        gender (str): 'male' or 'female'
+
+    Returns:
+        dict: Completion time, performance rating and percentile
+    """
+    if time_sec <= 0:
+        raise ValueError("Time must be greater than zero.")
+
+    return {
+        "Completion Time (s)": round(time_sec, 2),
+        **norms.rate("illinois-agility", time_sec, gender),
+    }
 
 
 def main():
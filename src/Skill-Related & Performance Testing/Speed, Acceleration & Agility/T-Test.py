@@ -1,3 +1,6 @@
+from forgeon import norms
+
+
 def calculate_t_test_performance(total_time):
     """
     Calculates performance metrics for the T-Test.
@@ -12,19 +15,10 @@ def calculate_t_test_performance(total_time):
     if total_time <= 0:
         raise ValueError("Time must be greater than zero.")
     
-    # Classification benchmarks (example, may vary by sport)
-    if total_time < 9.5:
-        rating = "Excellent"
-    elif total_time < 10.5:
-        rating = "Good"
-    elif total_time < 11.5:
-        rating = "Average"
-    else:
-        rating = "Below Average"
-    
+    # Classification benchmarks (example, may vary by sport): forgeon/norms.json
     return {
         "Total Time (s)": round(total_time, 2),
-        "Performance Rating": rating
+        **norms.rate("t-test", total_time),
     }
 
 
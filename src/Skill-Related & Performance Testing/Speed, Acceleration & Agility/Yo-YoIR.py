@@ -1,3 +1,6 @@
+from forgeon import shuttles
+
+
 def calculate_yoyo_ir(distance_m, final_speed_kmh):
     """
     Calculate Yo-Yo Intermittent Recovery Test outcomes.
@@ -22,6 +25,29 @@ def calculate_yoyo_ir(distance_m, final_speed_kmh):
     }
 
 
+def yoyo_ir_level_outcomes(level, bout, version=1):
+    """
+    Yo-Yo IR outcomes from the level reached, e.g. level 17, bout 2 ("17.2").
+
+    Parameters:
+        level (int): Speed level of the last completed bout
+        bout (int): Bouts completed at that level
+        version (int): 1 for IR1, 2 for IR2
+
+    Returns:
+        dict: calculate_yoyo_ir outcomes plus the level reached, with VO2max
+        from the version's own equation
+    """
+    if version not in (1, 2):
+        raise ValueError("Yo-Yo IR version must be 1 or 2.")
+    table = shuttles.stage_table(f"yoyo-ir{version}")
+    row = table.row(level, bout)
+    distance, speed = table.distances[row], table.speeds[row]
+    results = calculate_yoyo_ir(int(distance), speed)
+    results["Estimated VO2max (ml/kg/min)"] = round(table.estimate_vo2max(speed, distance), 2)
+    return {"Level": f"{level}.{bout}", **results}
+
+
 def main():
     print("=== Yo-Yo Intermittent Recovery Test ===")
     distance = int(input("Enter total distance covered (m): "))
@@ -1,24 +1,9 @@
 const { Drill, Session, MentalNeuralAnalytics } = require('../models/mentalNeuralTraining.model');
-const { exec } = require('child_process');
-const path = require('path');
-const fs = require('fs').promises;
+const { getPythonWorker } = require('../utils/pythonRunner');
 
-// Utility function to execute Python script
-const executePythonScript = async (scriptPath, args = []) => {
-  return new Promise((resolve, reject) => {
-    const command = `python "${scriptPath}" ${args.join(' ')}`;
-    exec(command, (error, stdout, stderr) => {
-      if (error) {
-        console.error('Python script error:', error);
-        reject(error);
-        return;
-      }
-      if (stderr) {
-        console.warn('Python script stderr:', stderr);
-      }
-      resolve(stdout);
-    });
-  });
+// Utility function to run a test calculation in the shared Python worker
+const executePythonTest = async (testId, inputs, meta = {}) => {
+  return getPythonWorker().run(testId, inputs, meta);
 };
 
 // DRILLS
@@ -181,15 +166,14 @@ exports.completeSession = async (req, res, next) => {
 // PYTHON SCRIPT INTEGRATION
 exports.executeDrill = async (req, res, next) => {
   try {
-    const { drillId, athleteId, duration = 30 } = req.body;
+    // responses: reaction times (ms) captured by the client, null for a missed trial
+    const { drillId, athleteId, duration = 30, responses = [] } = req.body;
     
     const drill = await Drill.findById(drillId);
     if (!drill) {
       return res.status(404).json({ message: 'Drill not found' });
     }
     
-    const scriptPath = path.join(__dirname, '../MentalNeuralTraining/script.py');
-    
     // Create a temporary session for execution
     const session = await Session.create({
       athleteId,
@@ -199,13 +183,13 @@ exports.executeDrill = async (req, res, next) => {
     });
     
     try {
-      // Execute Python script with parameters
-      const output = await executePythonScript(scriptPath, [
-        '--drill-id', drillId,
-        '--athlete-id', athleteId,
-        '--duration', duration.toString(),
-        '--session-id', session._id.toString()
-      ]);
+      // Score the recorded trials with the drill engine in MentalNeuralTraining/script.py
+      const output = await executePythonTest('mental-drill', {
+        drill_id: drillId,
+        name: drill.name,
+        duration,
+        responses
+      }, { athleteId, sessionId: session._id.toString() });
       
       // Parse Python output and update session
       const results = parsePythonOutput(output);
@@ -287,33 +271,16 @@ exports.getPerformanceTrends = async (req, res, next) => {
 
 // UTILITY FUNCTIONS
 const parsePythonOutput = (output) => {
-  try {
-    // Parse the Python script output to extract results
-    const lines = output.split('\n');
-    const results = [];
-    
-    for (const line of lines) {
-      if (line.includes('Reaction Time:')) {
-        const match = line.match(/Reaction Time: (\d+)ms/);
-        if (match) {
-          results.push({
-            trial: results.length + 1,
-            reactionTime: parseInt(match[1]),
-            accuracy: true,
-            timestamp: new Date(),
-            stimulusType: 'visual',
-            responseType: 'correct',
-            difficulty: 'medium'
-          });
-        }
-      }
-    }
-    
-    return results;
-  } catch (error) {
-    console.error('Error parsing Python output:', error);
-    return [];
-  }
+  // Map the drill engine's trial records onto session results
+  return (output.trials || []).map((t) => ({
+    trial: t.trial,
+    reactionTime: t.value,
+    accuracy: t.value < 2000,
+    timestamp: new Date(),
+    stimulusType: 'visual',
+    responseType: t.value < 2000 ? 'correct' : 'missed',
+    difficulty: 'medium'
+  }));
 };
 
 const generateSessionAnalytics = async (athleteId, sessionId) => {
@@ -20,63 +20,28 @@ const {
   SkillPerformanceAnalytics
 } = require('../models/skillPerformanceTesting.model');
 
-const { exec } = require('child_process');
-const path = require('path');
+const { getPythonWorker } = require('../utils/pythonRunner');
 
 // ============================================================================
 // UTILITY FUNCTIONS
 // ============================================================================
 
-const executePythonScript = async (scriptPath, args = []) => {
-  return new Promise((resolve, reject) => {
-    const command = `python "${scriptPath}" ${args.join(' ')}`;
-    exec(command, (error, stdout, stderr) => {
-      if (error) {
-        console.error('Python script error:', error);
-        reject(error);
-        return;
-      }
-      if (stderr) {
-        console.warn('Python script stderr:', stderr);
-      }
-      resolve(stdout);
-    });
-  });
+// Runs a test calculation non-interactively in the shared Python worker and
+// resolves with its structured output (see src/forgeon/calculators.py for the
+// testIds and input ids)
+const executePythonTest = async (testId, inputs, meta = {}) => {
+  return getPythonWorker().run(testId, inputs, meta);
 };
 
-const calculatePerformanceRating = (value, thresholds, isLowerBetter = true) => {
-  if (isLowerBetter) {
-    if (value <= thresholds.excellent) return 'excellent';
-    if (value <= thresholds.good) return 'good';
-    if (value <= thresholds.average) return 'average';
-    if (value <= thresholds.below_average) return 'below_average';
-    return 'poor';
-  } else {
-    if (value >= thresholds.excellent) return 'excellent';
-    if (value >= thresholds.good) return 'good';
-    if (value >= thresholds.average) return 'average';
-    if (value >= thresholds.below_average) return 'below_average';
-    return 'poor';
-  }
-};
+const toRating = (label) => label.toLowerCase().replace(/ /g, '_');
 
-const calculatePercentile = (value, normativeData, isLowerBetter = true) => {
-  // Simple percentile calculation based on normative data
-  // In a real system, this would use more sophisticated statistical methods
-  if (isLowerBetter) {
-    if (value <= normativeData.excellent) return 90;
-    if (value <= normativeData.good) return 75;
-    if (value <= normativeData.average) return 50;
-    if (value <= normativeData.below_average) return 25;
-    return 10;
-  } else {
-    if (value >= normativeData.excellent) return 90;
-    if (value >= normativeData.good) return 75;
-    if (value >= normativeData.average) return 50;
-    if (value >= normativeData.below_average) return 25;
-    return 10;
-  }
-};
+// Ratings and percentiles come from the shared normative tables
+// (src/forgeon/norms.json) via the calculator output, so thresholds live in one place
+const calculatePerformanceRating = (output) => ({
+  rating: toRating(output['Performance Rating']),
+  percentile: output['Percentile'] ?? 50,
+  trend: 'stable'
+});
 
 // ============================================================================
 // NEUROMUSCULAR READINESS CONTROLLERS
@@ -112,22 +77,27 @@ exports.getDailyReadiness = async (req, res, next) => {
 
 exports.executeDailyReadiness = async (req, res, next) => {
   try {
-    const { athleteId } = req.body;
-    
-    const scriptPath = path.join(__dirname, '../Skill-Related & Performance Testing/Neuromuscular Readiness/DailyReadinessAssessment.py');
+    const { athleteId, scores = {} } = req.body;
     
     try {
-      const output = await executePythonScript(scriptPath, ['--athlete-id', athleteId]);
+      const output = await executePythonTest('daily-readiness', {
+        sleep_quality: scores.sleepQuality,
+        fatigue: scores.fatigue,
+        muscle_soreness: scores.muscleSoreness,
+        stress_levels: scores.stressLevels,
+        mood: scores.mood,
+        log_path: process.env.READINESS_LOG_PATH
+      }, { athleteId });
       
-      // Parse Python output and create readiness assessment
+      const pyScores = output['Scores'];
       const readiness = await DailyReadiness.create({
         athleteId,
         scores: {
-          sleepQuality: 4, // Default values - in real system, parse from Python output
-          fatigue: 3,
-          muscleSoreness: 4,
-          stressLevels: 3,
-          mood: 4
+          sleepQuality: pyScores['Sleep Quality'],
+          fatigue: pyScores['Fatigue'],
+          muscleSoreness: pyScores['Muscle Soreness'],
+          stressLevels: pyScores['Stress Levels'],
+          mood: pyScores['Mood']
         }
       });
       
@@ -138,7 +108,7 @@ exports.executeDailyReadiness = async (req, res, next) => {
       });
       
     } catch (pythonError) {
-      res.status(500).json({
+      res.status(pythonError.status || 500).json({
         message: 'Python script execution failed',
         error: pythonError.message
       });
@@ -166,26 +136,19 @@ exports.executeCustomObstacleCircuit = async (req, res, next) => {
   try {
     const { athleteId, obstacles, cutoffTime } = req.body;
     
-    const scriptPath = path.join(__dirname, '../Skill-Related & Performance Testing/Functional Fitness Simulation/CustomObstacleCircuit.py');
-    
     try {
-      // Execute Python script with obstacle data
-      const obstacleArgs = obstacles.map(obs => 
-        `--obstacle ${obs.name} ${obs.time} ${obs.penalties}`
-      ).join(' ');
-      
-      const args = ['--athlete-id', athleteId, ...obstacleArgs];
-      if (cutoffTime) args.push('--cutoff', cutoffTime.toString());
-      
-      const output = await executePythonScript(scriptPath, args);
+      const output = await executePythonTest('custom-obstacle-circuit', {
+        obstacles,
+        cutoff_time: cutoffTime
+      }, { athleteId });
       
       // Create obstacle circuit record
       const circuit = await CustomObstacleCircuit.create({
         athleteId,
         testName: 'Custom Obstacle Circuit',
-        obstacles: obstacles.map(obs => ({
+        obstacles: obstacles.map((obs, i) => ({
           ...obs,
-          adjustedTime: obs.time + (obs.penalties * (obs.penaltyTime || 5))
+          adjustedTime: output['Details'][i]['Adjusted Time (s)']
         })),
         cutoffTime
       });
@@ -197,7 +160,7 @@ exports.executeCustomObstacleCircuit = async (req, res, next) => {
       });
       
     } catch (pythonError) {
-      res.status(500).json({
+      res.status(pythonError.status || 500).json({
         message: 'Python script execution failed',
         error: pythonError.message
       });
@@ -234,25 +197,23 @@ exports.executeSimpleReactionTime = async (req, res, next) => {
   try {
     const { athleteId, lightTrials, soundTrials } = req.body;
     
-    const scriptPath = path.join(__dirname, '../Skill-Related & Performance Testing/Reaction, Coordination & Reflex/SimpleReactionTime.py');
-    
     try {
-      // Execute Python script
-      const args = ['--athlete-id', athleteId];
-      if (lightTrials) args.push('--light-trials', lightTrials.join(','));
-      if (soundTrials) args.push('--sound-trials', soundTrials.join(','));
+      const output = await executePythonTest('simple-reaction-time', {
+        light_trials: lightTrials || [],
+        sound_trials: soundTrials || []
+      }, { athleteId });
       
-      const output = await executePythonScript(scriptPath, args);
-      
-      // Calculate metrics
+      // Metrics come from the Python analysis (null when a stimulus had no trials)
       const allTrials = [...(lightTrials || []), ...(soundTrials || [])];
+      const avg = (r) => (r ? r['Average Reaction Time (ms)'] : null);
+      const best = (r) => (r ? r['Best Reaction Time (ms)'] : null);
       const metrics = {
-        lightAvgTime: lightTrials?.length ? lightTrials.reduce((a, b) => a + b, 0) / lightTrials.length : null,
-        lightBestTime: lightTrials?.length ? Math.min(...lightTrials) : null,
-        soundAvgTime: soundTrials?.length ? soundTrials.reduce((a, b) => a + b, 0) / soundTrials.length : null,
-        soundBestTime: soundTrials?.length ? Math.min(...soundTrials) : null,
-        combinedAvgTime: allTrials.length ? allTrials.reduce((a, b) => a + b, 0) / allTrials.length : null,
-        combinedBestTime: allTrials.length ? Math.min(...allTrials) : null
+        lightAvgTime: avg(output.Light),
+        lightBestTime: best(output.Light),
+        soundAvgTime: avg(output.Sound),
+        soundBestTime: best(output.Sound),
+        combinedAvgTime: avg(output.Combined),
+        combinedBestTime: best(output.Combined)
       };
       
       const reactionTime = await SimpleReactionTime.create({
@@ -285,7 +246,7 @@ exports.executeSimpleReactionTime = async (req, res, next) => {
       });
       
     } catch (pythonError) {
-      res.status(500).json({
+      res.status(pythonError.status || 500).json({
         message: 'Python script execution failed',
         error: pythonError.message
       });
@@ -357,24 +318,14 @@ exports.createIllinoisAgilityTest = async (req, res, next) => {
     const { completionTime, gender } = req.body;
     
     // Calculate performance rating based on gender and time
-    let rating;
-    if (gender.toLowerCase() === 'male') {
-      if (completionTime < 15.2) rating = 'excellent';
-      else if (completionTime < 16.1) rating = 'good';
-      else if (completionTime < 18.1) rating = 'average';
-      else if (completionTime < 19.3) rating = 'below_average';
-      else rating = 'poor';
-    } else {
-      if (completionTime < 17.0) rating = 'excellent';
-      else if (completionTime < 17.9) rating = 'good';
-      else if (completionTime < 21.0) rating = 'average';
-      else if (completionTime < 23.0) rating = 'below_average';
-      else rating = 'poor';
-    }
+    const output = await executePythonTest('illinois-agility', {
+      completion_time: completionTime,
+      gender
+    });
     
     const illinoisTest = await IllinoisAgilityTest.create({
       ...req.body,
-      performance: { rating, percentile: 50, trend: 'stable' }
+      performance: calculatePerformanceRating(output)
     });
     
     res.status(201).json(illinoisTest);
@@ -387,20 +338,18 @@ exports.executeIllinoisAgilityTest = async (req, res, next) => {
   try {
     const { athleteId, completionTime, gender } = req.body;
     
-    const scriptPath = path.join(__dirname, '../Skill-Related & Performance Testing/Speed, Acceleration & Agility/IllinoisAgilityTest.py');
-    
     try {
-      const output = await executePythonScript(scriptPath, [
-        '--time', completionTime.toString(),
-        '--gender', gender
-      ]);
+      const output = await executePythonTest('illinois-agility', {
+        completion_time: completionTime,
+        gender
+      }, { athleteId });
       
       // Create test record
       const illinoisTest = await IllinoisAgilityTest.create({
         athleteId,
         completionTime,
         gender,
-        performance: { rating: 'average', percentile: 50, trend: 'stable' }
+        performance: calculatePerformanceRating(output)
       });
       
       res.json({
@@ -410,7 +359,7 @@ exports.executeIllinoisAgilityTest = async (req, res, next) => {
       });
       
     } catch (pythonError) {
-      res.status(500).json({
+      res.status(pythonError.status || 500).json({
         message: 'Python script execution failed',
         error: pythonError.message
       });
@@ -432,7 +381,11 @@ exports.createAgility505 = async (req, res, next) => {
 
 exports.createTTest = async (req, res, next) => {
   try {
-    const tTest = await TTest.create(req.body);
+    const output = await executePythonTest('t-test', { total_time: req.body.completionTime });
+    const tTest = await TTest.create({
+      ...req.body,
+      performance: calculatePerformanceRating(output)
+    });
     res.status(201).json(tTest);
   } catch (err) {
     next(err);
@@ -0,0 +1,8 @@
+"""
+Shared Python runtime for the ForgeOn assessment scripts.
+
+The test scripts under ``src/`` are written to be run one at a time from a
+terminal. This package lets the backend drive their calculation functions
+programmatically. Run its entry points from ``src/``, e.g.
+``python -m forgeon.worker``.
+"""
@@ -0,0 +1,147 @@
+"""
+Batch executor for mixed test workloads.
+
+    python -m forgeon.batch requests.ndjson -o results.ndjson
+    cat requests.ndjson | python -m forgeon.batch --workers 8 > results.ndjson
+
+Each input line is a worker request (``{"id", "testId", "inputs", "meta"}``)
+and each output line is the worker's reply to it, in input order. A request
+without an ``"id"`` is tagged with its line number. Lines are sent to a
+process pool in chunks, so a whole preseason day (hundreds of athletes by
+dozens of tests) is spread over every core, and replies are written as soon
+as the chunks ahead of them are done. A bad line only fails its own reply.
+
+The chunk size defaults to enough lines for about four chunks per worker
+(between 16 and 1024 lines) when the input is a file, and 64 lines when it is
+read from a pipe. A summary goes to stderr; the exit status is 1 if any
+request failed.
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from forgeon.calculators import to_json
+from forgeon.worker import handle
+
+MIN_CHUNK = 16
+MAX_CHUNK = 1024
+PIPE_CHUNK = 64
+
+
+def run_lines(lines):
+    """Answer a chunk of (line number, raw line) pairs; returns (reply lines, failures)."""
+    replies = []
+    failed = 0
+    # Keep anything a calculator prints out of the results
+    with contextlib.redirect_stdout(sys.stderr):
+        for number, line in lines:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("A request must be a JSON object")
+            except ValueError as e:
+                reply = {"id": number, "ok": False, "error": {"type": type(e).__name__, "message": str(e)}}
+            else:
+                request.setdefault("id", number)
+                try:
+                    reply = handle(request)
+                except SystemExit as e:  # a script calling exit() must not take the pool worker down
+                    reply = {"id": request["id"], "ok": False, "testId": request.get("testId"),
+                             "error": {"type": "SystemExit", "message": str(e)}}
+            if not reply["ok"]:
+                failed += 1
+            replies.append(to_json(reply))
+    return replies, failed
+
+
+def chunks(lines, size):
+    """Group non-blank lines into chunks of (line number, line), numbering from 1."""
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append((number, line))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def tuned_chunk_size(line_count, workers):
+    return max(MIN_CHUNK, min(MAX_CHUNK, -(-line_count // (workers * 4))))
+
+
+def run(lines, out, workers=None, chunk_size=PIPE_CHUNK):
+    """
+    Answer every request in `lines` and write the replies to `out` in order.
+
+    Parameters:
+        workers (int): pool processes (None or 0: one per CPU; 1: no pool)
+        chunk_size (int): requests sent to a worker at a time
+
+    Returns:
+        tuple: (requests answered, requests failed)
+    """
+    workers = workers or os.cpu_count() or 1
+    total = failed = 0
+    if workers == 1:
+        results = map(run_lines, chunks(lines, chunk_size))
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        # imap keeps input order but hands each chunk back as soon as it and those before it are done
+        results = pool.imap(run_lines, chunks(lines, chunk_size))
+    try:
+        for replies, chunk_failed in results:
+            out.write("\n".join(replies) + "\n")
+            total += len(replies)
+            failed += chunk_failed
+        out.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return total, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forgeon.batch",
+                                     description="Run NDJSON test requests over a process pool.")
+    parser.add_argument("input", nargs="?", help="NDJSON requests (default: stdin)")
+    parser.add_argument("-o", "--output", help="write replies here (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="requests sent to a worker at a time")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        if args.input:
+            source = stack.enter_context(open(args.input, encoding="utf-8"))
+            if args.chunk_size is None:
+                # Count lines first so the work splits evenly; the file is then read again lazily
+                line_count = sum(1 for _ in source)
+                source.seek(0)
+                args.chunk_size = tuned_chunk_size(line_count, workers)
+        else:
+            source = sys.stdin
+        out = stack.enter_context(open(args.output, "w", encoding="utf-8")) if args.output else sys.stdout
+        total, failed = run(source, out, workers, args.chunk_size or PIPE_CHUNK)
+
+    elapsed = time.perf_counter() - started
+    print(f"{total} requests, {failed} failed, {elapsed:.2f}s on {workers} worker(s)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Microbenchmarks for the pure calculation functions.
+
+Every case calls one calculator on seeded synthetic inputs at a "small" and a
+"large" size. For single-value calculators the size is the number of distinct
+input sets in the batch; for calculators that take a trace or a list it is the
+length of that input. Each run reports:
+
+    p50/p95 per-call latency (µs), from individually timed calls
+    throughput (calls/s), from timing the whole batch in a tight loop
+
+Results can be saved as a baseline and later runs compared against it; the
+exit status is 1 when any case is slower than the baseline by more than the
+threshold (default 25%):
+
+    python -m forgeon.bench --save bench-baseline.json
+    python -m forgeon.bench --compare bench-baseline.json --threshold 0.15
+    python -m forgeon.bench -k body_density --sizes large
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from forgeon import cohort, norms, shuttles
+from forgeon.calculators import HRF, SKILL, load_script
+
+BODY_COMP = f"{HRF}/Body Composition & Anthropometry"
+AGILITY = f"{SKILL}/Speed, Acceleration & Agility"
+REFLEX = f"{SKILL}/Reaction, Coordination & Reflex"
+POWER = f"{SKILL}/Anaerobic & Power"
+
+
+class Case:
+    """
+    One benchmark: `target` returns the function, `make(rng, size, batch)`
+    returns `batch` argument tuples, and sizes maps "small"/"large" to
+    (size, batch).
+    """
+
+    def __init__(self, name, target, make, small, large):
+        self.name = name
+        self.target = target
+        self.make = make
+        self.sizes = {"small": small, "large": large}
+
+
+def _script(path, func):
+    return lambda: getattr(load_script(path), func)
+
+
+def _scalar(*ranges, pick=None):
+    """make() for single-value calculators: one uniform draw per argument per call."""
+    def make(rng, size, batch):
+        rows = []
+        for _ in range(batch):
+            row = tuple(rng.uniform(lo, hi) for lo, hi in ranges)
+            rows.append(pick(rng, row) if pick else row)
+        return rows
+    return make
+
+
+def _force_trace(rng, n):
+    """Quiet standing then a rise to peak and a partial drop, with noise (N)."""
+    rise_start, peak_at = int(n * 0.2), int(n * 0.6)
+    base, peak = rng.uniform(700, 900), rng.uniform(2500, 4000)
+    trace = []
+    for i in range(n):
+        if i < rise_start:
+            f = base
+        elif i < peak_at:
+            f = base + (peak - base) * (i - rise_start) / (peak_at - rise_start)
+        else:
+            f = peak - 0.3 * (peak - base) * (i - peak_at) / (n - peak_at)
+        trace.append(f + rng.gauss(0, 5))
+    return trace
+
+
+def _traces(rng, size, batch):
+    return [(_force_trace(rng, size), 1000.0) for _ in range(batch)]
+
+
+def _force_trials(rng, size, batch):
+    import numpy as np
+    return [(np.array([_force_trace(rng, size) for _ in range(10)]), 1000.0) for _ in range(batch)]
+
+
+def _obstacles(rng, size, batch):
+    return [
+        ([{"name": f"Obstacle {i + 1}", "time": rng.uniform(5, 40), "penalties": rng.randrange(3)}
+          for i in range(size)], size * 25.0)
+        for _ in range(batch)
+    ]
+
+
+def _dtr(rng, size, batch):
+    return [("Patellar", rng.randrange(5), rng.randrange(5)) for _ in range(batch)]
+
+
+def _sex_last(rng, row):
+    return row + (rng.choice(("male", "female")),)
+
+
+def _sex_first(rng, row):
+    return (rng.choice(("male", "female")),) + row
+
+
+def _columns(*ranges, sex=False):
+    """make() for the column-wise functions: one array per argument, `size` athletes."""
+    def make(rng, size, batch):
+        import numpy as np
+        gen = np.random.default_rng(rng.randrange(2 ** 32))
+        rows = []
+        for _ in range(batch):
+            cols = [gen.uniform(lo, hi, size) for lo, hi in ranges]
+            if sex:
+                cols.append(gen.choice(np.array(["male", "female"]), size))
+            rows.append(tuple(cols))
+        return rows
+    return make
+
+
+def _squad(rng, size, batch):
+    import numpy as np
+    gen = np.random.default_rng(rng.randrange(2 ** 32))
+    return [("illinois-agility", gen.uniform(13, 25, size), gen.choice(np.array(["male", "female"]), size))
+            for _ in range(batch)]
+
+
+def _beep_squad(rng, size, batch):
+    import numpy as np
+    gen = np.random.default_rng(rng.randrange(2 ** 32))
+    counts = shuttles.stage_table("beep-test").arrays().count
+    rows = []
+    for _ in range(batch):
+        levels = gen.integers(1, 22, size)
+        rows.append(("beep-test", levels, (gen.random(size) * counts[levels]).astype(int) + 1))
+    return rows
+
+
+CASES = [
+    Case("cmj_outcomes", _script(f"{POWER}/VerticalJump.py", "cmj_outcomes"),
+         _scalar((0.3, 0.7), (50, 110), (0.15, 0.4)), (100, 100), (10_000, 10_000)),
+    Case("broad_jump_outcomes", _script(f"{POWER}/BroadJump.py", "broad_jump_outcomes"),
+         _scalar((1.5, 3.2), (50, 110), (150, 205)), (100, 100), (10_000, 10_000)),
+    Case("calculate_505_test", _script(f"{AGILITY}/505agility.py", "calculate_505_test"),
+         _scalar((2.1, 3.0), (2.1, 3.0)), (100, 100), (10_000, 10_000)),
+    Case("calculate_max_speed", _script(f"{AGILITY}/maxRunupspeed.py", "calculate_max_speed"),
+         _scalar((10, 40), (1.2, 5.5)), (100, 100), (10_000, 10_000)),
+    Case("calculate_yoyo_ir", _script(f"{AGILITY}/Yo-YoIR.py", "calculate_yoyo_ir"),
+         _scalar((200, 2800), (13, 19)), (100, 100), (10_000, 10_000)),
+    Case("calculate_vor_gain", _script(f"{REFLEX}/Vestibulo-OcularReflex.py", "calculate_vor_gain"),
+         _scalar((50, 250), (60, 240)), (100, 100), (10_000, 10_000)),
+    Case("analyze_h_reflex", _script(f"{REFLEX}/H-reflex.py", "analyze_h_reflex"),
+         _scalar((25, 38), (0.5, 5), (3, 15)), (100, 100), (10_000, 10_000)),
+    Case("analyze_dtr", _script(f"{REFLEX}/DTR.py", "analyze_dtr"), _dtr, (100, 100), (10_000, 10_000)),
+    Case("calculate_custom_circuit",
+         _script(f"{SKILL}/Functional Fitness Simulation/CustomObstacleCircuit.py", "calculate_custom_circuit"),
+         _obstacles, (8, 1_000), (500, 100)),
+    Case("time_to_peak_force", _script(f"{POWER}/Time-to-PeakForce.py", "time_to_peak_force"),
+         _traces, (1_000, 200), (100_000, 10)),
+    Case("analyze_force_trials", _script(f"{POWER}/Time-to-PeakForce.py", "analyze_force_trials"),
+         _force_trials, (1_000, 50), (100_000, 3)),
+    Case("body_density_7site", _script(f"{BODY_COMP}/skinfold.py", "body_density_7site"),
+         _scalar((30, 200), (16, 60), pick=_sex_last), (100, 100), (10_000, 10_000)),
+    Case("body_density_8site", _script(f"{BODY_COMP}/Skinfold8.py", "body_density_8site"),
+         _scalar((35, 230), (16, 60), pick=_sex_last), (100, 100), (10_000, 10_000)),
+    Case("body_fat_percent", _script(f"{BODY_COMP}/skinfold.py", "body_fat_percent"),
+         _scalar((1.0, 1.1)), (100, 100), (10_000, 10_000)),
+    Case("us_navy_bodyfat", _script(f"{BODY_COMP}/Girth.py", "us_navy_bodyfat"),
+         _scalar((70, 110), (30, 44), (85, 120), (150, 205), pick=_sex_first), (100, 100), (10_000, 10_000)),
+    Case("calculate_bia", _script(f"{BODY_COMP}/BIA.py", "calculate_bia"),
+         _scalar((350, 650), (6, 35), (25, 50), (150, 205)), (100, 100), (10_000, 10_000)),
+    Case("dexa_outcomes", _script(f"{BODY_COMP}/dexa.py", "dexa_outcomes"),
+         _scalar((80, 100), (8, 25), (50, 70), (1.0, 1.4)), (100, 100), (10_000, 10_000)),
+    Case("cohort.body_density_7site", lambda: cohort.body_density_7site,
+         _columns((30, 200), (16, 60), sex=True), (1_000, 50), (200_000, 5)),
+    Case("cohort.us_navy_bodyfat", lambda: (lambda *c: cohort.us_navy_bodyfat(c[4], *c[:4])),
+         _columns((70, 110), (30, 44), (85, 120), (150, 205), sex=True), (1_000, 50), (200_000, 5)),
+    Case("cohort.calculate_bia", lambda: cohort.calculate_bia,
+         _columns((350, 650), (6, 35), (25, 50), (150, 205)), (1_000, 50), (200_000, 5)),
+    Case("norms.rate_squad", lambda: norms.rate_squad, _squad, (1_000, 50), (200_000, 5)),
+    Case("shuttles.squad_results", lambda: shuttles.squad_results, _beep_squad, (1_000, 50), (200_000, 5)),
+]
+
+
+def measure(func, args_list, repeat=5):
+    """Return p50/p95 per-call latency (µs) and best-of-`repeat` batch throughput (calls/s)."""
+    clock = time.perf_counter_ns
+    for args in args_list[:100]:  # warm up caches and lazy imports
+        func(*args)
+
+    single = []
+    for args in args_list:
+        start = clock()
+        func(*args)
+        single.append((clock() - start) / 1000)
+    single.sort()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = clock()
+        for args in args_list:
+            func(*args)
+        best = min(best, clock() - start)
+    return {
+        "p50_us": round(statistics.median(single), 3),
+        "p95_us": round(single[min(len(single) - 1, int(len(single) * 0.95))], 3),
+        "calls_per_s": round(len(args_list) / (best / 1e9), 1),
+    }
+
+
+def run(cases, sizes=("small", "large"), seed=0, repeat=5, out=sys.stdout):
+    results = {}
+    for case in cases:
+        func = case.target()
+        for size_name in sizes:
+            size, batch = case.sizes[size_name]
+            # Seed per case and size so adding a case does not change the others' inputs
+            rng = random.Random(f"{seed}:{case.name}:{size_name}")
+            key = f"{case.name}[{size_name}]"
+            results[key] = {"size": size, "batch": batch,
+                            **measure(func, case.make(rng, size, batch), repeat)}
+            r = results[key]
+            print(f"{key:<38} size={size:<7} p50={r['p50_us']:>11.2f}µs "
+                  f"p95={r['p95_us']:>11.2f}µs {r['calls_per_s']:>12.1f} calls/s", file=out)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return a message per case that regressed by more than `threshold` (a fraction)."""
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        slower_p50 = r["p50_us"] / base["p50_us"] - 1 if base["p50_us"] else 0
+        slower_batch = base["calls_per_s"] / r["calls_per_s"] - 1 if r["calls_per_s"] else float("inf")
+        worst = max(slower_p50, slower_batch)
+        if worst > threshold:
+            regressions.append(f"{key}: {worst:.0%} slower than baseline "
+                               f"(p50 {base['p50_us']} -> {r['p50_us']} µs, "
+                               f"{base['calls_per_s']} -> {r['calls_per_s']} calls/s)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forgeon.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this")
+    parser.add_argument("--sizes", default="small,large", help="comma-separated: small, large")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="batch timings to take the best of")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="fail on regressions against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before failing, as a fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = set(sizes) - {"small", "large"}
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(sorted(unknown))}")
+    cases = [c for c in CASES if not args.pattern or args.pattern in c.name]
+    if not cases:
+        parser.error(f"no benchmark matches '{args.pattern}'")
+
+    results = run(cases, sizes, args.seed, args.repeat)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "seed": args.seed, "results": results}, f, indent=2)
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
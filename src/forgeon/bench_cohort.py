@@ -0,0 +1,102 @@
+"""
+Benchmark the column-wise body-composition equations against looping over
+the scalar functions, and check that both agree.
+
+    python -m forgeon.bench_cohort --athletes 200000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from forgeon import cohort
+from forgeon.calculators import HRF, load_script
+
+BODY_COMP = f"{HRF}/Body Composition & Anthropometry"
+
+
+def synthetic_cohort(n, seed=0):
+    rng = np.random.default_rng(seed)
+    sex = rng.choice(np.array(["male", "female"]), size=n)
+    male = sex == "male"
+    return {
+        "sex": sex,
+        "age": rng.integers(16, 60, size=n).astype(float),
+        "sum7": rng.uniform(30, 200, size=n),
+        "sum8": rng.uniform(35, 230, size=n),
+        "waist": np.where(male, rng.uniform(70, 110, size=n), rng.uniform(60, 100, size=n)),
+        "neck": np.where(male, rng.uniform(34, 44, size=n), rng.uniform(29, 37, size=n)),
+        "hip": rng.uniform(85, 120, size=n),
+        "height": rng.uniform(150, 205, size=n),
+        "impedance": rng.uniform(350, 650, size=n),
+        "body_fat_percent": rng.uniform(6, 35, size=n),
+        "muscle_mass": rng.uniform(25, 50, size=n),
+    }
+
+
+def _scalar_columns(data):
+    skinfold = load_script(f"{BODY_COMP}/skinfold.py")
+    skinfold8 = load_script(f"{BODY_COMP}/Skinfold8.py")
+    girth = load_script(f"{BODY_COMP}/Girth.py")
+    bia = load_script(f"{BODY_COMP}/BIA.py")
+
+    col = {name: values.tolist() for name, values in data.items()}
+    sex, age = col["sex"], col["age"]
+    bd7 = [skinfold.body_density_7site(s, a, x) for s, a, x in zip(col["sum7"], age, sex)]
+    bd8 = [skinfold8.body_density_8site(s, a, x) for s, a, x in zip(col["sum8"], age, sex)]
+    return {
+        "body_density_7site": bd7,
+        "body_density_8site": bd8,
+        "body_fat_percent": [skinfold.body_fat_percent(bd) for bd in bd7],
+        "us_navy_bodyfat": [
+            girth.us_navy_bodyfat(*row)
+            for row in zip(sex, col["waist"], col["neck"], col["hip"], col["height"])
+        ],
+        "calculate_bia": [
+            bia.calculate_bia(*row)["FFMI"]
+            for row in zip(col["impedance"], col["body_fat_percent"], col["muscle_mass"], col["height"])
+        ],
+    }
+
+
+def _vector_columns(data):
+    bd7 = cohort.body_density_7site(data["sum7"], data["age"], data["sex"])
+    return {
+        "body_density_7site": bd7,
+        "body_density_8site": cohort.body_density_8site(data["sum8"], data["age"], data["sex"]),
+        "body_fat_percent": cohort.body_fat_percent(bd7),
+        "us_navy_bodyfat": cohort.us_navy_bodyfat(data["sex"], data["waist"], data["neck"],
+                                                  data["hip"], data["height"]),
+        "calculate_bia": cohort.calculate_bia(data["impedance"], data["body_fat_percent"],
+                                              data["muscle_mass"], data["height"])["FFMI"],
+    }
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--athletes", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    data = synthetic_cohort(args.athletes, args.seed)
+    scalar, scalar_s = _timed(_scalar_columns, data)
+    vector, vector_s = _timed(_vector_columns, data)
+
+    print(f"{args.athletes} athletes")
+    for name in scalar:
+        expected = np.array([np.nan if v is None else v for v in scalar[name]], dtype=float)
+        if not np.allclose(vector[name], expected, rtol=1e-9, atol=1e-9, equal_nan=True):
+            raise SystemExit(f"{name}: column results differ from the scalar function")
+        print(f"  {name:<20} matches scalar")
+    print(f"Scalar loop : {scalar_s * 1000:9.1f} ms")
+    print(f"Vectorised  : {vector_s * 1000:9.1f} ms  ({scalar_s / vector_s:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Opt-in LRU cache of calculator results.
+
+Calculators are pure functions of their inputs and meta, and frontends often
+resubmit identical payloads. The cache keys each request on a canonical form
+of its inputs, so ``17`` and ``17.0``, ``"male"`` and ``" male "``, and a unit
+of ``"KG"`` or ``"kilograms"`` all hit the same entry, and stores the result already
+serialised to JSON so a hit skips both the calculation and ``json.dumps``.
+
+Only successful results are cached. Caching can be switched off per testId.
+Requests that name a file (``path``, ``hr_path``, ``log_path``) are never
+cached: their result depends on what is in the file, not on its name, and a
+readiness request with a ``log_path`` also appends to it.
+"""
+import json
+import time
+from collections import OrderedDict
+
+from forgeon import calculators
+from forgeon.calculators import to_json
+
+UNIT_ALIASES = {
+    "kilogram": "kg", "kilograms": "kg", "kgs": "kg",
+    "second": "s", "seconds": "s", "sec": "s", "secs": "s",
+    "millisecond": "ms", "milliseconds": "ms", "msec": "ms",
+    "centimeter": "cm", "centimeters": "cm", "centimetre": "cm", "centimetres": "cm",
+    "meter": "m", "meters": "m", "metre": "m", "metres": "m",
+    "millimeter": "mm", "millimeters": "mm", "millimetre": "mm", "millimetres": "mm",
+    "newton": "n", "newtons": "n",
+    "kmh": "km/h", "kph": "km/h", "km/hr": "km/h",
+    "degrees": "deg", "degree": "deg", "°": "deg",
+    "percent": "%",
+}
+
+# Inputs naming a file the result depends on (or, for log_path, writes to)
+FILE_INPUTS = ("path", "hr_path", "log_path")
+
+
+def canonical(value):
+    """
+    Normalise a JSON value for use in a cache key: numbers become floats,
+    strings are stripped, and containers are normalised recursively.
+
+    Strings are not parsed as numbers: some inputs are text that looks
+    numeric, and "10.10" (level 10, bout 10) is not "10.1".
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {str(k): canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(v) for v in value]
+    return value
+
+
+def canonical_unit(unit):
+    unit = str(unit).strip().lower()
+    return UNIT_ALIASES.get(unit, unit)
+
+
+def reads_files(inputs):
+    values = calculators.input_values(inputs)
+    return any(values.get(name) not in (None, "") for name in FILE_INPUTS)
+
+
+def cache_key(test_id, inputs, meta=None):
+    if isinstance(inputs, list):
+        items = {
+            str(item["id"]): [canonical(item.get("value")),
+                              canonical_unit(item["unit"]) if item.get("unit") else None]
+            for item in inputs
+        }
+    else:
+        items = {str(k): [canonical(v), None] for k, v in (inputs or {}).items()}
+    # Empty values are treated as missing by the adapters
+    items = {k: v for k, v in items.items() if v[0] not in (None, "")}
+    return json.dumps([test_id, items, canonical(meta or {})], sort_keys=True, separators=(",", ":"))
+
+
+class ResultCache:
+    """
+    Bounded LRU map from canonical request to serialised result.
+
+    Parameters:
+        maxsize (int): entries kept before the least recently used is evicted
+        disabled (iterable): testIds that are never cached
+        run (callable, optional): used instead of calculators.run_test on a
+            miss, e.g. Metrics.run
+    """
+
+    def __init__(self, maxsize=1024, disabled=(), run=None):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be greater than zero.")
+        self.maxsize = maxsize
+        self.disabled = set(disabled)
+        self.run = run or calculators.run_test
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.last_serialize_s = 0.0  # json time of the latest run_json call (0 on a hit)
+
+    def enable(self, test_id):
+        self.disabled.discard(test_id)
+
+    def disable(self, test_id):
+        self.disabled.add(test_id)
+        for key in [k for k in self.entries if json.loads(k)[0] == test_id]:
+            del self.entries[key]
+
+    def run_json(self, test_id, inputs, meta=None):
+        """Return the calculator's output as JSON text, from the cache when possible."""
+        self.last_serialize_s = 0.0
+        if test_id in self.disabled or reads_files(inputs):
+            return self._serialize(self.run(test_id, inputs, meta))
+
+        key = cache_key(test_id, inputs, meta)
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        output = self._serialize(self.run(test_id, inputs, meta))
+        self.entries[key] = output
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return output
+
+    def _serialize(self, result):
+        start = time.perf_counter()
+        text = to_json(result)
+        self.last_serialize_s = time.perf_counter() - start
+        return text
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "disabled": sorted(self.disabled),
+        }
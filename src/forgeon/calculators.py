@@ -0,0 +1,799 @@
+"""
+Calculator table: maps a frontend testId to the script that owns the test
+and to the function that turns request inputs into a calculation call.
+"""
+import importlib.util
+import json
+import math
+import re
+import sys
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+# Scripts import their shared tables and helpers as ``forgeon.X``; make that
+# resolve to this package however forgeon itself was found
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+HRF = "Health-Related Fitness"
+SKILL = "Skill-Related & Performance Testing"
+
+
+def load_script(relative_path):
+    """
+    Import a test script by its path relative to ``src/``.
+
+    Script paths contain spaces and characters such as ``&`` and ``-`` so they
+    cannot be imported by name. Each script is executed once and cached in
+    ``sys.modules``.
+    """
+    name = "forgeon._scripts." + re.sub(r"\W", "_", relative_path)
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    loader = SourceFileLoader(name, str(SRC_DIR / relative_path))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def input_values(inputs):
+    """Normalise request inputs (``[{id, value, unit?}]`` or a plain dict) to ``{id: value}``."""
+    if inputs is None:
+        return {}
+    if isinstance(inputs, dict):
+        return dict(inputs)
+    return {item["id"]: item.get("value") for item in inputs}
+
+
+_REQUIRED = object()
+
+
+def number(values, key, default=_REQUIRED):
+    """Read a numeric input, treating empty strings as missing."""
+    value = values.get(key)
+    if value is None or value == "":
+        if default is _REQUIRED:
+            raise ValueError(f"Missing required input '{key}'")
+        return default
+    return float(value)
+
+
+def integer(values, key, default=_REQUIRED):
+    value = number(values, key, default)
+    return value if value is None else int(value)
+
+
+def number_list(values, key, default=_REQUIRED):
+    """Read a list of numbers given as a JSON array or a comma/space separated string."""
+    value = values.get(key)
+    if hasattr(value, "dtype"):  # a binary-frame array (see forgeon.frames)
+        return value.astype(float).tolist()
+    if value is None or value == "":
+        if default is _REQUIRED:
+            raise ValueError(f"Missing required input '{key}'")
+        return default
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    return [float(v) for v in value]
+
+
+def number_array(values, key, default=_REQUIRED):
+    """
+    Read numeric input as a float64 NumPy array. Arrays from binary frames
+    are passed through without a copy when they are already float64.
+    """
+    value = values.get(key)
+    if value is None or (isinstance(value, str) and value == ""):
+        return number_list(values, key, default)  # the default, or the missing-input error
+    import numpy as np
+
+    if hasattr(value, "dtype"):
+        return np.asarray(value, dtype=np.float64)
+    if isinstance(value, list) and value and isinstance(value[0], list):
+        return np.asarray(value, dtype=np.float64)
+    value = number_list(values, key, default)
+    return value if value is None else np.asarray(value, dtype=np.float64)
+
+
+def text(values, key, default=None):
+    value = values.get(key)
+    if value is None:
+        return default
+    value = str(value).strip()
+    return value if value else default
+
+
+def _finite(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def to_json(value):
+    """
+    Serialise a reply as strict JSON. NaN and infinities (a missing estimate,
+    say) become null: ``JSON.parse`` on the Node side rejects ``NaN``.
+    """
+    try:
+        return json.dumps(value, allow_nan=False)
+    except ValueError:
+        return json.dumps(_finite(value), allow_nan=False)
+
+
+# ---------------------------------------------------------------------------
+# Adapters: (module, values, meta) -> result dict
+# ---------------------------------------------------------------------------
+
+def _dexa(module, values, meta):
+    return module.dexa_outcomes(
+        number(values, "total_mass"),
+        number(values, "fat_mass"),
+        number(values, "lean_mass"),
+        number(values, "bone_density"),
+    )
+
+
+def _bia(module, values, meta):
+    return module.calculate_bia(
+        number(values, "impedance"),
+        number(values, "body_fat_percent"),
+        number(values, "muscle_mass"),
+        number(values, "height", meta.get("height")),
+    )
+
+
+def _girth(module, values, meta):
+    return module.girth_outcomes(
+        number(values, "waist"),
+        number(values, "hip"),
+        number(values, "neck"),
+        number(values, "chest"),
+        number(values, "arm_relaxed"),
+        number(values, "arm_flexed"),
+        text(values, "sex", meta.get("sex")),
+        number(values, "height", meta.get("height")),
+    )
+
+
+def _skinfold_7site(module, values, meta):
+    return module.skinfold_7site_outcomes(
+        number(values, "chest"),
+        number(values, "axilla"),
+        number(values, "tricep"),
+        number(values, "subscapular"),
+        number(values, "abdomen"),
+        number(values, "suprailiac"),
+        number(values, "thigh"),
+        number(values, "age", meta.get("age")),
+        text(values, "sex", meta.get("sex") or "male"),
+    )
+
+
+def _cpet(module, values, meta):
+    return module.cpet_outcomes(
+        number(values, "vo2_max"),
+        number(values, "max_hr"),
+        number(values, "max_power"),
+        number(values, "rer_max"),
+        text(values, "test_duration", ""),
+    )
+
+
+def _cpet_breath(module, values, meta):
+    body_mass = number(values, "body_mass", meta.get("bodyMass"))
+    bin_s = number(values, "bin_seconds", 15)
+    path = text(values, "path")
+    if path:
+        return module.analyze_cpet_file(path, body_mass, bin_s=bin_s)
+    return module.analyze_breaths(
+        number_array(values, "time"),
+        number_array(values, "vo2"),
+        number_array(values, "vco2"),
+        number_array(values, "ve", None),
+        number_array(values, "hr", None),
+        number_array(values, "power", None),
+        body_mass=body_mass,
+        bin_s=bin_s,
+    )
+
+
+def _heart_rate(values, results):
+    """
+    Attach a heart-rate summary (forgeon.heartrate) to an endurance result
+    when the request carries an "hr" or "rr" trace, or an "hr_path" squad file.
+    For a squad result a single trace goes to the athlete named in "athlete";
+    for a single result an "hr_path" file is read for that athlete.
+    """
+    hr = number_array(values, "hr", None)
+    rr = number_array(values, "rr", None)
+    hr_path = text(values, "hr_path")
+    if hr is None and rr is None and not hr_path:
+        return results
+    from forgeon import heartrate
+
+    options = {"hr_max": number(values, "hr_max", None), "exercise_end": number(values, "exercise_end", None)}
+    if isinstance(results, dict):
+        if not hr_path:
+            return heartrate.attach_summary(
+                results, heartrate.summarize(number_array(values, "hr_time", None), hr, rr, **options))
+        athlete = results.get("Athlete") or text(values, "athlete")
+        summaries = heartrate.squad_file(hr_path, **options)
+        if athlete not in summaries:
+            raise ValueError('hr_path on a single result needs the "athlete" whose trace it is '
+                             '(one of the athletes in the file).')
+        return heartrate.attach_summary(results, summaries[athlete])
+    if hr_path:
+        return heartrate.attach(results, heartrate.squad_file(hr_path, **options))
+    athlete = text(values, "athlete")
+    if not athlete or not any(result.get("Athlete") == athlete for result in results):
+        raise ValueError('A single hr/rr trace on a squad result needs the "athlete" it belongs to '
+                         '(or use hr_path for the whole squad).')
+    summary = heartrate.summarize(number_array(values, "hr_time", None), hr, rr, **options)
+    return heartrate.attach(results, {athlete: summary})
+
+
+def _cooper(module, values, meta):
+    return _heart_rate(values, module.cooper_outcomes(
+        number(values, "distance"),
+        int(number(values, "laps_completed", 0)),
+    ))
+
+
+def _cooper_gps(module, values, meta):
+    lap_length = number(values, "lap_length", None)
+    path = text(values, "path")
+    if path:
+        return _heart_rate(values, module.cooper_squad_file(path, lap_length))
+    return _heart_rate(values, module.cooper_track_outcomes(
+        number_array(values, "time"),
+        number_array(values, "lat"),
+        number_array(values, "lon"),
+        text(values, "athlete", meta.get("athleteId")),
+        lap_length,
+    ))
+
+
+def _ift(module, values, meta):
+    return _heart_rate(values, module.ift_outcomes(
+        number(values, "final_speed"),
+        number(values, "total_distance"),
+        text(values, "max_heart_rate"),
+        text(values, "coach_notes"),
+    ))
+
+
+def _beep(module, values, meta):
+    return _heart_rate(values, module.shuttle_run_outcomes(
+        int(number(values, "final_level")),
+        int(number(values, "final_shuttles", 0)),
+        int(number(values, "total_shuttles", 0)) or None,
+    ))
+
+
+def _shuttle_squad(module, values, meta):
+    athletes = values.get("athletes")
+    if isinstance(athletes, str):
+        athletes = json.loads(athletes)
+    if not athletes:
+        raise ValueError("Missing required input 'athletes'")
+    return _heart_rate(values, module.shuttles.squad_outcomes(text(values, "protocol", "beep-test"), athletes))
+
+
+def _skinfold_8site(module, values, meta):
+    return module.skinfold_8site_outcomes(
+        number(values, "chest"),
+        number(values, "axilla"),
+        number(values, "tricep"),
+        number(values, "subscapular"),
+        number(values, "abdomen"),
+        number(values, "suprailiac"),
+        number(values, "thigh"),
+        number(values, "calf"),
+        number(values, "age", meta.get("age")),
+        text(values, "sex", meta.get("sex") or "male"),
+    )
+
+
+def _y_balance(module, values, meta):
+    def reaches(direction):
+        trials = (number(values, f"{direction}_reach_{i}", None) for i in (1, 2, 3))
+        return [t for t in trials if t is not None]
+
+    return module.y_balance_outcomes(
+        text(values, "leg_tested", ""),
+        reaches("anterior"),
+        reaches("posteromedial"),
+        reaches("posterolateral"),
+    )
+
+
+def _sit_and_reach(module, values, meta):
+    return module.sit_and_reach_outcomes(
+        number(values, "reach_distance"),
+        number(values, "trial_1"),
+        number(values, "trial_2"),
+        number(values, "trial_3"),
+    )
+
+
+def _fms(module, values, meta):
+    return module.fms_outcomes(
+        integer(values, "deep_squat"),
+        integer(values, "hurdle_step_l"), integer(values, "hurdle_step_r"),
+        integer(values, "in_line_lunge_l"), integer(values, "in_line_lunge_r"),
+        integer(values, "shoulder_mobility_l"), integer(values, "shoulder_mobility_r"),
+        integer(values, "leg_raise_l"), integer(values, "leg_raise_r"),
+        integer(values, "trunk_stability"),
+        integer(values, "rotary_stability_l"), integer(values, "rotary_stability_r"),
+    )
+
+
+def _joint_rom(module, values, meta):
+    return module.joint_rom_record(
+        text(values, "joint", ""),
+        text(values, "side", ""),
+        number(values, "active_rom"),
+        number(values, "passive_rom"),
+        text(values, "pain_present", "No"),
+        text(values, "coach_notes"),
+    )
+
+
+def _one_rm(module, values, meta):
+    return module.one_rm_record(
+        text(values, "athlete", meta.get("athleteId")),
+        number(values, "body_mass"),
+        text(values, "lift_type", ""),
+        number(values, "warmup_weight", None),
+        number(values, "one_rm"),
+        text(values, "rpe"),
+        text(values, "form_notes"),
+    )
+
+
+def _dynamometry(module, values, meta):
+    return module.dynamometry_record(
+        text(values, "muscle_group", ""),
+        number(values, "trial_1"),
+        number(values, "trial_2"),
+        number(values, "trial_3"),
+        text(values, "coach_notes"),
+    )
+
+
+def _imtp(module, values, meta):
+    return module.imtp_record(
+        text(values, "athlete", meta.get("athleteId")),
+        number(values, "peak_force_n", None),
+        number(values, "trial_1"),
+        number(values, "trial_2"),
+        number(values, "trial_3"),
+        number(values, "rate_of_force_development", None),
+    )
+
+
+def _imtp_force_trace(module, values, meta):
+    traces = values.get("force_traces")
+    if isinstance(traces, str):
+        traces = json.loads(traces)
+    if traces is None or len(traces) == 0:
+        raise ValueError("Missing required input 'force_traces'")
+    return module.imtp_trace_outcomes(
+        traces,
+        number(values, "sampling_rate"),
+        text(values, "athlete", meta.get("athleteId")),
+        number(values, "body_mass", meta.get("bodyMass")),
+    )
+
+
+def _imu_stream(values):
+    """(time, (n, 3) acceleration) from "time" plus "acc", or "ax"/"ay"/"az"; None when absent."""
+    time = number_array(values, "time", None)
+    if time is None:
+        return None
+    acc = number_array(values, "acc", None)
+    if acc is None:
+        import numpy as np
+        acc = np.column_stack([number_array(values, axis) for axis in ("ax", "ay", "az")])
+    return time, acc
+
+
+def _pushup(module, values, meta):
+    athlete = text(values, "athlete", meta.get("athleteId"))
+    path = text(values, "path")
+    if path:
+        return module.pushup_imu_file(path, athlete, text(values, "form_breakdown"))
+    stream = _imu_stream(values)
+    if stream is not None:
+        return module.pushup_imu_outcomes(*stream, athlete, text(values, "form_breakdown"))
+    return module.pushup_record(
+        athlete,
+        integer(values, "total_reps"),
+        text(values, "duration", ""),
+        text(values, "form_breakdown"),
+    )
+
+
+def _plank(module, values, meta):
+    athlete = text(values, "athlete", meta.get("athleteId"))
+    path = text(values, "path")
+    if path:
+        return module.plank_imu_file(path, athlete, text(values, "form_notes"))
+    stream = _imu_stream(values)
+    if stream is not None:
+        return module.plank_imu_outcomes(*stream, athlete, text(values, "form_notes"))
+    return module.plank_record(
+        athlete,
+        text(values, "hold_time", ""),
+        text(values, "form_notes"),
+    )
+
+
+def _daily_readiness(module, values, meta):
+    results = module.readiness_outcomes({
+        "Sleep Quality": integer(values, "sleep_quality"),
+        "Fatigue": integer(values, "fatigue"),
+        "Muscle Soreness": integer(values, "muscle_soreness"),
+        "Stress Levels": integer(values, "stress_levels"),
+        "Mood": integer(values, "mood"),
+    })
+    log_path = text(values, "log_path")
+    if log_path:
+        athlete = text(values, "athlete", meta.get("athleteId"))
+        if not athlete:
+            raise ValueError("Missing required input 'athlete'")
+        with module.ReadinessLog(log_path) as log:
+            log.append(athlete, results)
+            log.save_index()
+            results["Trend"] = log.acute_chronic(athlete)
+    return results
+
+
+def _custom_circuit(module, values, meta):
+    obstacles = [
+        {
+            "name": obs.get("name", f"Obstacle {i + 1}"),
+            "time": number(obs, "time"),
+            "penalties": integer(obs, "penalties", 0),
+            "penalty_time": number(obs, "penalty_time", number(obs, "penaltyTime", 5.0)),
+        }
+        for i, obs in enumerate(values.get("obstacles") or [])
+    ]
+    return module.calculate_custom_circuit(obstacles, number(values, "cutoff_time", None))
+
+
+def _ioct(module, values, meta):
+    return module.calculate_ioct(
+        number(values, "time"),
+        integer(values, "penalties", 0),
+        gender=text(values, "gender", meta.get("gender") or "male"),
+    )
+
+
+def _reaction_time(module, values, meta):
+    return module.reaction_time_outcomes(
+        number_list(values, "light_trials", []),
+        number_list(values, "sound_trials", []),
+    )
+
+
+def _vor(module, values, meta):
+    head = number_array(values, "head_velocity_trace", None)
+    if head is not None:
+        return module.analyze_head_impulses(
+            head,
+            number_array(values, "eye_velocity_trace"),
+            time=number_array(values, "time", None),
+            rate_hz=number(values, "sample_rate", None),
+            method=text(values, "gain_method", "area"),
+        )
+    return module.calculate_vor_gain(
+        number(values, "eye_velocity"),
+        number(values, "head_velocity"),
+    )
+
+
+def _h_reflex(module, values, meta):
+    return module.analyze_h_reflex(
+        number(values, "latency"),
+        number(values, "h_amplitude"),
+        number(values, "m_amplitude"),
+    )
+
+
+def _dtr(module, values, meta):
+    return module.analyze_dtr(
+        text(values, "reflex", ""),
+        integer(values, "left_grade"),
+        integer(values, "right_grade"),
+    )
+
+
+def _agility_505(module, values, meta):
+    return module.calculate_505_test(
+        number(values, "left_turn_time"),
+        number(values, "right_turn_time", None),
+    )
+
+
+def _illinois(module, values, meta):
+    return module.illinois_outcomes(
+        number(values, "completion_time"),
+        text(values, "gender", meta.get("gender") or "male"),
+    )
+
+
+def _t_test(module, values, meta):
+    return module.calculate_t_test_performance(number(values, "total_time"))
+
+
+def _timing_gates(module, values, meta):
+    return module.calculate_sprint_metrics(
+        number(values, "time_5m"),
+        number(values, "time_10m"),
+        number(values, "time_30m"),
+    )
+
+
+def _timing_gates_stream(module, values, meta):
+    from forgeon.gates import process_events
+
+    def json_list(key, required=True):
+        value = values.get(key)
+        if isinstance(value, str):
+            value = json.loads(value)
+        if not value and required:
+            raise ValueError(f"Missing required input '{key}'")
+        return value or []
+
+    return process_events(
+        json_list("lanes"),
+        json_list("events"),
+        json_list("queue", required=False),
+        debounce=number(values, "debounce", 0.3),
+        max_attempt_s=number(values, "max_attempt_s", 20.0),
+    )
+
+
+def _yoyo(module, values, meta):
+    return module.calculate_yoyo_ir(
+        number(values, "distance"),
+        number(values, "final_speed"),
+    )
+
+
+def _yoyo_level(module, values, meta):
+    level, bout = module.shuttles.parse_level(text(values, "level"))
+    return module.yoyo_ir_level_outcomes(
+        level,
+        int(number(values, "bout", bout)),
+        int(number(values, "version", 1)),
+    )
+
+
+def _max_runup_speed(module, values, meta):
+    return module.calculate_max_speed(
+        number(values, "distance"),
+        number(values, "time"),
+    )
+
+
+def _vertical_jump(module, values, meta):
+    return module.cmj_outcomes(
+        number(values, "flight_time"),
+        number(values, "body_mass", meta.get("bodyMass")),
+        number(values, "contact_time", None),
+    )
+
+
+def _jump_force_trace(module, values, meta):
+    return module.jump_force_outcomes(
+        number_array(values, "force"),
+        number(values, "sampling_rate"),
+        number(values, "body_mass", meta.get("bodyMass")),
+    )
+
+
+def _broad_jump(module, values, meta):
+    return module.broad_jump_outcomes(
+        number(values, "jump_distance"),
+        number(values, "body_mass", meta.get("bodyMass")),
+        number(values, "height", meta.get("height")),
+    )
+
+
+def _time_to_peak_force(module, values, meta):
+    """
+    A typed force trace goes to time_to_peak_force; a raw binary file ("path")
+    or a trace sent as an array goes through the vectorised analyser, one
+    result per trial (a single 1-D trace gives a single result).
+    """
+    sampling_rate = number(values, "sampling_rate")
+    calibration = number(values, "calibration", 1.0)
+    path = text(values, "path")
+    if path:
+        return module.trial_records(module.time_to_peak_force_file(
+            path,
+            sampling_rate,
+            integer(values, "samples_per_trial"),
+            text(values, "dtype", "float32"),
+            calibration,
+            integer(values, "offset", 0),
+        ))
+    trials = values.get("force_values")
+    if not hasattr(trials, "dtype"):  # frame arrays keep their raw sample type
+        if not (isinstance(trials, list) and trials and isinstance(trials[0], list)):
+            return module.time_to_peak_force(number_list(values, "force_values"), sampling_rate)
+        trials = number_array(values, "force_values")
+    if trials.ndim == 1:
+        return module.trial_records(module.analyze_force_trials(trials[None, :], sampling_rate, calibration))[0]
+    return module.trial_records(module.analyze_force_trials(trials, sampling_rate, calibration))
+
+
+def _wingate(module, values, meta):
+    return module.wingate_results(
+        number_list(values, "power_values"),
+        number(values, "body_mass", meta.get("bodyMass")),
+    )
+
+
+def _flight_test(module, values, meta):
+    return module.flight_test_outcomes(number(values, "flight_time_ms"))
+
+
+def _mental_drill(module, values, meta):
+    drill = module.DrillExecution(
+        drill_id=str(values.get("drill_id") or meta.get("drillId") or "drill"),
+        name=text(values, "name", "Reaction Training"),
+        estimated_duration=integer(values, "duration", 300),
+    )
+    responses = values.get("responses") or []
+    drill.config["trials"] = integer(values, "trials", len(responses))
+    drill.replay([None if rt is None else float(rt) for rt in responses],
+                 athlete_id=meta.get("athleteId", "athlete-1"))
+    return {
+        "trials": [
+            {"trial": r.trial, "metric": r.metric, "value": r.value, "unit": r.unit}
+            for r in drill.results
+        ],
+        "summary": drill.summary(),
+    }
+
+
+CALCULATORS = {
+    # Body Composition & Anthropometry
+    "dexa-scan": (f"{HRF}/Body Composition & Anthropometry/dexa.py", _dexa),
+    "bia": (f"{HRF}/Body Composition & Anthropometry/BIA.py", _bia),
+    "girth-measurements": (f"{HRF}/Body Composition & Anthropometry/Girth.py", _girth),
+    "skinfolds-7site": (f"{HRF}/Body Composition & Anthropometry/skinfold.py", _skinfold_7site),
+    "skinfolds-8site": (f"{HRF}/Body Composition & Anthropometry/Skinfold8.py", _skinfold_8site),
+
+    # Aerobic Endurance
+    "vo2max-test": (f"{HRF}/Aerobic Endurance/CPET.py", _cpet),
+    "cooper-test": (f"{HRF}/Aerobic Endurance/coppertest.py", _cooper),
+    "cooper-gps": (f"{HRF}/Aerobic Endurance/coppertest.py", _cooper_gps),
+    "ift-test": (f"{HRF}/Aerobic Endurance/ift.py", _ift),
+    "cpet-breath": (f"{HRF}/Aerobic Endurance/CPET.py", _cpet_breath),
+    "beep-test": (f"{HRF}/Aerobic Endurance/Shuttlerun.py", _beep),
+    "shuttle-squad": (f"{HRF}/Aerobic Endurance/Shuttlerun.py", _shuttle_squad),
+
+    # Balance, Flexibility & Mobility
+    "y-balance-reach": (f"{HRF}/Balance & Proprioception/Y-BalanceReachTest.py", _y_balance),
+    "sit-and-reach": (f"{HRF}/Flexibility & Mobility/sit&reach.py", _sit_and_reach),
+    "fms": (f"{HRF}/Flexibility & Mobility/FMS.py", _fms),
+    "joint-rom": (f"{HRF}/Flexibility & Mobility/Joint-SpecificROM.py", _joint_rom),
+
+    # Muscular Strength & Endurance
+    "one-rm": (f"{HRF}/Muscular Strength & Endurance/1RM.py", _one_rm),
+    "handheld-dynamometry": (f"{HRF}/Muscular Strength & Endurance/HandheldDynamometry", _dynamometry),
+    "imtp-peak-force": (f"{HRF}/Muscular Strength & Endurance/IMTP.py", _imtp),
+    "imtp-force-trace": (f"{HRF}/Muscular Strength & Endurance/IMTP.py", _imtp_force_trace),
+    "push-up-endurance": (f"{HRF}/Muscular Strength & Endurance/Push-UpEndurance.py", _pushup),
+    "plank-hold": (f"{HRF}/Muscular Strength & Endurance/plankhold.py", _plank),
+
+    # Neuromuscular Readiness
+    "daily-readiness": (f"{SKILL}/Neuromuscular Readiness/DailyReadinessAssessment.py", _daily_readiness),
+
+    # Functional Fitness Simulation
+    "custom-obstacle-circuit": (f"{SKILL}/Functional Fitness Simulation/CustomObstacleCircuit.py", _custom_circuit),
+    "ioct": (f"{SKILL}/Functional Fitness Simulation/IOCT.py", _ioct),
+
+    # Reaction, Coordination & Reflex
+    "simple-reaction-time": (f"{SKILL}/Reaction, Coordination & Reflex/SimpleReactionTime.py", _reaction_time),
+    "vestibulo-ocular-reflex": (f"{SKILL}/Reaction, Coordination & Reflex/Vestibulo-OcularReflex.py", _vor),
+    "h-reflex": (f"{SKILL}/Reaction, Coordination & Reflex/H-reflex.py", _h_reflex),
+    "dtr": (f"{SKILL}/Reaction, Coordination & Reflex/DTR.py", _dtr),
+
+    # Speed, Acceleration & Agility
+    "agility-505": (f"{SKILL}/Speed, Acceleration & Agility/505agility.py", _agility_505),
+    "illinois-agility": (f"{SKILL}/Speed, Acceleration & Agility/IllinoisAgilityTest.py", _illinois),
+    "t-test": (f"{SKILL}/Speed, Acceleration & Agility/T-Test.py", _t_test),
+    "timing-gates": (f"{SKILL}/Speed, Acceleration & Agility/Timing Gates", _timing_gates),
+    "timing-gates-stream": (f"{SKILL}/Speed, Acceleration & Agility/Timing Gates", _timing_gates_stream),
+    "yoyo-ir": (f"{SKILL}/Speed, Acceleration & Agility/Yo-YoIR.py", _yoyo),
+    "yoyo-ir-level": (f"{SKILL}/Speed, Acceleration & Agility/Yo-YoIR.py", _yoyo_level),
+    "max-runup-speed": (f"{SKILL}/Speed, Acceleration & Agility/maxRunupspeed.py", _max_runup_speed),
+
+    # Anaerobic & Power
+    "vertical-jump": (f"{SKILL}/Anaerobic & Power/VerticalJump.py", _vertical_jump),
+    "jump-force-trace": (f"{SKILL}/Anaerobic & Power/VerticalJump.py", _jump_force_trace),
+    "broad-jump": (f"{SKILL}/Anaerobic & Power/BroadJump.py", _broad_jump),
+    "time-to-peak-force": (f"{SKILL}/Anaerobic & Power/Time-to-PeakForce.py", _time_to_peak_force),
+    "wingate": (f"{SKILL}/Anaerobic & Power/WingateAnaerobicTest,py", _wingate),
+    "flight-test": (f"{SKILL}/Anaerobic & Power/Flighttest.py", _flight_test),
+
+    # Mental Neural Training
+    "mental-drill": ("MentalNeuralTraining/script.py", _mental_drill),
+}
+
+
+class UnknownTest(LookupError):
+    pass
+
+
+class Calculator:
+    """
+    A testId's calculation. The owning script is imported the first time the
+    calculator is called (or its module is asked for), not when the registry
+    is built, so a process only pays for the tests it actually runs.
+    """
+
+    __slots__ = ("test_id", "script", "adapter", "_module")
+
+    def __init__(self, test_id, script, adapter):
+        self.test_id = test_id
+        self.script = script
+        self.adapter = adapter
+        self._module = None
+
+    @property
+    def module(self):
+        if self._module is None:
+            self._module = load_script(self.script)
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __call__(self, inputs, meta=None):
+        return self.adapter(self.module, input_values(inputs), meta or {})
+
+    def __repr__(self):
+        return f"<Calculator {self.test_id} ({self.script}{'' if self.loaded else ', not loaded'})>"
+
+
+REGISTRY = {test_id: Calculator(test_id, script, adapter) for test_id, (script, adapter) in CALCULATORS.items()}
+
+
+def calculator(test_id):
+    """Return the Calculator for a testId, e.g. ``calculator("yoyo-ir").module.calculate_yoyo_ir``."""
+    try:
+        return REGISTRY[test_id]
+    except KeyError:
+        raise UnknownTest(f"No python calculator mapped for testId {test_id}") from None
+
+
+def load_all():
+    """Import every script in the registry up front."""
+    for calc in REGISTRY.values():
+        calc.module
+
+
+def run_test(test_id, inputs, meta=None):
+    """Run one calculation and return its result dict."""
+    return calculator(test_id)(inputs, meta)
@@ -0,0 +1,117 @@
+"""
+Column-wise (NumPy) versions of the body-composition equations.
+
+Each function takes arrays with one element per athlete and returns arrays,
+so a historical database can be re-scored in one call when an equation or
+constant changes. Results match the scalar functions in
+``Health-Related Fitness/Body Composition & Anthropometry`` to within float
+tolerance. Where a scalar function returns ``None`` the column holds NaN.
+
+Sex columns hold ``"male"``/``"female"`` strings (any case), as accepted by
+the scalar functions.
+"""
+import numpy as np
+
+
+def _sex_masks(sex, size):
+    """Return boolean (male, female) masks for a sex column or a single value."""
+    values = np.asarray(sex)
+    if values.ndim == 0:
+        label = str(values).lower()
+        return np.full(size, label == "male"), np.full(size, label == "female")
+
+    # Lower-case only the distinct labels, not every row
+    labels, inverse = np.unique(values, return_inverse=True)
+    lowered = np.array([str(label).lower() for label in labels])
+    return (lowered == "male")[inverse], (lowered == "female")[inverse]
+
+
+def _body_density(total, age, sex, male_coefs, female_coefs):
+    total = np.asarray(total, dtype=float)
+    age = np.asarray(age, dtype=float)
+    size = np.broadcast(total, age).size
+    male, female = _sex_masks(sex, size)
+    if not np.all(male | female):
+        raise ValueError("Sex must be 'male' or 'female'")
+
+    # Pick per-row coefficients, then evaluate the quadratic once for everyone
+    c0, c1, c2, c3 = (np.where(male, m, f) for m, f in zip(male_coefs, female_coefs))
+    return c0 - (c1 * total) + (c2 * (total ** 2)) - (c3 * age)
+
+
+def body_density_7site(sum7, age, sex="male"):
+    """Vectorised ``skinfold.body_density_7site``."""
+    return _body_density(sum7, age, sex,
+                         (1.112, 0.00043499, 0.00000055, 0.00028826),
+                         (1.097, 0.00046971, 0.00000056, 0.00012828))
+
+
+def body_density_8site(sum8, age, sex="male"):
+    """Vectorised ``Skinfold8.body_density_8site``."""
+    return _body_density(sum8, age, sex,
+                         (1.112, 0.00043499, 0.00000055, 0.00028826),
+                         (1.097, 0.00046971, 0.00000056, 0.00012828))
+
+
+def body_fat_percent(body_density):
+    """Vectorised Siri equation (``skinfold.body_fat_percent``)."""
+    return (495 / np.asarray(body_density, dtype=float)) - 450
+
+
+def us_navy_bodyfat(sex, waist, neck, hip=None, height=None):
+    """
+    Vectorised ``Girth.us_navy_bodyfat``.
+
+    Rows without a height (missing, NaN or 0), females without a hip girth,
+    unknown sexes and girths that make the logarithm undefined give NaN.
+    """
+    waist = np.asarray(waist, dtype=float)
+    neck = np.asarray(neck, dtype=float)
+    hip = np.full(waist.shape, np.nan) if hip is None else np.asarray(hip, dtype=float)
+    height = np.full(waist.shape, np.nan) if height is None else np.asarray(height, dtype=float)
+    size = np.broadcast(waist, neck, hip, height).size
+    male, female = _sex_masks(sex, size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_height = np.log10(np.where(height > 0, height, np.nan))
+        male_bf = 86.010 * np.log10(waist - neck) - 70.041 * log_height + 36.76
+        female_bf = 163.205 * np.log10(waist + hip - neck) - 97.684 * log_height - 78.387
+
+    return np.where(male, male_bf, np.where(female, female_bf, np.nan))
+
+
+def calculate_bia(impedance, body_fat_percent, muscle_mass, height=None):
+    """
+    Vectorised ``BIA.calculate_bia``.
+
+    Returns a dict of columns with the same keys (and rounding) as the scalar
+    function. "FFMI" is included when a height column is given; rows with a
+    missing or zero height hold NaN.
+    """
+    impedance = np.asarray(impedance, dtype=float)
+    bf = np.asarray(body_fat_percent, dtype=float)
+    muscle_mass = np.asarray(muscle_mass, dtype=float)
+
+    lean_mass_est = muscle_mass * 1.1
+    fat_mass_est = (bf / (100 - bf)) * lean_mass_est
+    weight_est = lean_mass_est + fat_mass_est
+
+    fat_mass = (bf / 100) * weight_est
+    lean_mass = weight_est - fat_mass
+
+    result = {
+        "Impedance (Ω)": impedance,
+        "Estimated Weight (kg)": np.round(weight_est, 2),
+        "Fat Mass (kg)": np.round(fat_mass, 2),
+        "Lean Mass (kg)": np.round(lean_mass, 2),
+        "Muscle Mass (kg)": np.round(muscle_mass, 2),
+        "Body Fat %": np.round(bf, 1),
+    }
+
+    if height is not None:
+        height_m = np.asarray(height, dtype=float) / 100
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ffmi = lean_mass / np.where(height_m > 0, height_m, np.nan) ** 2
+        result["FFMI"] = np.round(ffmi, 2)
+
+    return result
@@ -0,0 +1,28 @@
+"""
+Typed durations ("mm:ss", "h:mm:ss" or seconds) for the hand-entered test
+records. Plain Python, so the single-value scripts load without NumPy.
+"""
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def duration_seconds(value):
+    """
+    Seconds from a number or an "mm:ss" / "h:mm:ss" string; None when empty
+    or not in one of those forms (free text such as "2 min" is left to the
+    caller to keep as typed).
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    total = 0.0
+    try:
+        for part in str(value).strip().split(":"):
+            total = total * 60 + float(part)
+    except ValueError:
+        return None
+    return total
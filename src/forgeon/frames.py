@@ -0,0 +1,143 @@
+"""
+Binary framing for requests that carry large numeric arrays.
+
+Force traces and breath-by-breath files are millions of floats; sending them
+as JSON text means formatting and parsing every number on both sides. A
+frame instead carries a small JSON header and the arrays as raw bytes:
+
+    uint32 LE   header length (bytes)
+    uint64 LE   payload length (bytes)
+    header      UTF-8 JSON: a worker request plus an "arrays" list
+    payload     the inline arrays, back to back
+
+Each ``"arrays"`` entry names the input it fills and its layout:
+
+    {"name": "force", "dtype": "f8", "length": 48000}
+    {"name": "force_traces", "dtype": "f4", "shape": [6, 8000]}
+    {"name": "force", "dtype": "f8", "length": 48000, "path": "/dev/shm/trace-17", "offset": 0}
+
+Inline arrays are read in order from the payload and wrapped with
+``numpy.frombuffer``, so they are not copied again after being read. An entry
+with a ``"path"`` (a temp file, or a POSIX shared-memory object under
+``/dev/shm``) is not in the payload at all: the file is memory-mapped read
+only. Dtypes are little-endian; ``dtype`` is one of DTYPES.
+
+Replies are frames with an empty payload whose header is the usual worker
+reply.
+"""
+import json
+import struct
+
+import numpy as np
+
+PREFIX = struct.Struct("<IQ")
+DTYPES = {"f8": "<f8", "f4": "<f4", "i4": "<i4", "i2": "<i2", "u2": "<u2"}
+MAX_HEADER = 16 * 1024 * 1024
+
+
+class FrameError(ValueError):
+    pass
+
+
+def _read_exactly(stream, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    got = 0
+    while got < size:
+        n = stream.readinto(view[got:])
+        if not n:
+            raise FrameError(f"Stream ended {size - got} bytes into a {size}-byte frame section")
+        got += n
+    return buffer
+
+
+def read_frame(stream):
+    """
+    Read one frame from a binary stream.
+
+    Returns:
+        (header dict, payload bytearray), or None at a clean end of stream
+    """
+    prefix = stream.read(PREFIX.size)
+    if not prefix:
+        return None
+    if len(prefix) < PREFIX.size:
+        raise FrameError("Stream ended inside a frame prefix")
+    header_len, payload_len = PREFIX.unpack(prefix)
+    if header_len > MAX_HEADER:
+        raise FrameError(f"Frame header of {header_len} bytes exceeds the {MAX_HEADER}-byte limit")
+    header = json.loads(_read_exactly(stream, header_len))
+    payload = _read_exactly(stream, payload_len) if payload_len else bytearray()
+    if not isinstance(header, dict):
+        raise FrameError("A frame header must be a JSON object")
+    return header, payload
+
+
+def encode_frame(header, arrays=()):
+    """Build a frame; `arrays` are (name, ndarray) pairs sent inline."""
+    specs = []
+    chunks = []
+    for name, array in arrays:
+        array = np.asarray(array)
+        code = next((c for c, d in DTYPES.items() if np.dtype(d) == array.dtype.newbyteorder("<")), None)
+        if code is None:
+            raise FrameError(f"Array '{name}' has unsupported dtype {array.dtype}")
+        array = np.ascontiguousarray(array, dtype=DTYPES[code])
+        specs.append({"name": name, "dtype": code, "shape": list(array.shape)})
+        chunks.append(array.tobytes())
+    if specs:
+        header = {**header, "arrays": header.get("arrays", []) + specs}
+    head = json.dumps(header).encode("utf-8")
+    payload = b"".join(chunks)
+    return PREFIX.pack(len(head), len(payload)) + head + payload
+
+
+def encode_text_frame(text):
+    """Frame an already serialised JSON header with no payload (worker replies)."""
+    head = text.encode("utf-8")
+    return PREFIX.pack(len(head), 0) + head
+
+
+def _shape(spec):
+    if "shape" in spec:
+        return tuple(int(n) for n in spec["shape"])
+    return (int(spec["length"]),)
+
+
+def attach_arrays(header, payload):
+    """
+    Turn a request header and payload into a worker request whose inputs
+    hold the frame's arrays as NumPy arrays.
+    """
+    specs = header.pop("arrays", None) or []
+    inputs = header.get("inputs")
+    if inputs is None:
+        inputs = header["inputs"] = {}
+    elif isinstance(inputs, list):
+        if not all(isinstance(item, dict) and "id" in item for item in inputs):
+            raise FrameError('Each item of a list of inputs needs an "id"')
+        inputs = header["inputs"] = {item["id"]: item.get("value") for item in inputs}
+    elif not isinstance(inputs, dict):
+        raise FrameError("Frame inputs must be an object or a list of {id, value} items")
+
+    view = memoryview(payload)
+    position = 0
+    for spec in specs:
+        try:
+            dtype = np.dtype(DTYPES[spec.get("dtype", "f8")])
+        except KeyError:
+            raise FrameError(f"Unsupported dtype '{spec.get('dtype')}' for array '{spec.get('name')}'") from None
+        shape = _shape(spec)
+        count = int(np.prod(shape))
+        if "path" in spec:
+            array = np.memmap(spec["path"], dtype=dtype, mode="r", offset=int(spec.get("offset", 0)), shape=shape)
+        else:
+            size = count * dtype.itemsize
+            if position + size > len(view):
+                raise FrameError(f"Array '{spec['name']}' runs past the end of the frame payload")
+            array = np.frombuffer(view[position:position + size], dtype=dtype).reshape(shape)
+            position += size
+        inputs[spec["name"]] = array
+    if position != len(view):
+        raise FrameError(f"{len(view) - position} payload bytes are not described by the header's arrays")
+    return header
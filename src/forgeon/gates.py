@@ -0,0 +1,360 @@
+"""
+Timing-gate event stream processor.
+
+Gate systems report one event per beam break: ``(lane, gate, time)``. The
+stream assigns each break to an attempt and each attempt to the next athlete
+queued in that lane, then derives splits, flying-zone max speed and 505
+times as the breaks arrive:
+
+    stream = GateStream([Lane("A", distances=(0, 10, 20, 30), flying_zone=(2, 3)),
+                         Lane("B", distances=(0,), mode="505")])
+    stream.queue("A", "athlete-1")
+    stream.queue("B", "athlete-2", side="left")
+    for lane, gate, t in events:
+        for result in stream.push(lane, gate, t):
+            ...
+    stream.flush()
+
+Breaks of the same gate within ``debounce`` seconds are one crossing (a
+double break from an arm or leg; the earliest time is kept). Breaks may
+arrive out of order: each is matched against the few attempts still open in
+its lane (at most ``max_open``), so the cost per event stays constant however
+many athletes run. An attempt finishes when every gate has been crossed, or
+is reported incomplete once ``max_attempt_s`` has passed since it started.
+
+Finished attempts are handed back from ``push`` and ``flush`` (and to
+``on_result``) and not kept, so a stream can run for a whole session; only
+each athlete's bests are held for ``athlete_summary``. Attempts started when
+nobody was queued in the lane are reported with no athlete and counted in
+``unassigned``; they add to nobody's bests.
+"""
+from collections import deque
+
+from forgeon.calculators import SKILL, load_script
+
+AGILITY = f"{SKILL}/Speed, Acceleration & Agility"
+
+
+class Lane:
+    """
+    Gate layout of one lane.
+
+    mode "sprint": gates at `distances` (m from the start line), gate 0 is
+        the start; flying_zone is a (from_gate, to_gate) pair whose split is
+        reported as max speed.
+    mode "505": one gate passed on the way in and again on the way out; the
+        attempt time is between the two passes.
+    """
+
+    __slots__ = ("name", "mode", "distances", "flying_zone", "slots")
+
+    def __init__(self, name, distances=(0, 5, 10, 30), mode="sprint", flying_zone=None):
+        if mode not in ("sprint", "505"):
+            raise ValueError("Lane mode must be 'sprint' or '505'.")
+        distances = tuple(float(d) for d in distances)
+        if mode == "sprint":
+            if len(distances) < 2 or any(b <= a for a, b in zip(distances, distances[1:])):
+                raise ValueError("A sprint lane needs two or more gates at increasing distances.")
+            if flying_zone is not None:
+                a, b = flying_zone
+                if not 0 <= a < b < len(distances):
+                    raise ValueError("Flying zone must be two gate indices in running order.")
+                flying_zone = (a, b)
+        self.name = name
+        self.mode = mode
+        self.distances = distances
+        self.flying_zone = flying_zone
+        self.slots = len(distances) if mode == "sprint" else 2
+
+
+class Attempt:
+    __slots__ = ("lane", "number", "athlete", "side", "times", "first")
+
+    def __init__(self, lane, slot, time):
+        self.lane = lane
+        self.number = None
+        self.athlete = None
+        self.side = None
+        self.times = [None] * lane.slots
+        self.times[slot] = time
+        self.first = time
+
+    @property
+    def complete(self):
+        return None not in self.times
+
+    def repeats(self, slot, time, debounce):
+        """Whether a break is a repeat of a crossing already recorded here."""
+        times = self.times if self.lane.mode == "505" else (self.times[slot],)
+        return any(t is not None and abs(time - t) <= debounce for t in times)
+
+    def place(self, slot, time, debounce, max_attempt_s):
+        """
+        Try to record a break in this attempt.
+
+        Returns "placed", "double" (a repeat break, absorbed) or None if the
+        break cannot belong to this attempt.
+        """
+        if abs(time - self.first) > max_attempt_s:
+            return None
+        times = self.times
+        if self.lane.mode == "505":
+            return self._place_505(time, debounce)
+
+        if times[slot] is not None:
+            if abs(time - times[slot]) <= debounce:
+                times[slot] = min(times[slot], time)
+                self.first = min(self.first, time)
+                return "double"
+            return None
+        # Gates are crossed in order, so the break must fall between its neighbours' times
+        if any(t is not None and t >= time for t in times[:slot]):
+            return None
+        if any(t is not None and t <= time for t in times[slot + 1:]):
+            return None
+        times[slot] = time
+        self.first = min(self.first, time)
+        return "placed"
+
+    def _place_505(self, time, debounce):
+        times = self.times
+        for i, t in enumerate(times):
+            if t is not None and abs(time - t) <= debounce:
+                times[i] = min(t, time)
+                self.first = times[0]
+                return "double"
+        if times[1] is not None:
+            return None
+        if time > times[0]:
+            times[1] = time
+        else:  # the outbound pass arrived first
+            times[0], times[1] = time, times[0]
+            self.first = time
+        return "placed"
+
+
+def _new_bests():
+    return {"attempts": 0, "total": {}, "max_speed": None, "left": None, "right": None}
+
+
+class GateStream:
+    """
+    Incremental timing-gate processor for several lanes at once.
+
+    Parameters:
+        lanes (iterable of Lane): gate layouts, by lane name
+        debounce (float): seconds within which repeat breaks of a gate are one crossing
+        max_attempt_s (float): longest an attempt may take
+        max_open (int): attempts kept open per lane for late (out-of-order) breaks
+        on_result (callable, optional): called with each finished attempt's result
+    """
+
+    def __init__(self, lanes, debounce=0.3, max_attempt_s=20.0, max_open=4, on_result=None):
+        self.lanes = {lane.name: lane for lane in lanes}
+        self.debounce = debounce
+        self.max_attempt_s = max_attempt_s
+        self.max_open = max_open
+        self.on_result = on_result
+        self.open = {name: [] for name in self.lanes}  # by start time
+        self.closed = {name: deque(maxlen=max_open) for name in self.lanes}  # recently finished
+        self.queues = {name: deque() for name in self.lanes}
+        self.attempt_counts = {name: 0 for name in self.lanes}
+        self.latest = {name: float("-inf") for name in self.lanes}
+        self.athletes = {}
+        self.unassigned = 0
+        self.double_breaks = 0
+        self.dropped = 0
+        self._max_speed = load_script(f"{AGILITY}/maxRunupspeed.py").calculate_max_speed
+        self._calculate_505 = load_script(f"{AGILITY}/505agility.py").calculate_505_test
+
+    def queue(self, lane, athlete, side=None):
+        """Queue the athlete who runs next in a lane (side: 'left'/'right' turn for 505 lanes)."""
+        if lane not in self.lanes:
+            raise ValueError(f"Unknown lane '{lane}'")
+        self.queues[lane].append((athlete, side))
+
+    def push(self, lane, gate, time):
+        """Record one beam break; returns the results of any attempts it finished."""
+        layout = self.lanes.get(lane)
+        if layout is None:
+            raise ValueError(f"Unknown lane '{lane}'")
+        if layout.mode == "505":
+            if gate != 0:
+                raise ValueError("A 505 lane has a single gate (0).")
+            slot = 0
+        else:
+            if not 0 <= gate < layout.slots:
+                raise ValueError(f"Lane '{lane}' has no gate {gate}")
+            slot = gate
+
+        finished = []
+        attempts = self.open[lane]
+        self.latest[lane] = max(self.latest[lane], time)
+        while attempts and self.latest[lane] - attempts[0].first > self.max_attempt_s:
+            finished.append(self._finish(attempts.pop(0)))
+        if time < self.latest[lane] - self.max_attempt_s:
+            self.dropped += 1  # too late to belong to any open attempt
+            return finished
+
+        for i, attempt in enumerate(attempts):
+            placed = attempt.place(slot, time, self.debounce, self.max_attempt_s)
+            if placed == "double":
+                self.double_breaks += 1
+                return finished
+            if placed:
+                if attempt.complete:
+                    finished.append(self._finish(attempts.pop(i)))
+                return finished
+        # A repeat break can arrive after the attempt it belongs to has finished
+        for attempt in self.closed[lane]:
+            if attempt.repeats(slot, time, self.debounce):
+                self.double_breaks += 1
+                return finished
+
+        self._open(layout, Attempt(layout, slot, time))
+        if len(attempts) > self.max_open:
+            finished.append(self._finish(attempts.pop(0)))
+        return finished
+
+    def _open(self, layout, attempt):
+        attempts = self.open[layout.name]
+        pos = len(attempts)
+        while pos and attempts[pos - 1].first > attempt.first:
+            pos -= 1
+        attempts.insert(pos, attempt)
+
+        # Athletes run in queue order, so hand out assignments by start time:
+        # an attempt that starts before later-opened ones takes over their athletes
+        queue = self.queues[layout.name]
+        entry = queue.popleft() if queue else (None, None)
+        self.attempt_counts[layout.name] += 1
+        number = self.attempt_counts[layout.name]
+        for later in attempts[pos + 1:][::-1]:
+            (later.athlete, later.side), entry = entry, (later.athlete, later.side)
+            later.number, number = number, later.number
+        attempt.athlete, attempt.side = entry
+        attempt.number = number
+
+    def flush(self):
+        """Finish every open attempt (complete or not); returns their results."""
+        finished = []
+        for attempts in self.open.values():
+            while attempts:
+                finished.append(self._finish(attempts.pop(0)))
+        return finished
+
+    def _finish(self, attempt):
+        layout = attempt.lane
+        self.closed[layout.name].append(attempt)
+        result = {
+            "Lane": layout.name,
+            "Attempt": attempt.number,
+            "Athlete": attempt.athlete,
+            "Complete": attempt.complete,
+        }
+        if layout.mode == "505":
+            self._finish_505(attempt, result)
+        else:
+            self._finish_sprint(attempt, result)
+        if self.on_result:
+            self.on_result(result)
+        return result
+
+    def _bests(self, athlete):
+        """The athlete's running bests, or a scratch record if nobody was queued."""
+        if athlete is None:
+            self.unassigned += 1
+            return _new_bests()
+        bests = self.athletes.get(athlete)
+        if bests is None:
+            bests = self.athletes[athlete] = _new_bests()
+        bests["attempts"] += 1
+        return bests
+
+    def _finish_sprint(self, attempt, result):
+        layout, times = attempt.lane, attempt.times
+        t0 = times[0]
+        splits = []
+        for i in range(1, layout.slots):
+            if times[i] is None:
+                continue
+            split = times[i] - times[i - 1] if times[i - 1] is not None else None
+            splits.append({
+                "gate": f"{layout.distances[i] - layout.distances[0]:g}m",
+                "time": round(times[i] - t0, 3) if t0 is not None else None,
+                "split": round(split, 3) if split is not None else None,
+                "velocity": round((layout.distances[i] - layout.distances[i - 1]) / split, 2) if split else None,
+            })
+        result["distances"] = splits
+        total = times[-1] - t0 if t0 is not None and times[-1] is not None else None
+        result["totalTime"] = round(total, 3) if total is not None else None
+
+        bests = self._bests(attempt.athlete)
+        if total is not None:
+            best = bests["total"].get(layout.name)
+            bests["total"][layout.name] = total if best is None else min(best, total)
+        if layout.flying_zone:
+            a, b = layout.flying_zone
+            if times[a] is not None and times[b] is not None:
+                speed = self._max_speed(layout.distances[b] - layout.distances[a], times[b] - times[a])
+                result.update(speed)
+                best = bests["max_speed"]
+                if best is None or speed["Max Speed (m/s)"] > best["Max Speed (m/s)"]:
+                    bests["max_speed"] = speed
+
+    def _finish_505(self, attempt, result):
+        result["Side"] = attempt.side
+        time_in, time_out = attempt.times
+        duration = time_out - time_in if time_out is not None else None
+        result["505 Time (s)"] = round(duration, 2) if duration is not None else None
+
+        bests = self._bests(attempt.athlete)
+        side = (attempt.side or "").lower()
+        if duration is not None and side in ("left", "right"):
+            best = bests[side]
+            bests[side] = duration if best is None else min(best, duration)
+
+    def athlete_summary(self, athlete):
+        """Best results so far for one athlete."""
+        bests = self.athletes.get(athlete)
+        if bests is None:
+            return None
+        summary = {"Athlete": athlete, "Attempts": bests["attempts"]}
+        for lane, total in bests["total"].items():
+            summary[f"Best Time {lane} (s)"] = round(total, 3)
+        if bests["max_speed"]:
+            summary.update(bests["max_speed"])
+        if bests["left"] is not None:
+            summary.update(self._calculate_505(bests["left"], bests["right"]))
+        elif bests["right"] is not None:
+            summary["Right Turn Time (s)"] = round(bests["right"], 2)
+        return summary
+
+
+def process_events(lanes, events, queue=(), **kwargs):
+    """
+    Run a recorded session through a GateStream.
+
+    Parameters:
+        lanes (list of dict): {"name", "distances", "mode", "flying_zone"}
+        events (iterable): {"lane", "gate", "time"} breaks, in arrival order
+        queue (iterable): {"lane", "athlete", "side"} in running order
+
+    Returns:
+        dict: every attempt, a summary per queued athlete and counters
+            (attempts nobody was queued for, double breaks, dropped events)
+    """
+    stream = GateStream([Lane(**lane) for lane in lanes], **kwargs)
+    for entry in queue:
+        stream.queue(entry["lane"], entry["athlete"], entry.get("side"))
+    results = []
+    for event in events:
+        results.extend(stream.push(event["lane"], int(event["gate"]), float(event["time"])))
+    results.extend(stream.flush())
+    return {
+        "Attempts": results,
+        "Athletes": [stream.athlete_summary(a) for a in stream.athletes],
+        "Unassigned Attempts": stream.unassigned,
+        "Double Breaks": stream.double_breaks,
+        "Dropped Events": stream.dropped,
+    }
@@ -0,0 +1,255 @@
+"""
+Heart-rate stream analytics for the field endurance tests.
+
+Takes a 1 Hz heart-rate trace (``time``, ``hr``) or beat-to-beat RR
+intervals (ms) and returns one summary per athlete:
+
+    Max HR (bpm)              highest 5 s rolling mean, so a single bad beat
+                              cannot set it
+    Time in Zone (s)          seconds in each %HRmax zone (ZONES)
+    HRR 60 s / HRR 120 s      drop in HR 60 and 120 s after the end of
+                              exercise (bpm)
+    RMSSD / SDNN / pNN50      HRV from RR intervals (None for a 1 Hz trace)
+
+Cleaning, all with rolling windows over whole arrays: values outside
+30-230 bpm (or 300-2000 ms) are dropped, as is any sample more than
+``spike_bpm`` from the 5-sample rolling median (RR: more than 20% from it).
+Gaps of up to ``max_gap_s`` are bridged by linear interpolation onto the 1 Hz
+grid; longer gaps stay empty and are left out of every figure.
+
+``attach`` adds a summary to the matching test result under ``"Heart
+Rate"``; ``squad_file`` summarises a whole squad upload in one call.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+HR_RANGE = (30.0, 230.0)
+RR_RANGE = (300.0, 2000.0)
+ZONES = (("Z1", 50, 60), ("Z2", 60, 70), ("Z3", 70, 80), ("Z4", 80, 90), ("Z5", 90, 101))
+
+
+def rolling_median(values, window=5):
+    half = window // 2
+    return np.median(sliding_window_view(np.pad(values, half, mode="edge"), window), axis=1)
+
+
+def rolling_mean(values, window=5):
+    """Centred mean ignoring NaN; NaN where the whole window is empty."""
+    valid = np.isfinite(values)
+    half = window // 2
+    cum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    cnt = np.concatenate(([0], np.cumsum(valid)))
+    idx = np.arange(len(values))
+    lo = np.maximum(idx - half, 0)
+    hi = np.minimum(idx + half + 1, len(values))
+    n = cnt[hi] - cnt[lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n > 0, (cum[hi] - cum[lo]) / n, np.nan)
+
+
+def clean_hr(time, hr, spike_bpm=20.0, max_gap_s=5.0):
+    """
+    Clean a heart-rate trace and put it on a 1 Hz grid.
+
+    Returns:
+        (seconds since the first sample, bpm with NaN in long gaps, samples rejected)
+    """
+    time = np.asarray(time, dtype=np.float64)
+    hr = np.asarray(hr, dtype=np.float64)
+    order = np.argsort(time, kind="stable")
+    time, hr = time[order], hr[order]
+    ok = np.isfinite(time) & np.isfinite(hr) & (hr >= HR_RANGE[0]) & (hr <= HR_RANGE[1])
+    if ok.sum() >= 5:
+        ok[ok] &= np.abs(hr[ok] - rolling_median(hr[ok])) <= spike_bpm
+    rejected = int(len(hr) - ok.sum())
+    time, hr = time[ok], hr[ok]
+    if len(time) < 2:
+        raise ValueError("Too few valid heart-rate samples.")
+
+    grid = np.arange(0.0, np.floor(time[-1] - time[0]) + 1)
+    values = np.interp(grid, time - time[0], hr)
+    # Blank grid points that fall inside a gap longer than max_gap_s
+    gap_end = np.searchsorted(time - time[0], grid, side="left")
+    gap_end = np.clip(gap_end, 1, len(time) - 1)
+    gap = np.diff(time)[gap_end - 1]
+    values[gap > max_gap_s] = np.nan
+    return grid, values, rejected
+
+
+def clean_rr(rr, tolerance=0.2):
+    """Drop RR intervals (ms) out of range or more than `tolerance` from the 5-beat rolling median."""
+    rr = np.asarray(rr, dtype=np.float64)
+    ok = np.isfinite(rr) & (rr >= RR_RANGE[0]) & (rr <= RR_RANGE[1])
+    if ok.sum() >= 5:
+        ok[ok] &= np.abs(rr[ok] - rolling_median(rr[ok])) <= tolerance * rolling_median(rr[ok])
+    return ok
+
+
+def hrv(rr, ok=None):
+    """RMSSD, SDNN and pNN50 from RR intervals (ms), using only clean successive pairs."""
+    rr = np.asarray(rr, dtype=np.float64)
+    ok = clean_rr(rr) if ok is None else ok
+    pairs = ok[1:] & ok[:-1]
+    diffs = np.diff(rr)[pairs]
+    good = rr[ok]
+    if len(diffs) < 2:
+        return {"RMSSD (ms)": None, "SDNN (ms)": None, "pNN50 (%)": None}
+    return {
+        "RMSSD (ms)": round(float(np.sqrt(np.mean(diffs ** 2))), 1),
+        "SDNN (ms)": round(float(np.std(good, ddof=1)), 1),
+        "pNN50 (%)": round(float(np.mean(np.abs(diffs) > 50) * 100), 1),
+    }
+
+
+def _rr_to_hr(rr, ok):
+    """Beat times and instantaneous HR from RR intervals, clean beats only."""
+    beat_time = np.cumsum(rr) / 1000.0
+    return beat_time[ok], 60000.0 / rr[ok]
+
+
+def summarize(time=None, hr=None, rr=None, hr_max=None, exercise_end=None, spike_bpm=20.0, max_gap_s=5.0):
+    """
+    Heart-rate summary for one athlete.
+
+    Parameters:
+        time, hr (array): 1 Hz trace, seconds and bpm (time may be omitted for 1 Hz)
+        rr (array): RR intervals in ms, instead of (or as well as) hr
+        hr_max (float, optional): Zone reference; defaults to the measured max HR
+        exercise_end (float, optional): Seconds from the start of the trace when
+            exercise stopped; defaults to the time of max HR
+
+    Returns:
+        dict
+    """
+    summary = {}
+    rr_ok = None
+    if rr is not None:
+        rr = np.asarray(rr, dtype=np.float64)
+        rr_ok = clean_rr(rr)
+        summary.update(hrv(rr, rr_ok))
+        summary["Beats Rejected"] = int(len(rr) - rr_ok.sum())
+    if hr is None:
+        if rr is None:
+            raise ValueError("Provide a heart-rate trace or RR intervals.")
+        time, hr = _rr_to_hr(rr, rr_ok)
+    elif time is None:
+        time = np.arange(len(hr), dtype=np.float64)
+
+    seconds, bpm, rejected = clean_hr(time, hr, spike_bpm, max_gap_s)
+    smooth = rolling_mean(bpm)
+    if not np.isfinite(smooth).any():
+        raise ValueError("No usable heart-rate data after cleaning.")
+    peak_at = int(np.nanargmax(smooth))
+    max_hr = float(smooth[peak_at])
+    reference = hr_max or max_hr
+
+    percent = bpm / reference * 100
+    valid = np.isfinite(percent)
+    zones = {name: int(np.count_nonzero(valid & (percent >= lo) & (percent < hi))) for name, lo, hi in ZONES}
+
+    end = peak_at if exercise_end is None else int(round(exercise_end))
+
+    def recovery(after):
+        if end + after >= len(smooth) or not np.isfinite(smooth[end]) or not np.isfinite(smooth[end + after]):
+            return None
+        return round(float(smooth[end] - smooth[end + after]), 1)
+
+    summary.update({
+        "Max HR (bpm)": int(round(max_hr)),
+        "Mean HR (bpm)": int(round(float(np.nanmean(bpm)))),
+        "Time in Zone (s)": zones,
+        "HRR 60 s (bpm)": recovery(60),
+        "HRR 120 s (bpm)": recovery(120),
+        "Duration (s)": int(len(seconds)),
+        "Samples Rejected": rejected,
+    })
+    summary.setdefault("RMSSD (ms)", None)
+    summary.setdefault("SDNN (ms)", None)
+    summary.setdefault("pNN50 (%)", None)
+    return summary
+
+
+def attach(results, summaries, key="Athlete"):
+    """
+    Add each athlete's summary to their test result under "Heart Rate".
+
+    Parameters:
+        results (dict or list of dict): test results carrying `key`
+        summaries (dict): {athlete: summary}
+
+    Returns:
+        the results, updated in place
+    """
+    for result in [results] if isinstance(results, dict) else results:
+        summary = summaries.get(result.get(key))
+        if summary is not None:
+            attach_summary(result, summary)
+    return results
+
+
+def attach_summary(result, summary):
+    """Add one summary to one test result; returns the result."""
+    result["Heart Rate"] = summary
+    # The IFT result has its own max HR field, left empty when not typed in
+    if result.get("Max Heart Rate") == "Not provided" and "Max HR (bpm)" in summary:
+        result["Max Heart Rate"] = summary["Max HR (bpm)"]
+    return result
+
+
+def squad_file(path, chunk_rows=100000, **kwargs):
+    """
+    Summaries for a squad upload: a CSV with columns athlete plus either
+    time and hr (1 Hz) or rr (ms, in beat order).
+
+    Returns:
+        dict: {athlete: summary or {"Error": message}}
+    """
+    import csv
+
+    columns = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        fields = set(reader.fieldnames or ())
+        if "athlete" not in fields or not ({"hr"} <= fields or {"rr"} <= fields):
+            raise ValueError("Heart-rate file needs an athlete column and hr (with time) or rr columns.")
+        use = [name for name in ("time", "hr", "rr") if name in fields]
+        rows = []
+
+        def flush():
+            athletes = np.array([r[0] for r in rows])
+            data = _float_rows([r[1:] for r in rows])
+            for name in np.unique(athletes):
+                parts = columns.setdefault(name, [])
+                parts.append(data[athletes == name])
+
+        for row in reader:
+            rows.append([row["athlete"]] + [row[name] or "nan" for name in use])
+            if len(rows) >= chunk_rows:
+                flush()
+                rows = []
+        if rows:
+            flush()
+
+    summaries = {}
+    for athlete, parts in columns.items():
+        data = dict(zip(use, np.concatenate(parts).T))
+        try:
+            summaries[athlete] = summarize(data.get("time"), data.get("hr"), data.get("rr"), **kwargs)
+        except ValueError as e:
+            summaries[athlete] = {"Error": str(e)}
+    return summaries
+
+
+def _float_rows(rows):
+    """Floats from CSV cells; empty or unparsable cells become NaN (dropped by the cleaning)."""
+    try:
+        return np.array(rows, dtype=np.float64)
+    except ValueError:
+        return np.array([[_float_or_nan(v) for v in row] for row in rows])
+
+
+def _float_or_nan(value):
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
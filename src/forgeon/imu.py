@@ -0,0 +1,97 @@
+"""
+Accelerometer streams for the bodyweight endurance tests.
+
+A recording is one athlete's wearable file at 50-200 Hz: a ``.npy``
+structured array with fields time, ax, ay, az (memory-mapped), or a CSV with
+those columns. ``read_imu`` yields it in chunks so a long plank never has to
+be in memory at once; the detectors in Push-UpEndurance.py and plankhold.py
+consume the chunks and keep only short windows of history.
+
+Axes are in sensor coordinates, so the strap can be worn any way round:
+gravity is taken from a slow moving average of the signal itself. Readings
+in g are recognised from their magnitude and converted to m/s².
+
+Squads are run file-per-row through ``python -m forgeon.roster push-up-endurance
+roster.csv --workers 8`` with a ``path`` column.
+"""
+import numpy as np
+
+G = 9.80665
+FIELDS = ("time", "ax", "ay", "az")
+
+
+def read_imu(path, chunk_rows=50000):
+    """
+    Yields:
+        (time (n,), acceleration (n, 3)) float64 chunks
+    """
+    if str(path).endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        missing = set(FIELDS) - set(data.dtype.names or ())
+        if missing:
+            raise ValueError(f"IMU file is missing fields: {', '.join(sorted(missing))}")
+        for start in range(0, len(data), chunk_rows):
+            block = data[start:start + chunk_rows]
+            yield (np.asarray(block["time"], dtype=np.float64),
+                   np.column_stack([np.asarray(block[k], dtype=np.float64) for k in FIELDS[1:]]))
+        return
+
+    import csv
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        missing = set(FIELDS) - set(header)
+        if missing:
+            raise ValueError(f"IMU file is missing columns: {', '.join(sorted(missing))}")
+        columns = [header.index(name) for name in FIELDS]
+        rows = []
+        for row in reader:
+            rows.append([row[i] for i in columns])
+            if len(rows) >= chunk_rows:
+                data = np.asarray(rows, dtype=np.float64)
+                yield data[:, 0], data[:, 1:]
+                rows = []
+        if rows:
+            data = np.asarray(rows, dtype=np.float64)
+            yield data[:, 0], data[:, 1:]
+
+
+def sample_rate(time):
+    """Sampling rate (Hz) from the median time step of a chunk."""
+    if len(time) < 2:
+        raise ValueError("Need at least two samples to find the sampling rate.")
+    step = float(np.median(np.diff(time)))
+    if step <= 0:
+        raise ValueError("IMU time stamps must increase.")
+    return 1.0 / step
+
+
+def to_ms2(acc, scale=None):
+    """Scale factor to m/s² (1 or G), guessed from the median magnitude unless given."""
+    if scale is None:
+        scale = G if np.median(np.linalg.norm(acc, axis=1)) < 3 else 1.0
+    return scale
+
+
+class MovingAverage:
+    """
+    Trailing moving average over `window` samples that carries the last
+    window - 1 samples between chunks, so chunked and whole-array input give
+    the same output. The first outputs average over what is available.
+    """
+
+    def __init__(self, window):
+        self.window = max(int(round(window)), 1)
+        self.tail = None
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        tail = x[:0] if self.tail is None else self.tail
+        buffer = np.concatenate((tail, x))
+        cum = np.concatenate((np.zeros((1,) + x.shape[1:]), np.cumsum(buffer, axis=0)))
+        at = np.arange(len(tail), len(buffer))
+        lo = np.maximum(at - self.window + 1, 0)
+        count = (at + 1 - lo).reshape((-1,) + (1,) * (x.ndim - 1))
+        self.tail = buffer[len(buffer) - min(self.window - 1, len(buffer)):]
+        return (cum[at + 1] - cum[lo]) / count
+
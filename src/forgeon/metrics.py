@@ -0,0 +1,151 @@
+"""
+Per-testId instrumentation for calculator calls.
+
+``Metrics.run`` is a drop-in for ``calculators.run_test`` that splits each
+call into its phases (importing the test script, the first time only, and
+the calculation itself) and, with ``trace_memory``, records the call's peak
+Python allocation via ``tracemalloc``. The worker adds the serialisation
+time and the whole-request latency with ``observe``. Per testId it keeps:
+
+    count, errors              calls and failed calls
+    import/compute/serialize   total seconds spent in each phase
+    latency histogram          request counts by upper bound (ms), BUCKETS_MS
+    peak memory                largest traced allocation of one call (bytes)
+
+``snapshot()`` returns all of it as one ``{"type": "metrics", ...}`` record,
+which the worker writes to a side channel (a file, or stderr), never to the
+stdout reply stream.
+
+``profile_call`` runs one call under cProfile and dumps the stats to a file
+for ``python -m pstats`` or snakeviz.
+"""
+import bisect
+import cProfile
+import time
+import tracemalloc
+
+from forgeon import calculators
+
+# reset_peak is Python 3.9+. Before that clear_traces also resets the peak, but
+# forgets the blocks already traced, so the base a call is measured from is 0.
+_reset_peak = getattr(tracemalloc, "reset_peak", tracemalloc.clear_traces)
+
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf"))
+
+
+class CallStats:
+    __slots__ = ("count", "errors", "import_s", "compute_s", "serialize_s", "max_ms", "peak_bytes", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.import_s = 0.0
+        self.compute_s = 0.0
+        self.serialize_s = 0.0
+        self.max_ms = 0.0
+        self.peak_bytes = None
+        self.histogram = [0] * len(BUCKETS_MS)
+
+    def percentile(self, q):
+        """Upper bound (ms) of the histogram bucket holding the q-th percentile."""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.histogram):
+            seen += n
+            if seen >= rank:
+                return bound if bound != float("inf") else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "importMs": round(self.import_s * 1000, 3),
+            "computeMs": round(self.compute_s * 1000, 3),
+            "serializeMs": round(self.serialize_s * 1000, 3),
+            "p50Ms": self.percentile(50),
+            "p95Ms": self.percentile(95),
+            "maxMs": round(self.max_ms, 3),
+            "peakBytes": self.peak_bytes,
+            "histogram": {("+Inf" if b == float("inf") else f"{b:g}"): n
+                          for b, n in zip(BUCKETS_MS, self.histogram) if n},
+        }
+
+
+class Metrics:
+    """
+    Parameters:
+        trace_memory (bool): measure each call's peak allocation with tracemalloc
+            (roughly doubles the cost of allocation-heavy calculations)
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.tests = {}
+        self.started = time.time()
+        self.requests = 0
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _stats(self, test_id):
+        stats = self.tests.get(test_id)
+        if stats is None:
+            stats = self.tests[test_id] = CallStats()
+        return stats
+
+    def run(self, test_id, inputs, meta=None):
+        """calculators.run_test, timed by phase."""
+        calc = calculators.calculator(test_id)
+        stats = self._stats(test_id)
+        if not calc.loaded:
+            start = time.perf_counter()
+            calc.module
+            stats.import_s += time.perf_counter() - start
+
+        if self.trace_memory:
+            _reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            return calc(inputs, meta)
+        finally:
+            stats.compute_s += time.perf_counter() - start
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                if stats.peak_bytes is None or peak > stats.peak_bytes:
+                    stats.peak_bytes = peak
+
+    def observe(self, test_id, seconds, ok=True, serialize_s=0.0):
+        """Record one whole request (dispatch to reply text)."""
+        self.requests += 1
+        if not isinstance(test_id, str) or test_id not in calculators.REGISTRY:
+            test_id = "(unknown)"  # keep bad testIds from growing the table
+        stats = self._stats(test_id)
+        stats.count += 1
+        if not ok:
+            stats.errors += 1
+        stats.serialize_s += serialize_s
+        ms = seconds * 1000
+        stats.max_ms = max(stats.max_ms, ms)
+        stats.histogram[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def snapshot(self):
+        return {
+            "type": "metrics",
+            "time": round(time.time(), 3),
+            "uptimeS": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "traceMemory": self.trace_memory,
+            "tests": {test_id: stats.to_dict() for test_id, stats in sorted(self.tests.items())},
+        }
+
+
+def profile_call(path, func, *args, **kwargs):
+    """Run func under cProfile, dump the stats to `path` and return func's result."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
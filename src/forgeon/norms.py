@@ -0,0 +1,156 @@
+"""
+Normative tables for the timed agility and obstacle tests.
+
+Norms live in ``norms.json``, keyed by testId. Each test has ascending band
+labels (best first for timed tests), the percentile reported for each label
+and one or more bands of sorted cutoffs, selected by sex ("male", "female" or
+"any") and optionally by an age range ``"age": [min, max)``. A value is rated
+by binary search over its band's cutoffs. ``inclusive`` says whether a value
+equal to a cutoff still earns the better label (``<=``) or not (``<``).
+
+Tables are loaded once per process:
+
+    >>> rate("illinois-agility", 15.9, sex="male")
+    {'Performance Rating': 'Good', 'Percentile': 75}
+"""
+import bisect
+import json
+from functools import lru_cache
+from pathlib import Path
+
+NORMS_PATH = Path(__file__).with_name("norms.json")
+
+
+class NormBand:
+    __slots__ = ("sex", "age_min", "age_max", "cutoffs", "labels", "percentiles", "inclusive")
+
+    def __init__(self, spec, labels, percentiles, inclusive):
+        self.sex = spec.get("sex", "any")
+        self.age_min, self.age_max = spec.get("age", (None, None))
+        self.cutoffs = tuple(sorted(spec["cutoffs"]))
+        if len(self.cutoffs) != len(labels) - 1:
+            raise ValueError("A norm band needs one cutoff fewer than it has labels.")
+        self.labels = labels
+        self.percentiles = percentiles
+        self.inclusive = inclusive
+
+    def matches(self, sex, age):
+        if self.sex != "any" and self.sex != sex:
+            return False
+        if age is None:
+            return self.age_min is None and self.age_max is None
+        return ((self.age_min is None or age >= self.age_min)
+                and (self.age_max is None or age < self.age_max))
+
+    def index(self, value):
+        """Position of value's label in self.labels."""
+        search = bisect.bisect_left if self.inclusive else bisect.bisect_right
+        return search(self.cutoffs, value)
+
+    def rate(self, value):
+        i = self.index(value)
+        return {
+            "Performance Rating": self.labels[i],
+            "Percentile": self.percentiles[i] if self.percentiles else None,
+        }
+
+
+@lru_cache(maxsize=None)
+def load_norms(path=NORMS_PATH):
+    """Read a norms file into {testId: [NormBand, ...]}."""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    tables = {}
+    for test_id, table in raw.items():
+        labels = tuple(table["labels"])
+        percentiles = tuple(table["percentiles"]) if "percentiles" in table else None
+        tables[test_id] = [
+            NormBand(spec, labels, percentiles, table.get("inclusive", False))
+            for spec in table["bands"]
+        ]
+    return tables
+
+
+def _sex(sex):
+    # The scripts treat anything other than "male" as female
+    return "male" if str(sex).strip().lower() == "male" else "female"
+
+
+def norm_band(test_id, sex="male", age=None):
+    """Return the NormBand that applies to an athlete."""
+    try:
+        bands = load_norms()[test_id]
+    except KeyError:
+        raise LookupError(f"No normative table for '{test_id}'") from None
+    sex = _sex(sex)
+    for band in bands:
+        if band.matches(sex, age):
+            return band
+    raise ValueError(f"No '{test_id}' norms for sex={sex}, age={age}")
+
+
+def rate(test_id, value, sex="male", age=None):
+    """
+    Rate one result against its normative band.
+
+    Returns:
+        dict: "Performance Rating" and "Percentile" (None if the table has no
+        percentiles, e.g. pass/fail standards)
+    """
+    return norm_band(test_id, sex, age).rate(value)
+
+
+def rate_squad(test_id, values, sex="male", age=None):
+    """
+    Vectorised rate() for a whole squad.
+
+    Parameters:
+        values: one result per athlete
+        sex: one sex per athlete, or a single value for all
+        age: one age per athlete, a single age, or None
+
+    Returns:
+        dict of arrays: "Performance Rating" (str) and "Percentile" (float,
+        NaN where the table has no percentiles)
+    """
+    import numpy as np
+
+    try:
+        bands = load_norms()[test_id]
+    except KeyError:
+        raise LookupError(f"No normative table for '{test_id}'") from None
+
+    values = np.asarray(values, dtype=float)
+    sexes = np.asarray(sex)
+    if sexes.ndim == 0:
+        male = np.full(values.shape, _sex(sexes.item()) == "male")
+    else:
+        # Normalise only the distinct labels, not every row
+        distinct, inverse = np.unique(sexes, return_inverse=True)
+        male = np.array([_sex(s) == "male" for s in distinct])[inverse.reshape(sexes.shape)]
+    ages = None if age is None else np.broadcast_to(np.asarray(age, dtype=float), values.shape)
+
+    # Each athlete takes the first band that matches, as in norm_band()
+    positions = np.full(values.shape, -1, dtype=np.intp)
+    for band in bands:
+        if ages is None and (band.age_min is not None or band.age_max is not None):
+            continue
+        mask = positions < 0
+        if band.sex != "any":
+            mask &= male if band.sex == "male" else ~male
+        if ages is not None and band.age_min is not None:
+            mask &= ages >= band.age_min
+        if ages is not None and band.age_max is not None:
+            mask &= ages < band.age_max
+        side = "left" if band.inclusive else "right"
+        positions[mask] = np.searchsorted(band.cutoffs, values[mask], side=side)
+    if (positions < 0).any():
+        raise ValueError(f"No '{test_id}' norms for some athletes' sex/age")
+
+    band = bands[0]
+    labels = np.array(band.labels, dtype=object)
+    percentiles = np.array(band.percentiles if band.percentiles else [np.nan] * len(labels), dtype=float)
+    return {
+        "Performance Rating": labels[positions],
+        "Percentile": percentiles[positions],
+    }
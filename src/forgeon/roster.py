@@ -0,0 +1,169 @@
+"""
+Bulk roster mode for the strength and muscular endurance tests.
+
+Streams a CSV or NDJSON roster (one athlete trial per row) through the same
+calculation as the interactive script and writes each result as soon as it
+is produced, so memory stays constant however long the roster is:
+
+    python -m forgeon.roster imtp-peak-force roster.csv -o results.ndjson
+    python -m forgeon.roster one-rm roster.ndjson -o results.csv --workers 4
+    python -m forgeon.roster plank-hold recordings.csv -o results.ndjson --workers 0
+
+Column names are the calculator input ids, e.g. ``athlete, peak_force_n,
+trial_1, trial_2, trial_3, rate_of_force_development`` for IMTP and
+``athlete, body_mass, lift_type, warmup_weight, one_rm, rpe, form_notes`` for
+1RM. For push-ups and planks a row can name one athlete's accelerometer
+recording instead (``athlete, path``, see forgeon.imu), so a squad's files
+are analysed in parallel across the workers.
+
+A row that fails is reported with its error and does not stop the run.
+"""
+import argparse
+import csv
+import functools
+import itertools
+import json
+import multiprocessing
+import sys
+
+from forgeon import calculators
+
+ROSTER_TESTS = ("imtp-peak-force", "one-rm", "push-up-endurance", "plank-hold")
+
+
+def read_rows(f, fmt):
+    """
+    Yield one row per roster line of an open CSV or NDJSON file: a dict for
+    CSV, the raw line for NDJSON (parsed in score_row, so a bad line only
+    fails its own row).
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def score_row(test_id, numbered_row):
+    number, row = numbered_row
+    try:
+        if isinstance(row, str):
+            row = json.loads(row)
+            if not isinstance(row, dict):
+                raise ValueError("A roster row must be a JSON object")
+        return {"row": number, "ok": True, "output": calculators.run_test(test_id, row)}
+    except Exception as e:
+        return {"row": number, "ok": False, "error": {"type": type(e).__name__, "message": str(e)}}
+
+
+def score_roster(test_id, rows, workers=1, chunk_size=256):
+    """
+    Score rows lazily, yielding results in input order.
+
+    With workers > 1 the rows are scored in a process pool, one batch of
+    workers * chunk_size rows at a time, so only that many rows are ever held.
+    """
+    score = functools.partial(score_row, test_id)
+    numbered = enumerate(rows, start=1)
+    if workers <= 1:
+        yield from map(score, numbered)
+        return
+
+    batch_size = workers * chunk_size
+    with multiprocessing.Pool(workers) as pool:
+        while True:
+            batch = list(itertools.islice(numbered, batch_size))
+            if not batch:
+                break
+            # Spread a short batch (e.g. one IMU file per row) over every worker
+            yield from pool.map(score, batch, chunksize=-(-len(batch) // workers))
+
+
+class CsvResultWriter:
+    """Flatten results into CSV columns, taking the header from the first successful row."""
+
+    def __init__(self, f):
+        self.f = f
+        self.writer = None
+        self.pending = []
+
+    def write(self, result):
+        if self.writer is None:
+            if not result["ok"]:
+                self.pending.append(result)
+                return
+            fields = ["row", *result["output"], "error"]
+            self.writer = csv.DictWriter(self.f, fieldnames=fields, extrasaction="ignore")
+            self.writer.writeheader()
+            for failed in self.pending:
+                self._write(failed)
+            self.pending.clear()
+        self._write(result)
+
+    def _write(self, result):
+        if result["ok"]:
+            self.writer.writerow({"row": result["row"], **result["output"]})
+        else:
+            self.writer.writerow({"row": result["row"], "error": result["error"]["message"]})
+
+    def close(self):
+        if self.pending:
+            self.writer = csv.DictWriter(self.f, fieldnames=["row", "error"])
+            self.writer.writeheader()
+            for failed in self.pending:
+                self._write(failed)
+
+
+class NdjsonResultWriter:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, result):
+        self.f.write(calculators.to_json(result) + "\n")
+
+    def close(self):
+        pass
+
+
+def _format(path, explicit):
+    if explicit:
+        return explicit
+    return "csv" if path and path.lower().endswith(".csv") else "ndjson"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forgeon.roster", description="Score a strength or endurance test roster.")
+    parser.add_argument("test_id", choices=ROSTER_TESTS)
+    parser.add_argument("roster", help="CSV or NDJSON roster ('-' for stdin)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--input-format", choices=("csv", "ndjson"))
+    parser.add_argument("--output-format", choices=("csv", "ndjson"))
+    parser.add_argument("--workers", type=int, default=1, help="processes to score with (0 = all cores)")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    workers = args.workers or multiprocessing.cpu_count()
+    in_fmt = _format(args.roster, args.input_format)
+    out_fmt = _format(args.output, args.output_format)
+
+    src = sys.stdin if args.roster == "-" else open(args.roster, newline="", encoding="utf-8")
+    dst = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    writer = CsvResultWriter(dst) if out_fmt == "csv" else NdjsonResultWriter(dst)
+    failed = 0
+    try:
+        for result in score_roster(args.test_id, read_rows(src, in_fmt), workers, args.chunk_size):
+            failed += not result["ok"]
+            writer.write(result)
+        writer.close()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Non-interactive entry point for any test.
+
+    python -m forgeon.run <testId> --json '{"inputs": {...}, "meta": {...}}'
+    echo '{"inputs": {...}, "meta": {...}}' | python -m forgeon.run <testId>
+    python -m forgeon.run --list
+
+The payload is read from ``--json``, from ``--input FILE`` or from stdin. A
+payload without an ``"inputs"`` key is taken to be the inputs themselves.
+Exactly one JSON object is written to stdout, in the same shape as a worker
+reply (without the id):
+
+    {"ok": true, "testId": "...", "output": {...}}
+    {"ok": false, "testId": "...", "error": {"type": "...", "message": "..."}}
+
+``--profile FILE`` runs the calculation under cProfile and writes the stats
+to FILE. Nothing prompts. The exit status is 0 on success and 1 on a failed
+calculation.
+"""
+import argparse
+import contextlib
+import json
+import sys
+
+from forgeon import calculators
+from forgeon.metrics import profile_call
+from forgeon.worker import handle
+
+
+def read_payload(args):
+    if args.json is not None:
+        raw = args.json
+    elif args.input is not None:
+        with open(args.input, encoding="utf-8") as f:
+            raw = f.read()
+    else:
+        raw = sys.stdin.read()
+    payload = json.loads(raw) if raw.strip() else {}
+    if not isinstance(payload, dict) or "inputs" not in payload:
+        payload = {"inputs": payload}
+    return payload
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forgeon.run", description="Run one test calculation from JSON.")
+    parser.add_argument("test_id", nargs="?", help="testId to run")
+    parser.add_argument("--json", help="JSON payload (default: read stdin)")
+    parser.add_argument("--input", help="read the JSON payload from this file")
+    parser.add_argument("--list", action="store_true", help="list the available testIds")
+    parser.add_argument("--profile", metavar="FILE", help="write cProfile stats for the calculation to FILE")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print(json.dumps(sorted(calculators.REGISTRY)))
+        return 0
+    if not args.test_id:
+        parser.error("a testId is required")
+
+    try:
+        payload = read_payload(args)
+    except ValueError as e:
+        reply = {"ok": False, "testId": args.test_id, "error": {"type": "JSONDecodeError", "message": str(e)}}
+    else:
+        request = {"testId": args.test_id, "inputs": payload["inputs"], "meta": payload.get("meta")}
+        # Keep stdout for the single JSON reply
+        with contextlib.redirect_stdout(sys.stderr):
+            reply = profile_call(args.profile, handle, request) if args.profile else handle(request)
+        reply.pop("id", None)
+
+    print(calculators.to_json(reply))
+    return 0 if reply["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
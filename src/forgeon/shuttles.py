@@ -0,0 +1,209 @@
+"""
+Level tables for the incremental field shuttle tests.
+
+``shuttles.json`` lists each protocol's stages as ``[level, speed km/h,
+bouts]``: the beep test (20 m shuttles), Yo-Yo IR1/IR2 (2 x 20 m bouts) and
+the 30-15 IFT (one 30 s run per stage). The stages are expanded once per
+process into one row per bout holding its level, bout number, speed and the
+cumulative distance at the end of it, plus a level -> first row index. A
+single result is looked up in plain Python; squads use NumPy copies of the
+rows with a dense level index, so converting a squad is two array lookups:
+
+    >>> squad_results("yoyo-ir1", [17, 19], [2, 8])["Distance (m)"]
+    array([1480., 2360.])
+
+VO2max follows the protocol's ``vo2max`` entry: a straight line on final
+speed or on distance, or Buchheit's 30-15 IFT equation (which needs sex, age
+and body mass; NaN for athletes missing any of them).
+"""
+import json
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+TABLES_PATH = Path(__file__).with_name("shuttles.json")
+
+# The bout rows as arrays, with dense level -> first row / bout count lookups
+StageArrays = namedtuple("StageArrays", "levels bouts speeds distances first count")
+
+
+class StageTable:
+    __slots__ = ("protocol", "name", "vo2max", "levels", "bouts", "speeds", "distances", "first", "count",
+                 "_arrays")
+
+    def __init__(self, protocol, spec):
+        self.protocol = protocol
+        self.name = spec["name"]
+        self.vo2max = spec["vo2max"]
+        stages = spec["stages"]
+        if any(b[0] <= a[0] for a, b in zip(stages, stages[1:])):
+            raise ValueError(f"'{protocol}' stages must be in increasing level order.")
+
+        # One row per bout, built in plain Python so single results need no NumPy
+        levels, bouts, speeds, distances = [], [], [], []
+        self.first, self.count = {}, {}
+        distance = 0.0
+        for level, speed, count in stages:
+            level, speed, count = int(level), float(speed), int(count)
+            # Timed bouts: distance is speed x time
+            bout_m = float(spec["bout_m"]) if "bout_m" in spec else speed / 3.6 * spec["bout_s"]
+            self.first[level], self.count[level] = len(levels), count
+            for bout in range(1, count + 1):
+                distance += bout_m
+                levels.append(level)
+                bouts.append(bout)
+                speeds.append(speed)
+                distances.append(distance)
+        self.levels, self.bouts = tuple(levels), tuple(bouts)
+        self.speeds, self.distances = tuple(speeds), tuple(distances)
+        self._arrays = None
+
+    def row(self, level, bout=None):
+        """
+        Row index of one (level, bout) result: the last bout completed.
+        A missing bout means the whole level was completed.
+        """
+        count = self.count.get(level, 0)
+        bout = count if bout is None else bout
+        if not count or not 1 <= bout <= count:
+            raise ValueError(f"Level {level} bout {bout} is not part of the {self.name}.")
+        return self.first[level] + bout - 1
+
+    def arrays(self):
+        """The table as NumPy arrays (built on first use)."""
+        if self._arrays is None:
+            import numpy as np
+            size = max(self.first) + 1
+            # Levels absent from the protocol stay -1 / 0
+            first = np.full(size, -1, dtype=np.intp)
+            count = np.zeros(size, dtype=np.intp)
+            first[list(self.first)] = list(self.first.values())
+            count[list(self.count)] = list(self.count.values())
+            self._arrays = StageArrays(np.array(self.levels, dtype=np.intp), np.array(self.bouts, dtype=np.intp),
+                                       np.array(self.speeds), np.array(self.distances), first, count)
+        return self._arrays
+
+    def rows(self, level, bout=None):
+        """row() over arrays of levels and bouts."""
+        import numpy as np
+        first, count_of = self.arrays().first, self.arrays().count
+        level = np.asarray(level, dtype=np.intp)
+        known = (level >= 0) & (level < len(first))
+        safe = np.where(known, level, 0)
+        count = np.where(known, count_of[safe], 0)
+        bout = count if bout is None else np.asarray(bout, dtype=np.intp)
+        level, safe, count, bout = np.broadcast_arrays(level, safe, count, bout)
+        bad = np.flatnonzero((count == 0) | (bout < 1) | (bout > count))
+        if bad.size:
+            i = bad[0]
+            raise ValueError(f"Level {level.flat[i]} bout {bout.flat[i]} is not part of the {self.name}.")
+        return first[safe] + bout - 1
+
+    def estimate_vo2max(self, speed, distance, sex=None, age=None, body_mass=None):
+        """VO2max from final speed and distance; scalars or arrays (the 30-15 IFT equation needs NumPy)."""
+        spec = self.vo2max
+        if spec["basis"] == "speed":
+            return spec["intercept"] + spec["slope"] * speed
+        if spec["basis"] == "distance":
+            return spec["intercept"] + spec["slope"] * distance
+        import numpy as np
+        # Buchheit (2008): 28.3 - 2.15 G - 0.741 A - 0.0357 W + 0.0586 A V + 1.03 V, G 1 male / 2 female
+        if sex is None or age is None or body_mass is None:
+            return np.full(np.shape(speed), np.nan)
+        sex = np.char.lower(np.asarray(sex, dtype=str))
+        g = np.select([sex == "male", sex == "female"], [1.0, 2.0], np.nan)
+        age = np.asarray(age, dtype=float)
+        return 28.3 - 2.15 * g - 0.741 * age - 0.0357 * np.asarray(body_mass, dtype=float) \
+            + 0.0586 * age * speed + 1.03 * speed
+
+
+@lru_cache(maxsize=None)
+def load_tables(path=TABLES_PATH):
+    """Read a stage file into {protocol: StageTable}."""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    return {protocol: StageTable(protocol, spec) for protocol, spec in raw.items()}
+
+
+def stage_table(protocol):
+    try:
+        return load_tables()[protocol]
+    except KeyError:
+        raise LookupError(f"No stage table for '{protocol}'") from None
+
+
+def parse_level(value):
+    """Split the "17.2" (level.bout) notation; returns (level, bout or None)."""
+    if isinstance(value, str) and "." in value:
+        level, bout = value.strip().split(".", 1)
+        return int(level), int(bout)
+    return int(float(value)), None
+
+
+def squad_results(protocol, levels, bouts=None, sex=None, age=None, body_mass=None):
+    """
+    Convert a squad's final level/bout results in one call.
+
+    Parameters:
+        protocol (str): "beep-test", "yoyo-ir1", "yoyo-ir2" or "ift-30-15"
+        levels: final level reached, one per athlete
+        bouts: shuttles/bouts completed in that level (None = level completed)
+        sex, age, body_mass: per athlete (or single values); only the 30-15
+            IFT VO2max uses them
+
+    Returns:
+        dict of arrays: "Total Bouts", "Distance (m)", "Speed (km/h)" and
+        "Estimated VO2max (ml/kg/min)"
+    """
+    table = stage_table(protocol)
+    rows = table.rows(levels, bouts)
+    speed = table.arrays().speeds[rows]
+    distance = table.arrays().distances[rows]
+    return {
+        "Total Bouts": rows + 1,
+        "Distance (m)": distance,
+        "Speed (km/h)": speed,
+        "Estimated VO2max (ml/kg/min)": table.estimate_vo2max(speed, distance, sex, age, body_mass),
+    }
+
+
+def squad_outcomes(protocol, athletes):
+    """
+    Per-athlete results for a squad.
+
+    Parameters:
+        athletes (list of dict): {"athlete", "level", "bout" (optional),
+            "sex", "age", "body_mass" (optional)}; "level" may use the
+            "17.2" notation instead of a separate bout
+
+    Returns:
+        list of dict, in input order
+    """
+    import numpy as np
+
+    if not athletes:
+        return []
+    levels, bouts = zip(*(parse_level(a["level"]) for a in athletes))
+    bouts = [a.get("bout", b) for a, b in zip(athletes, bouts)]
+    if any(b is None for b in bouts):
+        full = stage_table(protocol).count
+        bouts = [full.get(lv, 0) if b is None else b for lv, b in zip(levels, bouts)]
+
+    def column(key, missing):
+        values = [a.get(key) for a in athletes]
+        return [missing if v is None else v for v in values]
+
+    results = squad_results(protocol, levels, bouts, column("sex", ""),
+                            column("age", np.nan), column("body_mass", np.nan))
+    vo2 = results["Estimated VO2max (ml/kg/min)"]
+    return [
+        {
+            "Athlete": a.get("athlete"),
+            "Level": f"{level}.{bout}",
+            "Total Bouts": int(results["Total Bouts"][i]),
+            "Distance (m)": round(float(results["Distance (m)"][i]), 1),
+            "Speed (km/h)": float(results["Speed (km/h)"][i]),
+            "Estimated VO2max (ml/kg/min)": None if np.isnan(vo2[i]) else round(float(vo2[i]), 2),
+        }
+        for i, (a, level, bout) in enumerate(zip(athletes, levels, bouts))
+    ]
@@ -0,0 +1,12 @@
+"""
+Small NumPy helpers shared by the trace analysers (the accelerometer
+streams in forgeon.imu and the scripts built on it, and the head-impulse
+segmentation in Vestibulo-OcularReflex.py).
+"""
+import numpy as np
+
+
+def runs(flags):
+    """Start and end (exclusive) indices of the True runs in `flags`."""
+    edges = np.diff(np.concatenate(([False], flags, [False])).astype(np.int8))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
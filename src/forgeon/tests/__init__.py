@@ -0,0 +1,7 @@
+"""
+Tests for the forgeon runtime. Run from ``src/``:
+
+    python -m unittest discover forgeon/tests
+
+(or ``python -m pytest forgeon/tests``). NumPy is needed for most of them.
+"""
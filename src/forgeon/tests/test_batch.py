@@ -0,0 +1,99 @@
+"""The NDJSON batch executor, in one process and over a pool."""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from forgeon import batch
+
+
+def request_lines():
+    """Mixed requests, some failing, with blank lines and no ids on most."""
+    lines = []
+    for i in range(40):
+        lines.append(json.dumps({"testId": "cooper-test", "inputs": {"distance": 2000 + 10 * i}}))
+        if i % 9 == 4:
+            lines.append(json.dumps({"testId": "cooper-test", "inputs": {}}))  # missing input
+        if i % 13 == 6:
+            lines.append("{not json")
+            lines.append("[1, 2]")
+            lines.append("")
+    lines.append(json.dumps({"id": "last", "testId": "no-such-test"}))
+    return lines
+
+
+def run(lines, **kwargs):
+    out = io.StringIO()
+    with contextlib.redirect_stderr(io.StringIO()):
+        total, failed = batch.run(io.StringIO("\n".join(lines) + "\n"), out, **kwargs)
+    return total, failed, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class BatchTest(unittest.TestCase):
+    def expected_ids(self, lines):
+        return [n for n, line in enumerate(lines, 1) if line.strip()][:-1] + ["last"]
+
+    def test_replies_keep_input_order(self):
+        lines = request_lines()
+        for workers, chunk_size in ((1, 64), (3, 2), (4, 7)):
+            total, failed, replies = run(lines, workers=workers, chunk_size=chunk_size)
+            self.assertEqual([r["id"] for r in replies], self.expected_ids(lines))
+            self.assertEqual(total, len(replies))
+            self.assertEqual(failed, sum(not r["ok"] for r in replies))
+            distances = [r["output"]["Distance Covered (m)"] for r in replies if r["ok"]]
+            self.assertEqual(len(distances), 40)
+
+    def test_bad_lines_fail_only_themselves(self):
+        lines = request_lines()
+        _, failed, replies = run(lines, workers=2, chunk_size=5)
+        by_line = {r["id"]: r for r in replies}
+        for number, line in enumerate(lines, 1):
+            if line == "{not json":
+                self.assertEqual(by_line[number]["error"]["type"], "JSONDecodeError")
+            elif line == "[1, 2]":
+                self.assertEqual(by_line[number]["error"]["message"], "A request must be a JSON object")
+            elif line and "distance" not in line and "no-such-test" not in line:
+                self.assertEqual(by_line[number]["error"]["type"], "ValueError")
+        self.assertFalse(by_line["last"]["ok"])
+        self.assertEqual(failed, 4 + 3 * 2 + 1)  # missing inputs, bad lines, unknown test
+        self.assertEqual(sum(r["ok"] for r in replies), 40)
+
+    def test_pool_matches_one_process(self):
+        lines = request_lines()
+        self.assertEqual(run(lines, workers=3, chunk_size=4), run(lines, workers=1, chunk_size=4))
+
+    def test_workers_0_means_one_per_cpu(self):
+        total, _, replies = run(request_lines()[:10], workers=0, chunk_size=3)
+        self.assertEqual(total, len(replies))
+
+    def test_chunk_size_bounds(self):
+        self.assertEqual(batch.tuned_chunk_size(10, 8), batch.MIN_CHUNK)
+        self.assertEqual(batch.tuned_chunk_size(10 ** 7, 2), batch.MAX_CHUNK)
+        self.assertEqual(batch.tuned_chunk_size(3200, 8), 100)
+
+
+class MainTest(unittest.TestCase):
+    def test_file_in_file_out(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, target = os.path.join(tmp, "in.ndjson"), os.path.join(tmp, "out.ndjson")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"testId": "cooper-test", "inputs": {"distance": 2800}}) + "\n")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(batch.main([source, "-o", target, "--workers", "1"]), 0)
+                with open(source, "a", encoding="utf-8") as f:
+                    f.write("{not json\n")
+                self.assertEqual(batch.main([source, "-o", target, "--workers", "2"]), 1)
+            with open(target, encoding="utf-8") as f:
+                self.assertEqual([json.loads(line)["ok"] for line in f], [True, False])
+            self.assertIn("2 requests, 1 failed", stderr.getvalue())
+
+    def test_workers_must_be_positive(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            batch.main(["--workers", "0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Push-up and plank scoring from accelerometer recordings."""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+from forgeon import imu
+from forgeon.calculators import HRF, SRC_DIR, load_script
+
+STRENGTH = f"{HRF}/Muscular Strength & Endurance"
+RATE = 100
+
+
+def pushups(depths, period=1.5, rest=3.0):
+    """Still, one sinusoidal rep per depth (m), still again; z is vertical."""
+    w = 2 * np.pi / period
+    rep = np.arange(0, period, 1 / RATE)
+    still = np.zeros(int(rest * RATE))
+    up = np.concatenate([still] + [-d / 2 * w * w * np.cos(w * rep) for d in depths] + [still])
+    time = np.arange(len(up)) / RATE
+    return time, np.column_stack((np.full(len(up), 0.05), np.zeros(len(up)), imu.G + up))
+
+
+def plank(breaks, length=40.0):
+    """A still plank in g, tilted by (start, end, degrees) for each break."""
+    time = np.arange(0, length, 1 / RATE)
+    tilt = np.zeros(len(time))
+    for start, end, degrees in breaks:
+        tilt[(time > start) & (time < end)] = np.radians(degrees)
+    return time, np.column_stack((np.sin(tilt), np.zeros(len(time)), np.cos(tilt)))
+
+
+def chunked(stream, time, acc, size):
+    for i in range(0, len(time), size):
+        stream.add(time[i:i + size], acc[i:i + size])
+    return stream
+
+
+class RepCounterTest(unittest.TestCase):
+    pushup = load_script(f"{STRENGTH}/Push-UpEndurance.py")
+
+    def test_counts_full_and_partial_reps(self):
+        time, acc = pushups([0.25] * 8 + [0.07] + [0.25] * 2)
+        result = self.pushup.pushup_imu_outcomes(time, acc, "A")
+        self.assertEqual(result["Total Repetitions"], 10)
+        self.assertEqual(result["Partial Repetitions"], 1)
+        self.assertEqual(result["Form Breakdown Point"], "First partial rep after 8 full reps")
+        self.assertEqual(result["Test Duration"], self.pushup.durations.format_duration(result["Test Duration (s)"]))
+
+    def test_chunks_match_whole_recording(self):
+        time, acc = pushups([0.25] * 6)
+        whole = self.pushup.pushup_imu_outcomes(time, acc, "A")
+        for size in (37, 250, 1000):
+            self.assertEqual(chunked(self.pushup.RepCounter(), time, acc, size).finish("A"), whole)
+
+    def test_still_recording_has_no_reps(self):
+        time, acc = pushups([])
+        result = self.pushup.pushup_imu_outcomes(time, acc, "A")
+        self.assertEqual((result["Total Repetitions"], result["Test Duration"]), (0, "00:00"))
+
+
+class PlankHoldTest(unittest.TestCase):
+    plank = load_script(f"{STRENGTH}/plankhold.py")
+
+    def test_long_break_ends_the_hold(self):
+        time, acc = plank([(15, 16, 25), (30, 40, 35)])
+        result = self.plank.plank_imu_outcomes(time, acc, "A")
+        self.assertEqual(result["Ended By"], "Form break")
+        self.assertEqual(result["Form Breaks"], 1)
+        self.assertAlmostEqual(result["Hold Time (s)"], 30, delta=0.5)
+        self.assertEqual(result["Hold Time"], "00:30")
+
+    def test_chunks_and_file_match_whole_recording(self):
+        time, acc = plank([(15, 16, 25), (30, 40, 35)])
+        whole = self.plank.plank_imu_outcomes(time, acc, "A")
+        for size in (211, 500, 4000):
+            self.assertEqual(chunked(self.plank.PlankHold(), time, acc, size).finish("A"), whole)
+
+        data = np.zeros(len(time), dtype=[(name, "f8") for name in imu.FIELDS])
+        data["time"] = time
+        data["ax"], data["ay"], data["az"] = acc.T
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plank.npy")
+            np.save(path, data)
+            self.assertEqual(self.plank.plank_imu_file(path, "A", chunk_rows=300), whole)
+
+    def test_typed_hold_time_is_kept(self):
+        record = self.plank.plank_record("A", "1:30")
+        self.assertEqual((record["Hold Time"], record["Hold Time (s)"]), ("1:30", 90.0))
+        record = self.plank.plank_record("A", "about 2 min")
+        self.assertEqual((record["Hold Time"], record["Hold Time (s)"]), ("about 2 min", None))
+
+    def test_typed_records_run_without_numpy(self):
+        code = (
+            "import sys; sys.modules['numpy'] = None\n"
+            "from forgeon.calculators import run_test\n"
+            "run_test('plank-hold', {'hold_time': '1:30'})\n"
+            "run_test('push-up-endurance', {'total_reps': 30, 'duration': '2:00'})\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import unittest
+
+from forgeon.cache import ResultCache, cache_key, canonical
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_numbers_compare_by_value(self):
+        self.assertEqual(cache_key("cooper-test", {"distance": 2800}), cache_key("cooper-test", {"distance": 2800.0}))
+        self.assertEqual(canonical([17, True, None]), [17.0, True, None])
+
+    def test_numeric_looking_strings_stay_text(self):
+        # "10.10" is level 10 bout 10; "10.1" is level 10 bout 1
+        self.assertNotEqual(cache_key("ift-test", {"level": "10.10"}), cache_key("ift-test", {"level": "10.1"}))
+        self.assertNotEqual(cache_key("cooper-test", {"distance": "2800"}), cache_key("cooper-test", {"distance": 2800}))
+
+    def test_whitespace_key_order_and_empty_values(self):
+        a = cache_key("one-rm", {"athlete": " A ", "one_rm": 100, "rpe": ""}, {"athleteId": "A"})
+        b = cache_key("one-rm", {"one_rm": 100, "athlete": "A", "form_notes": None}, {"athleteId": "A"})
+        self.assertEqual(a, b)
+
+    def test_item_list_inputs(self):
+        as_items = cache_key("cooper-test", [{"id": "distance", "value": 2800, "unit": "Meters"}])
+        self.assertEqual(as_items, cache_key("cooper-test", [{"id": "distance", "value": 2800.0, "unit": "m"}]))
+        self.assertNotEqual(as_items, cache_key("cooper-test", {"distance": 2800}))
+
+    def test_meta_is_part_of_the_key(self):
+        self.assertNotEqual(cache_key("vertical-jump", {"flight_time": 0.5}, {"bodyMass": 70}),
+                            cache_key("vertical-jump", {"flight_time": 0.5}, {"bodyMass": 80}))
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_hits_return_the_same_text(self):
+        cache = ResultCache()
+        first = cache.run_json("cooper-test", {"distance": 2800})
+        self.assertGreaterEqual(cache.last_serialize_s, 0.0)
+        self.assertEqual(cache.run_json("cooper-test", {"distance": 2800.0}), first)
+        self.assertEqual(cache.last_serialize_s, 0.0)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(json.loads(first)["Distance Covered (m)"], 2800)
+
+    def test_level_bout_strings_are_distinct_entries(self):
+        cache = ResultCache()
+        a, b = (json.loads(cache.run_json("shuttle-squad", {"athletes": [{"athlete": "A", "level": level}]}))
+                for level in ("10.10", "10.1"))
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual((a[0]["Total Bouts"], b[0]["Total Bouts"]), (93, 84))
+
+    def test_eviction_and_disabled_tests(self):
+        calls = []
+
+        def run(test_id, inputs, meta=None):
+            calls.append(inputs["n"])
+            return {"n": inputs["n"]}
+
+        cache = ResultCache(maxsize=2, disabled=("live",), run=run)
+        for n in (1, 2, 3, 1):
+            cache.run_json("t", {"n": n})
+        self.assertEqual(calls, [1, 2, 3, 1])
+        self.assertEqual(cache.stats()["evictions"], 2)
+        cache.run_json("live", {"n": 5})
+        cache.run_json("live", {"n": 5})
+        self.assertEqual(calls[-2:], [5, 5])
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_file_inputs_are_not_cached(self):
+        calls = []
+
+        def run(test_id, inputs, meta=None):
+            calls.append(test_id)
+            return {}
+
+        cache = ResultCache(run=run)
+        for inputs in ({"path": "laps.csv"}, [{"id": "path", "value": "laps.csv"}],
+                       {"distance": 2800, "hr_path": "hr.csv"}):
+            cache.run_json("cooper-gps", inputs)
+            cache.run_json("cooper-gps", inputs)
+        self.assertEqual(len(calls), 6)
+        cache.run_json("cooper-gps", {"path": ""})
+        cache.run_json("cooper-gps", {"path": ""})
+        self.assertEqual(len(calls), 7)
+        self.assertEqual(cache.stats()["size"], 1)
+
+    def test_errors_are_not_cached(self):
+        cache = ResultCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.run_json("cooper-test", {})
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""The column-wise body-composition equations against the scalar scripts."""
+import math
+import unittest
+
+import numpy as np
+
+from forgeon import cohort
+from forgeon.calculators import HRF, load_script
+
+BODY = f"{HRF}/Body Composition & Anthropometry"
+
+
+class CohortTest(unittest.TestCase):
+    rng = np.random.default_rng(0)
+    n = 200
+    sex = rng.choice(["male", "Female", "MALE", "female"], n)
+    age = rng.uniform(18, 60, n)
+
+    def test_skinfold_density_and_fat(self):
+        skinfold, skinfold8 = load_script(f"{BODY}/skinfold.py"), load_script(f"{BODY}/Skinfold8.py")
+        total = self.rng.uniform(30, 200, self.n)
+        density7 = cohort.body_density_7site(total, self.age, self.sex)
+        density8 = cohort.body_density_8site(total, self.age, self.sex)
+        for i in range(self.n):
+            self.assertAlmostEqual(density7[i], skinfold.body_density_7site(total[i], self.age[i], self.sex[i]), 12)
+            self.assertAlmostEqual(density8[i], skinfold8.body_density_8site(total[i], self.age[i], self.sex[i]), 12)
+        np.testing.assert_allclose(cohort.body_fat_percent(density7),
+                                   [skinfold.body_fat_percent(d) for d in density7], rtol=1e-12)
+        with self.assertRaises(ValueError):
+            cohort.body_density_7site(total[:2], self.age[:2], ["male", "other"])
+
+    def test_us_navy(self):
+        girth = load_script(f"{BODY}/Girth.py")
+        waist = self.rng.uniform(60, 110, self.n)
+        neck = self.rng.uniform(30, 45, self.n)
+        hip = np.where(self.rng.random(self.n) < 0.2, np.nan, self.rng.uniform(80, 120, self.n))
+        height = np.where(self.rng.random(self.n) < 0.1, 0.0, self.rng.uniform(150, 200, self.n))
+        column = cohort.us_navy_bodyfat(self.sex, waist, neck, hip, height)
+        for i in range(self.n):
+            expected = girth.us_navy_bodyfat(self.sex[i], waist[i], neck[i],
+                                             None if math.isnan(hip[i]) else hip[i], height[i])
+            if expected is None:
+                self.assertTrue(math.isnan(column[i]))
+            else:
+                self.assertAlmostEqual(column[i], expected, 9)
+
+    def test_bia(self):
+        bia = load_script(f"{BODY}/BIA.py")
+        impedance = self.rng.uniform(400, 600, self.n)
+        bf = self.rng.uniform(8, 35, self.n)
+        muscle = self.rng.uniform(25, 45, self.n)
+        height = self.rng.uniform(150, 200, self.n)
+        columns = cohort.calculate_bia(impedance, bf, muscle, height)
+        for i in range(self.n):
+            expected = bia.calculate_bia(impedance[i], bf[i], muscle[i], height[i])
+            self.assertEqual(expected.keys(), columns.keys())
+            for key, value in expected.items():
+                self.assertAlmostEqual(columns[key][i], value, 9, key)
+
+
+if __name__ == "__main__":
+    unittest.main()
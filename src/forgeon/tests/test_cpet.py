@@ -0,0 +1,80 @@
+"""Breath-by-breath CPET analysis on a synthetic ramp test with known thresholds."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from forgeon.calculators import HRF, load_script
+
+cpet = load_script(f"{HRF}/Aerobic Endurance/CPET.py")
+
+
+def ramp(seconds=720, gap=None, seed=0):
+    """
+    A breath every 2.5 s: VO2 rises to 4000 ml/min at 630 s and then levels
+    off, VT1 at 2000 ml/min (VCO2 slope 0.85 -> 1.25) and respiratory
+    compensation at VCO2 3000 ml/min (VO2 3040). `gap` is a (from, to) span
+    with no breaths.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(0, seconds, 2.5)
+    if gap:
+        t = t[(t < gap[0]) | (t >= gap[1])]
+    vo2 = np.where(t <= 630, 500 + 3500 * t / 630, 4000 + 60 * (t - 630) / 90)
+    vco2 = np.where(vo2 < 2000, 0.85 * vo2, 1700 + 1.25 * (vo2 - 2000))
+    ve = np.where(vco2 < 3000, 0.025 * vco2, 75 + 0.05 * (vco2 - 3000))
+    n = len(t)
+    return {"time": t, "vo2": vo2 + rng.normal(0, 20, n), "vco2": vco2 + rng.normal(0, 20, n),
+            "ve": ve + rng.normal(0, 0.5, n), "hr": 60 + vo2 / 30}
+
+
+class AnalyzeBreathsTest(unittest.TestCase):
+    def test_thresholds_and_plateau(self):
+        result = cpet.analyze_breaths(**ramp(), body_mass=70)
+        self.assertAlmostEqual(result["VT1 VO₂ (ml/min)"], 2000, delta=50)
+        self.assertAlmostEqual(result["VT2 VO₂ (ml/min)"], 3040, delta=50)
+        self.assertAlmostEqual(result["VO₂ Max (ml/min)"], 4050, delta=30)
+        self.assertEqual(result["VO₂ Max (ml/kg/min)"], round(result["VO₂ Max (ml/min)"] / 70, 1))
+        self.assertTrue(result["VO₂ Plateau"])
+        self.assertEqual(result["VT1 HR (bpm)"], round(60 + result["VT1 VO₂ (ml/min)"] / 30))
+
+    def test_missing_ve_breaths_are_left_out(self):
+        data = ramp()
+        expected = cpet.analyze_breaths(**data)["VT2 VO₂ (ml/min)"]
+        data["ve"][[40, 100, 180]] = np.nan
+        self.assertAlmostEqual(cpet.analyze_breaths(**data)["VT2 VO₂ (ml/min)"], expected, delta=20)
+        data["ve"][:] = np.nan
+        self.assertIsNone(cpet.analyze_breaths(**data)["VT2 VO₂ (ml/min)"])
+
+    def test_plateau_looks_back_in_time_across_gaps(self):
+        # No breaths for 45 s of the plateau: the look-back must not reach into the ramp
+        result = cpet.analyze_breaths(**ramp(gap=(645, 690)))
+        self.assertLess(result["Plateau ΔVO₂ (ml/min)"], 150)
+        self.assertTrue(result["VO₂ Plateau"])
+        # Without a plateau the rise over the last minute is reported
+        result = cpet.analyze_breaths(**ramp(seconds=620))
+        self.assertAlmostEqual(result["Plateau ΔVO₂ (ml/min)"], 3500 * 60 / 630, delta=40)
+        self.assertFalse(result["VO₂ Plateau"])
+
+    def test_csv_export_in_chunks(self):
+        data = ramp()
+        data["ve"][50] = np.nan
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cart.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("t (s),VO2 (ml/min),VCO2 (ml/min),VE (L/min),HR (bpm)\n")
+                for row in zip(*(data[k] for k in ("time", "vo2", "vco2", "ve", "hr"))):
+                    f.write(",".join("" if np.isnan(v) else f"{v:.3f}" for v in row) + "\n")
+            from_file = cpet.analyze_cpet_file(path, body_mass=70, chunk_rows=50)
+        from_arrays = cpet.analyze_breaths(**data, body_mass=70)
+        for key in ("VO₂ Max (ml/min)", "VT1 VO₂ (ml/min)", "VT2 VO₂ (ml/min)", "Breaths Analysed"):
+            self.assertAlmostEqual(from_file[key], from_arrays[key], delta=5)
+
+    def test_too_few_breaths(self):
+        with self.assertRaises(ValueError):
+            cpet.analyze_breaths([0, 1, 2], [1000, 1000, 1000], [900, 900, 900])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""The drill trial log and the asyncio drill runtime, run on the virtual clock."""
+import asyncio
+import random
+import unittest
+
+from forgeon.calculators import load_script
+
+drills = load_script("MentalNeuralTraining/script.py")
+
+
+def recorder(athlete, events):
+    """on_event that logs every event and passes it on to a simulated athlete."""
+    def on_event(runner, event):
+        events.append((runner.drill.drill_id, event["event"], event["trial"], event.get("value")))
+        athlete(runner, event)
+    return on_event
+
+
+class TrialLogTest(unittest.TestCase):
+    def test_aggregates_match_a_rescan(self):
+        rng = random.Random(7)
+        log = drills.TrialLog()
+        values = [rng.choice([2000, rng.randint(150, 1500)]) for _ in range(500)]
+        for trial, value in enumerate(values, 1):
+            log.record(trial, value, timestamp=float(trial))
+        self.assertEqual(log.hit_time_sum, sum(v for v in values if v < 2000))
+        self.assertEqual(log.successes, sum(v < 1000 for v in values))
+        self.assertEqual(log.best, min(values))
+
+        drill = drills.DrillExecution("d", "R")
+        drill.results = log
+        summary = drill.summary()
+        self.assertEqual(summary["avg_reaction_time"], sum(v for v in values if v < 2000) / len(values))
+        self.assertEqual(summary["success_rate"], sum(v < 1000 for v in values) / len(values) * 100)
+
+    def test_sequence_of_results(self):
+        log = drills.TrialLog()
+        log.append(drills.DrillResult(1, 320, 5.0))
+        log.record(2, 2000, 8.5)
+        self.assertEqual(len(log), 2)
+        last = log[-1]
+        self.assertEqual((last.trial, last.value, last.timestamp, last.id), (2, 2000, 8.5, "result-2"))
+        self.assertEqual([r.value for r in log], [320, 2000])
+        self.assertEqual(log.trials.itemsize + log.values.itemsize + log.timestamps.itemsize,
+                         2 * drills.array("l").itemsize + 8)
+
+    def test_copy_is_independent(self):
+        log = drills.TrialLog()
+        log.record(1, 300)
+        copy = log.copy()
+        log.record(2, 200)
+        log.clear()
+        self.assertEqual((len(copy), copy.best, copy.hit_time_sum, copy.successes), (1, 300, 300, 1))
+        self.assertEqual((len(log), log.best), (0, None))
+
+
+class DrillRuntimeTest(unittest.TestCase):
+    def run_sessions(self, count, miss_rate=0.0, duration=300):
+        events = []
+
+        async def main():
+            runtime = drills.DrillRuntime()
+            for i in range(count):
+                athlete = drills.SimulatedAthlete(miss_rate=miss_rate, rng=random.Random(i))
+                drill = drills.DrillExecution(f"d{i}", "Reaction Training", estimated_duration=duration)
+                runtime.start(f"s{i}", drill, f"a{i}", on_event=recorder(athlete, events), rng=random.Random(1000 + i))
+            return runtime, await runtime.wait()
+
+        runtime, summaries = drills.run_simulated(main())
+        return runtime, summaries, events
+
+    def test_concurrent_sessions_match_a_replay(self):
+        runtime, summaries, events = self.run_sessions(20, miss_rate=0.2)
+        self.assertEqual(len(summaries), 20)
+        for key, runner in runtime.runners.items():
+            drill = runner.drill
+            self.assertEqual(drill.phase, "completed")
+            self.assertEqual(drill.session.status, "completed")
+            self.assertEqual(len(drill.session.results), 10)
+            # The same reaction times replayed give the same summary
+            values = [r.value for r in drill.results]
+            replay = drills.DrillExecution(drill.drill_id, drill.name)
+            replay.replay([None if v == 2000 else v for v in values])
+            self.assertEqual(replay.summary(), summaries[key])
+            trials = [e for e in events if e[0] == drill.drill_id and e[1] == "trial"]
+            self.assertEqual([e[3] for e in trials], values)
+        self.assertIn(2000, [r.value for runner in runtime.runners.values() for r in runner.drill.results])
+
+    def test_responses_follow_the_virtual_clock(self):
+        runtime, summaries, _ = self.run_sessions(1)
+        values = [r.value for r in runtime.runners["s0"].drill.results]
+        # SimulatedAthlete taps after normal(350, 60) ms
+        self.assertTrue(all(100 < v < 600 for v in values), values)
+
+    def test_duration_ends_the_drill(self):
+        # Each trial is at least a 2 s wait plus a 3 s rest
+        runtime, summaries, _ = self.run_sessions(1, duration=12)
+        self.assertLess(summaries["s0"]["trials_completed"], 10)
+
+    def test_taps_outside_the_window_and_duplicate_sessions(self):
+        async def main():
+            runtime = drills.DrillRuntime()
+            runtime.start("s", drills.DrillExecution("d", "R"), "a", rng=random.Random(0))
+            await asyncio.sleep(0)
+            early = runtime.tap("s")
+            with self.assertRaises(ValueError):
+                runtime.start("s", drills.DrillExecution("d", "R"), "a")
+            summaries = await runtime.wait()
+            return early, runtime.tap("unknown"), summaries
+
+        early, unknown, summaries = drills.run_simulated(main())
+        self.assertFalse(early)
+        self.assertFalse(unknown)
+        self.assertEqual(summaries["s"]["best_time"], 2000)  # nobody tapped: every trial missed
+
+
+if __name__ == "__main__":
+    unittest.main()
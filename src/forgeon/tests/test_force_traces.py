@@ -0,0 +1,71 @@
+"""The raw force-trace analysers against single-trial and in-memory runs."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from forgeon.calculators import HRF, SKILL, load_script, run_test
+
+
+class ForceTraceTest(unittest.TestCase):
+    rng = np.random.default_rng(1)
+
+    def imtp_trial(self, n, peak):
+        force = np.full(n, 800.0) + self.rng.normal(0, 3, n)
+        t = np.arange(n - 1000)
+        force[1000:] += peak * (1 - np.exp(-t / 150))
+        return force
+
+    def test_time_to_peak_force_arrays_and_file_match_scalar(self):
+        ttpf = load_script(f"{SKILL}/Anaerobic & Power/Time-to-PeakForce.py")
+        trials = np.stack([self.imtp_trial(1500, peak) for peak in (1200, 1800, 2500)]).astype(np.float32)
+        expected = [ttpf.time_to_peak_force(trial.astype(float).tolist(), 1000) for trial in trials]
+        keys = ("Onset Index", "Peak Index", "Time-to-Peak Force (ms)")
+
+        def check(results):
+            self.assertEqual(len(results), len(expected))
+            for got, want in zip(results, expected):
+                self.assertEqual([got[k] for k in keys], [want[k] for k in keys])
+                self.assertAlmostEqual(got["Peak Force (N)"], want["Peak Force (N)"], 2)
+
+        check(run_test("time-to-peak-force", {"force_values": trials.tolist(), "sampling_rate": 1000}))
+        check(run_test("time-to-peak-force", {"force_values": trials, "sampling_rate": 1000}))
+        check([run_test("time-to-peak-force", {"force_values": trial, "sampling_rate": 1000}) for trial in trials])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ttpf.bin")
+            trials.astype("<f4").tofile(path)
+            check(run_test("time-to-peak-force", {"path": path, "sampling_rate": 1000,
+                                                  "samples_per_trial": trials.shape[1]}))
+
+    def test_ragged_imtp_trials_score_as_single_trials(self):
+        imtp = load_script(f"{HRF}/Muscular Strength & Endurance/IMTP.py")
+        trials = [self.imtp_trial(2000, 2000), self.imtp_trial(1900, 2100), self.imtp_trial(1200, 1500)]
+        together = imtp.analyze_imtp_traces(trials, 1000, body_mass=80)
+        for i, trial in enumerate(trials):
+            alone = imtp.analyze_imtp_traces([trial], 1000, body_mass=80)
+            for key, column in alone.items():
+                np.testing.assert_array_equal(together[key][i], column[0], err_msg=key)
+        with self.assertRaises(ValueError):
+            imtp.analyze_imtp_traces([trials[0], [900.0]], 1000)
+
+    def test_jump_file_matches_in_memory_trace(self):
+        jump = load_script(f"{SKILL}/Anaerobic & Power/VerticalJump.py")
+        force = np.full(20000, 800.0) + self.rng.normal(0, 5, 20000)
+        for start in (3000, 7000, 7600, 12000):
+            force[start:start + 500] = self.rng.normal(0, 2, 500)
+        for calibration, dtype in ((1.0, "<f4"), (0.5, "<i2")):
+            raw = (force / calibration).astype(dtype)
+            expected = jump.analyze_jump_force(raw.astype(np.float64) * calibration, 1000)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "force.bin")
+                raw.tofile(path)
+                result = jump.analyze_jump_file(path, 1000, dtype=dtype, calibration=calibration,
+                                                block_samples=4096)
+            self.assertEqual(len(result["Takeoff Index"]), 4)
+            for key, column in expected.items():
+                np.testing.assert_array_equal(result[key], column, err_msg=key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""The timing-gate stream against the splits the simulated athletes ran."""
+import unittest
+
+from forgeon.gates import GateStream, Lane, process_events
+
+SPRINT = {"name": "A", "distances": (0, 10, 20, 30), "flying_zone": (2, 3)}
+SPLITS = {"a1": (1.90, 1.30, 1.20), "a2": (2.00, 1.40, 1.10), "a3": (1.85, 1.35, 1.25)}
+
+
+def sprint(start, splits):
+    """The four gate breaks of one run starting at `start`."""
+    events, t = [{"lane": "A", "gate": 0, "time": start}], start
+    for gate, split in enumerate(splits, 1):
+        t += split
+        events.append({"lane": "A", "gate": gate, "time": round(t, 3)})
+    return events
+
+
+def session(runners, gap=3.0):
+    """Runs `gap` s apart (so consecutive runs overlap), with the breaks in time order."""
+    events = [e for i, athlete in enumerate(runners) for e in sprint(i * gap, SPLITS[athlete])]
+    return sorted(events, key=lambda e: e["time"])
+
+
+class GateStreamTest(unittest.TestCase):
+    def run_session(self, runners, events, queue=None):
+        queue = runners if queue is None else queue
+        return process_events([SPRINT], events, [{"lane": "A", "athlete": a} for a in queue])
+
+    def test_overlapping_runs_with_double_breaks(self):
+        runners = ["a1", "a2", "a3", "a1"]
+        events = session(runners)
+        doubles = [{**e, "time": e["time"] + 0.05} for e in events if e["gate"] == 0]
+        outcome = self.run_session(runners, sorted(events + doubles, key=lambda e: e["time"]))
+        self.assertEqual(outcome["Double Breaks"], 4)
+        self.assertEqual([r["Athlete"] for r in outcome["Attempts"]], runners)
+        self.assertEqual([r["Attempt"] for r in outcome["Attempts"]], [1, 2, 3, 4])
+        for result in outcome["Attempts"]:
+            splits = SPLITS[result["Athlete"]]
+            self.assertTrue(result["Complete"])
+            self.assertAlmostEqual(result["totalTime"], sum(splits), places=3)
+            self.assertEqual([d["split"] for d in result["distances"]], list(splits))
+            self.assertEqual(result["Max Speed (m/s)"], round(10 / splits[2], 2))
+        a1 = outcome["Athletes"][0]
+        self.assertEqual((a1["Athlete"], a1["Attempts"], a1["Best Time A (s)"]), ("a1", 2, 4.4))
+        self.assertEqual(outcome["Unassigned Attempts"], 0)
+
+    def test_out_of_order_breaks(self):
+        runners = ["a1", "a2", "a3"]
+        in_order = self.run_session(runners, session(runners))
+        events = session(runners)
+        # a3's start break arrives after its 10 m break, and a2's finish before its 20 m break
+        start = next(e for e in events if e["gate"] == 0 and e["time"] == 6.0)
+        events.remove(start)
+        events.insert(events.index(next(e for e in events if e["time"] == 7.85)) + 1, start)
+        i, j = (events.index(next(e for e in events if e["time"] == t)) for t in (6.4, 7.5))
+        events[i], events[j] = events[j], events[i]
+        self.assertEqual(self.run_session(runners, events)["Athletes"], in_order["Athletes"])
+
+    def test_attempts_without_a_queued_athlete(self):
+        runners = ["a1", "a2", "a3"]
+        outcome = self.run_session(runners, session(runners), queue=["a1", "a2"])
+        self.assertEqual([r["Athlete"] for r in outcome["Attempts"]], ["a1", "a2", None])
+        self.assertEqual(outcome["Unassigned Attempts"], 1)
+        self.assertEqual([s["Athlete"] for s in outcome["Athletes"]], ["a1", "a2"])
+
+    def test_incomplete_attempts(self):
+        events = [e for e in sprint(0.0, SPLITS["a1"]) if e["gate"] != 3]
+        events += sprint(30.0, SPLITS["a2"])
+        stream = GateStream([Lane(**SPRINT)])
+        stream.queue("A", "a1")
+        stream.queue("A", "a2")
+        finished = []
+        for e in events:
+            finished += stream.push(e["lane"], e["gate"], e["time"])
+        # The unfinished run is reported once max_attempt_s has passed
+        self.assertEqual(len(finished), 2)
+        self.assertEqual((finished[0]["Complete"], finished[0]["totalTime"]), (False, None))
+        self.assertNotIn("Best Time A (s)", stream.athlete_summary("a1"))
+        self.assertTrue(finished[1]["Complete"])
+        self.assertEqual(stream.flush(), [])
+        self.assertEqual(stream.push("A", 1, 2.0), [])
+        self.assertEqual(stream.dropped, 1)
+
+    def test_505_lane(self):
+        lane = {"name": "B", "distances": (0,), "mode": "505"}
+        queue = [{"lane": "B", "athlete": "b1", "side": "left"},
+                 {"lane": "B", "athlete": "b1", "side": "right"},
+                 {"lane": "B", "athlete": "b2", "side": "left"}]
+        events = [{"lane": "B", "gate": 0, "time": t} for t in (0.0, 2.31, 5.0, 7.45, 12.36, 10.0)]
+        outcome = process_events([lane], events, queue)
+        self.assertEqual([r["505 Time (s)"] for r in outcome["Attempts"]], [2.31, 2.45, 2.36])
+        self.assertEqual(outcome["Athletes"][0]["Left Turn Time (s)"], 2.31)
+        self.assertEqual(outcome["Athletes"][0]["Right Turn Time (s)"], 2.45)
+        with self.assertRaises(ValueError):
+            process_events([lane], [{"lane": "B", "gate": 1, "time": 0.0}])
+
+    def test_long_session_keeps_no_results(self):
+        seen = []
+        stream = GateStream([Lane(**SPRINT)], on_result=seen.append)
+        for i in range(500):
+            stream.queue("A", f"a{i % 3 + 1}")
+        for e in session([f"a{i % 3 + 1}" for i in range(500)]):
+            stream.push(e["lane"], e["gate"], e["time"])
+        stream.flush()
+        self.assertEqual(len(seen), 500)
+        self.assertLessEqual(len(stream.closed["A"]), stream.max_open)
+        self.assertEqual(sorted(stream.athletes), ["a1", "a2", "a3"])
+        self.assertEqual(sum(b["attempts"] for b in stream.athletes.values()), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
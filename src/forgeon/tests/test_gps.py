@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from forgeon.calculators import HRF, load_script
+
+METRES_PER_DEG_LAT = 6371000 * np.pi / 180
+
+
+def straight_run(speed=3.5, rate=10, duration=720):
+    """Fixes for a run due north at a constant speed."""
+    time = np.arange(0, duration + 1 / rate, 1 / rate)
+    lat = 51.5 + speed * time / METRES_PER_DEG_LAT
+    lon = np.full(time.shape, -0.1)
+    return time, lat, lon
+
+
+class GPSTrackTest(unittest.TestCase):
+    cooper = load_script(f"{HRF}/Aerobic Endurance/coppertest.py")
+
+    def test_nan_fixes_are_dropped_and_counted(self):
+        time, lat, lon = straight_run()
+        clean = self.cooper.cooper_track_outcomes(time, lat, lon)
+        lat, lon = lat.copy(), lon.copy()
+        lat[[100, 2000, 5000]] = np.nan
+        lon[3000] = np.nan
+        lat[4000] = 123.0  # out of range
+        result = self.cooper.cooper_track_outcomes(time, lat, lon)
+        self.assertEqual(result["Fixes"], len(time))
+        self.assertEqual(result["Invalid Fixes"], 5)
+        self.assertEqual(clean["Invalid Fixes"], 0)
+        self.assertAlmostEqual(result["Distance Covered (m)"], clean["Distance Covered (m)"], delta=1.0)
+        self.assertAlmostEqual(clean["Distance Covered (m)"], 2520, delta=5)
+
+    def test_chunked_matches_whole_track(self):
+        time, lat, lon = straight_run()
+        lat[::97] = np.nan
+        whole = self.cooper.cooper_track_outcomes(time, lat, lon)
+        track = self.cooper.GPSTrack()
+        for start in range(0, len(time), 333):
+            track.add(time[start:start + 333], lat[start:start + 333], lon[start:start + 333])
+        self.assertEqual(track.finish(), whole)
+
+    def test_empty_csv_cells_do_not_fail_the_file(self):
+        time, lat, lon = straight_run(rate=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "squad.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("athlete,time,lat,lon\n")
+                for i, (t, la, lo) in enumerate(zip(time, lat, lon)):
+                    for athlete in ("A", "B"):
+                        cell = "" if athlete == "B" and i % 100 == 50 else f"{la:.8f}"
+                        f.write(f"{athlete},{t},{cell},{lo}\n")
+            results = self.cooper.cooper_squad_file(path, chunk_rows=250)
+        self.assertEqual([r["Athlete"] for r in results], ["A", "B"])
+        self.assertEqual([r["Invalid Fixes"] for r in results], [0, 7])
+        self.assertAlmostEqual(results[0]["Distance Covered (m)"], results[1]["Distance Covered (m)"], delta=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
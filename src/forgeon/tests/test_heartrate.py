@@ -0,0 +1,92 @@
+"""Heart-rate summaries and how they are attached to the endurance results."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from forgeon import heartrate
+from forgeon.calculators import run_test
+
+
+def session(peak=185.0, rest=70.0, seconds=600, end=400):
+    """A 1 Hz trace rising to `peak` at `end` s and recovering after it."""
+    time = np.arange(seconds, dtype=np.float64)
+    hr = np.where(time <= end, rest + (peak - rest) * time / end, peak - 0.5 * (time - end))
+    return time, hr
+
+
+def write_csv(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("athlete,time,hr\n")
+        f.writelines(f"{athlete},{time},{hr}\n" for athlete, time, hr in rows)
+
+
+class SummaryTest(unittest.TestCase):
+    def test_trace_summary(self):
+        time, hr = session()
+        hr[100] = 250.0  # out of range
+        hr[200] += 40.0  # spike
+        summary = heartrate.summarize(time, hr, hr_max=185, exercise_end=400)
+        self.assertEqual(summary["Max HR (bpm)"], 185)
+        self.assertEqual(summary["Samples Rejected"], 2)
+        self.assertAlmostEqual(summary["HRR 60 s (bpm)"], 30, delta=1)
+        self.assertAlmostEqual(summary["HRR 120 s (bpm)"], 60, delta=1)
+        # The rejected samples are bridged from their neighbours
+        self.assertEqual(sum(summary["Time in Zone (s)"].values()), np.count_nonzero(session()[1] >= 92.5))
+        self.assertIsNone(summary["RMSSD (ms)"])
+
+    def test_rr_summary(self):
+        rr = np.tile([800.0, 860.0], 300)
+        rr[50] = 3000.0  # out of range
+        summary = heartrate.summarize(rr=rr)
+        self.assertEqual(summary["Beats Rejected"], 1)
+        self.assertEqual(summary["RMSSD (ms)"], 60.0)
+        self.assertEqual(summary["pNN50 (%)"], 100.0)
+
+    def test_long_gaps_stay_empty(self):
+        time, hr = session()
+        keep = (time < 300) | (time > 320)
+        seconds, bpm, _ = heartrate.clean_hr(time[keep], hr[keep])
+        self.assertTrue(np.isnan(bpm[301:320]).all())
+        self.assertTrue(np.isfinite(bpm[:300]).all())
+
+
+class SquadFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "hr.csv")
+        time, hr = session()
+        rows = [(athlete, t, h + offset) for t, h in zip(time, hr) for athlete, offset in (("A", 0), ("B", -10))]
+        rows[7] = ("B", 3.0, "n/a")  # one unreadable cell
+        write_csv(self.path, rows)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unparsable_cells_are_dropped(self):
+        summaries = heartrate.squad_file(self.path, chunk_rows=100)
+        time, hr = session()
+        keep = time != 3
+        expected = heartrate.summarize(time[keep], hr[keep] - 10)
+        self.assertEqual(summaries["B"]["Samples Rejected"], 1)
+        for key in ("Max HR (bpm)", "Mean HR (bpm)", "Time in Zone (s)", "HRR 60 s (bpm)"):
+            self.assertEqual(summaries["B"][key], expected[key])
+        self.assertEqual(summaries["A"]["Max HR (bpm)"], 185)
+
+    def test_single_result_takes_the_named_athlete(self):
+        result = run_test("cooper-test", {"distance": 2800, "hr_path": self.path, "athlete": "B"})
+        self.assertEqual(result["Heart Rate"]["Max HR (bpm)"], 175)
+        with self.assertRaises(ValueError):
+            run_test("cooper-test", {"distance": 2800, "hr_path": self.path})
+
+    def test_squad_result_gets_each_athlete(self):
+        squad = run_test("shuttle-squad", {"athletes": [{"athlete": "A", "level": "9.4"},
+                                                        {"athlete": "C", "level": "9.4"}],
+                                           "hr_path": self.path})
+        self.assertEqual(squad[0]["Heart Rate"]["Max HR (bpm)"], 185)
+        self.assertNotIn("Heart Rate", squad[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
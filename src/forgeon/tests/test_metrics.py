@@ -0,0 +1,31 @@
+import tracemalloc
+import unittest
+from unittest import mock
+
+from forgeon import metrics
+
+
+class MetricsTest(unittest.TestCase):
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def run_traced(self):
+        stats = metrics.Metrics(trace_memory=True)
+        stats.run("shuttle-squad", {"athletes": [{"athlete": str(i), "level": 9} for i in range(200)]})
+        stats.run("cooper-test", {"distance": 2800})
+        return stats.snapshot()
+
+    def test_peak_memory_per_test(self):
+        snapshot = self.run_traced()
+        self.assertGreater(snapshot["tests"]["shuttle-squad"]["peakBytes"], 0)
+
+    def test_peak_memory_without_reset_peak(self):
+        # Python < 3.9 has no tracemalloc.reset_peak
+        with mock.patch.object(metrics, "_reset_peak", tracemalloc.clear_traces):
+            snapshot = self.run_traced()
+        squad, single = snapshot["tests"]["shuttle-squad"], snapshot["tests"]["cooper-test"]
+        self.assertGreater(squad["peakBytes"], single["peakBytes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
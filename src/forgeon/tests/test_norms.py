@@ -0,0 +1,25 @@
+import math
+import unittest
+
+import numpy as np
+
+from forgeon import norms
+
+
+class NormsTest(unittest.TestCase):
+    def test_rate_squad_matches_rate(self):
+        for test_id in ("illinois-agility", "t-test", "ioct"):
+            values = np.linspace(5, 40, 141)
+            for sex in ("male", "female"):
+                squad = norms.rate_squad(test_id, values, sex)
+                for i, value in enumerate(values):
+                    single = norms.rate(test_id, float(value), sex)
+                    self.assertEqual(squad["Performance Rating"][i], single["Performance Rating"])
+                    if single["Percentile"] is None:
+                        self.assertTrue(math.isnan(squad["Percentile"][i]))
+                    else:
+                        self.assertEqual(squad["Percentile"][i], single["Percentile"])
+
+
+if __name__ == "__main__":
+    unittest.main()
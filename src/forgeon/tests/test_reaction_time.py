@@ -0,0 +1,78 @@
+"""The streaming reaction-time accumulators against reaction_time_outcomes."""
+import json
+import random
+import unittest
+
+from forgeon.calculators import SKILL, load_script
+
+reaction = load_script(f"{SKILL}/Reaction, Coordination & Reflex/SimpleReactionTime.py")
+
+
+class ReactionTimeStatsTest(unittest.TestCase):
+    rng = random.Random(3)
+
+    def trials(self, n):
+        return [round(self.rng.uniform(150, 450), 3) for _ in range(n)]
+
+    def assertMatches(self, outcomes, expected):
+        for stimulus in ("Light", "Sound", "Combined"):
+            got, want = outcomes[stimulus], expected[stimulus]
+            if want is None:
+                self.assertIsNone(got)
+                continue
+            self.assertEqual(got["Trial Count"], len(want["Trials"]))
+            self.assertEqual(got["Average Reaction Time (ms)"], want["Average Reaction Time (ms)"])
+            self.assertEqual(got["Best Reaction Time (ms)"], want["Best Reaction Time (ms)"])
+            self.assertAlmostEqual(got["Consistency (SD, ms)"], want["Consistency (SD, ms)"], delta=0.01)
+
+    def test_add_and_extend_match_batch(self):
+        light, sound = self.trials(500), self.trials(333)
+        expected = reaction.reaction_time_outcomes(light, sound)
+
+        one_by_one = reaction.ReactionTimeAccumulator()
+        for rt in light:
+            one_by_one.add("light", rt)
+        for rt in sound:
+            one_by_one.add("Sound", rt)
+        self.assertMatches(one_by_one.outcomes(), expected)
+
+        chunked = reaction.ReactionTimeAccumulator()
+        for i in range(0, len(light), 64):
+            chunked.extend("light", light[i:i + 64])
+        chunked.extend("sound", sound)
+        self.assertMatches(chunked.outcomes(), expected)
+
+    def test_merged_workers_match_batch(self):
+        light, sound = self.trials(400), self.trials(400)
+        expected = reaction.reaction_time_outcomes(light, sound)
+        parts = []
+        for k in range(4):
+            part = reaction.ReactionTimeAccumulator()
+            part.extend("light", light[k::4])
+            part.extend("sound", sound[k * 100:(k + 1) * 100])
+            # Partial results travel between processes as JSON
+            parts.append(reaction.ReactionTimeAccumulator.from_dict(json.loads(json.dumps(part.to_dict()))))
+        merged = reaction.ReactionTimeAccumulator()
+        for part in parts:
+            merged.merge(part)
+        self.assertMatches(merged.outcomes(), expected)
+
+    def test_empty_stimulus(self):
+        acc = reaction.ReactionTimeAccumulator()
+        acc.extend("light", [])
+        acc.add("light", 250.0)
+        self.assertMatches(acc.outcomes(), reaction.reaction_time_outcomes([250.0], []))
+        with self.assertRaises(ValueError):
+            acc.add("touch", 250.0)
+
+    def test_mean_is_exact_for_large_offsets(self):
+        trials = [1e9 + 0.1] * 3 + [0.3]
+        stats = reaction.ReactionTimeStats()
+        for rt in trials:
+            stats.add(rt)
+        self.assertEqual(stats.summary()["Average Reaction Time (ms)"],
+                         reaction.analyze_reaction_times(trials)["Average Reaction Time (ms)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""The binary readiness log, its saved index and the daily-readiness calculator."""
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from forgeon.calculators import SKILL, load_script, run_test
+
+readiness = load_script(f"{SKILL}/Neuromuscular Readiness/DailyReadinessAssessment.py")
+
+END = datetime(2026, 3, 1, 8, 0)
+
+
+class ProbedLog(readiness.ReadinessLog):
+    """Records how many records the index covered when the log was opened."""
+
+    def refresh(self):
+        self.__dict__.setdefault("loaded", self._indexed)
+        super().refresh()
+
+
+def assessment(rng):
+    return readiness.readiness_outcomes({k: rng.randint(1, 5) for k in readiness.QUESTIONS})
+
+
+class ReadinessLogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "readiness.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def fill(self, log, days=40, athletes=("A", "B", "C")):
+        """Log one assessment per athlete per day, in shuffled order; returns them by athlete."""
+        rng = random.Random(5)
+        rows = [(athlete, END - timedelta(days=day, hours=rng.random()), assessment(rng))
+                for day in range(days) for athlete in athletes]
+        rng.shuffle(rows)
+        for athlete, when, results in rows:
+            log.append(athlete, results, when)
+        logged = {}
+        for athlete, when, results in sorted(rows, key=lambda row: row[1]):
+            logged.setdefault(athlete, []).append((when, results["Readiness %"]))
+        return logged
+
+    def test_windows_match_a_rescan(self):
+        with readiness.ReadinessLog(self.path) as log:
+            logged = self.fill(log)
+            for athlete, rows in logged.items():
+                entries = log.entries(athlete)
+                self.assertEqual([e["Date"] for e in entries], [when for when, _ in rows])
+                week = [pct for when, pct in rows if END - timedelta(days=7) <= when < END]
+                summary = log.window(athlete, 7, END)
+                self.assertEqual(summary["Entries"], len(week))
+                self.assertEqual(summary["Mean Readiness %"], round(sum(week) / len(week), 1))
+                self.assertEqual(summary["Min Readiness %"], min(week))
+            self.assertEqual(log.acute_chronic("nobody", END)["Acute:Chronic Ratio"], None)
+
+    def test_saved_index_is_reused_and_caught_up(self):
+        with readiness.ReadinessLog(self.path) as log:
+            self.fill(log)
+            log.save_index()
+            log.append("A", assessment(random.Random(1)), END)
+            expected = log.entries("A")
+        with ProbedLog(self.path) as log:
+            self.assertEqual(log.loaded, 120)
+            self.assertEqual(log.entries("A"), expected)
+
+    def test_index_for_another_log_is_ignored(self):
+        other = os.path.join(self.tmp.name, "other.bin")
+        with readiness.ReadinessLog(other) as log:
+            self.fill(log, athletes=("X",))
+            log.save_index()
+        with readiness.ReadinessLog(self.path) as log:
+            logged = self.fill(log, days=50, athletes=("A",))
+        os.replace(other + ".idx", self.path + ".idx")  # same size or smaller, wrong contents
+        with ProbedLog(self.path) as log:
+            self.assertEqual(log.loaded, 0)
+            self.assertEqual(log.athletes(), ["A"])
+            self.assertEqual(len(log.entries("A")), len(logged["A"]))
+
+    def test_log_rewritten_in_place_is_rescanned(self):
+        with readiness.ReadinessLog(self.path) as log:
+            self.fill(log, days=10, athletes=("A",))
+            log.save_index()
+        with open(self.path, "r+b") as f:  # same size, same last record
+            f.seek(8)
+            f.write(b"Z")
+        with ProbedLog(self.path) as log:
+            self.assertEqual(log.loaded, 0)
+            self.assertEqual(sorted(log.athletes()), ["A", "Z"])
+
+    def test_damaged_index_is_rebuilt(self):
+        with readiness.ReadinessLog(self.path) as log:
+            self.fill(log, days=5)
+            log.save_index()
+        with open(self.path + ".idx", "rb") as f:
+            saved = f.read()
+        for damaged in (b"", b"\0" * 16, saved[:-5]):
+            with open(self.path + ".idx", "wb") as f:
+                f.write(damaged)
+            with readiness.ReadinessLog(self.path) as log:
+                self.assertEqual(sorted(log.athletes()), ["A", "B", "C"])
+                self.assertEqual(len(log.entries("C")), 5)
+
+
+class DailyReadinessCalculatorTest(unittest.TestCase):
+    inputs = {"sleep_quality": 4, "fatigue": 4, "muscle_soreness": 3, "stress_levels": 5, "mood": 4}
+
+    def test_log_path_appends_and_reports_the_trend(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "readiness.bin")
+            self.assertNotIn("Trend", run_test("daily-readiness", self.inputs))
+            run_test("daily-readiness", {**self.inputs, "log_path": path}, {"athleteId": "A"})
+            result = run_test("daily-readiness", {**self.inputs, "mood": 2, "log_path": path, "athlete": "A"})
+            self.assertEqual(result["Trend"]["Acute"]["Entries"], 2)
+            self.assertEqual(result["Trend"]["Acute"]["Mean Readiness %"], 76.0)
+            with self.assertRaises(ValueError):
+                run_test("daily-readiness", {**self.inputs, "log_path": path})
+            with readiness.ReadinessLog(path) as log:
+                self.assertEqual(len(log.entries("A")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
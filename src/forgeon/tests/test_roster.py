@@ -0,0 +1,43 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from forgeon import roster
+
+GOOD = {"athlete": "A", "body_mass": 80, "one_rm": 140, "lift_type": "Squat"}
+
+
+class RosterTest(unittest.TestCase):
+    def test_bad_ndjson_lines_become_error_rows(self):
+        lines = "\n".join([
+            json.dumps(GOOD),
+            "{not json",
+            "[1, 2]",
+            json.dumps({"athlete": "B", "body_mass": 0, "one_rm": 100}),
+            "",
+            json.dumps({**GOOD, "athlete": "C"}),
+        ]) + "\n"
+        for workers in (1, 2):
+            rows = roster.read_rows(io.StringIO(lines), "ndjson")
+            results = list(roster.score_roster("one-rm", rows, workers=workers, chunk_size=2))
+            self.assertEqual([r["row"] for r in results], [1, 2, 3, 4, 5])
+            self.assertEqual([r["ok"] for r in results], [True, False, False, False, True])
+            self.assertEqual(results[1]["error"]["type"], "JSONDecodeError")
+            self.assertEqual(results[2]["error"]["message"], "A roster row must be a JSON object")
+            self.assertEqual(results[3]["error"]["type"], "ValueError")
+            self.assertEqual(results[4]["output"]["Athlete"], "C")
+
+    def test_csv_roster_end_to_end(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, target = Path(tmp, "roster.csv"), Path(tmp, "out.ndjson")
+            source.write_text("athlete,body_mass,one_rm\nA,80,140\nB,,100\n", encoding="utf-8")
+            roster.main(["one-rm", str(source), "-o", str(target)])
+            results = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([r["ok"] for r in results], [True, False])
+        self.assertEqual(results[0]["output"]["Relative Strength (kg/kg)"], 1.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from forgeon import shuttles
+from forgeon.calculators import HRF, SKILL, SRC_DIR, load_script
+
+YOYO = f"{SKILL}/Speed, Acceleration & Agility/Yo-YoIR.py"
+
+
+class ShuttleTest(unittest.TestCase):
+    def test_squad_matches_single_beep_test(self):
+        beep = load_script(f"{HRF}/Aerobic Endurance/Shuttlerun.py")
+        table = shuttles.stage_table("beep-test")
+        levels, bouts = zip(*[(level, bout) for level in range(1, 15)
+                              for bout in range(1, table.count[level] + 1)])
+        squad = shuttles.squad_results("beep-test", levels, bouts)
+        for i, (level, bout) in enumerate(zip(levels, bouts)):
+            single = beep.shuttle_run_outcomes(level, bout)
+            self.assertEqual(single["Total Shuttles"], squad["Total Bouts"][i])
+            self.assertAlmostEqual(single["Total Distance (m)"], squad["Distance (m)"][i], 6)
+            self.assertAlmostEqual(single["Estimated VO₂ Max (ml/kg/min)"],
+                                   squad["Estimated VO2max (ml/kg/min)"][i], 2)
+
+    def test_yoyo_level_vo2max_matches_squad(self):
+        yoyo = load_script(YOYO)
+        for version, level in ((1, "17.2"), (2, "21.3")):
+            single = yoyo.yoyo_ir_level_outcomes(*shuttles.parse_level(level), version=version)
+            squad = shuttles.squad_outcomes(f"yoyo-ir{version}", [{"athlete": "A", "level": level}])[0]
+            self.assertEqual(single["Total Distance (m)"], squad["Distance (m)"])
+            self.assertEqual(single["Estimated VO2max (ml/kg/min)"], squad["Estimated VO2max (ml/kg/min)"])
+
+    def test_single_results_run_without_numpy(self):
+        code = (
+            "import sys; sys.modules['numpy'] = None\n"
+            "from forgeon.calculators import HRF, load_script\n"
+            "load_script(HRF + '/Aerobic Endurance/Shuttlerun.py').shuttle_run_outcomes(9, 4)\n"
+            f"load_script({YOYO!r}).yoyo_ir_level_outcomes(17, 2, 2)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+    def test_squad_outcomes_level_notation(self):
+        a = shuttles.squad_outcomes("yoyo-ir1", [{"athlete": "A", "level": "17.2"}])
+        b = shuttles.squad_outcomes("yoyo-ir1", [{"athlete": "A", "level": 17, "bout": 2}])
+        self.assertEqual(a[0]["Distance (m)"], b[0]["Distance (m)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
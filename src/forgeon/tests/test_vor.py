@@ -0,0 +1,64 @@
+"""Head-impulse (vHIT) gain from synthetic head and eye velocity traces."""
+import unittest
+
+import numpy as np
+
+from forgeon.calculators import SKILL, load_script
+
+RATE = 250
+
+
+def impulses(gains, saccades=None):
+    """
+    One 1.5 s impulse per (side, gain), peaking at 250 deg/s 0.3 s in, with
+    the raw (opposite-sign) eye trace; `saccades` maps impulse number to the
+    time (s) of a catch-up saccade.
+    """
+    t = np.arange(int(1.5 * RATE)) / RATE
+    bump = 250 * np.exp(-0.5 * ((t - 0.3) / 0.04) ** 2)
+    head, eye = [], []
+    for i, (side, gain) in enumerate(gains):
+        eye.append(-gain * side * bump)
+        if saccades and i in saccades:
+            eye[-1] = eye[-1] - side * 150 * np.exp(-0.5 * ((t - saccades[i]) / 0.01) ** 2)
+        head.append(side * bump)
+    return np.concatenate(head), np.concatenate(eye)
+
+
+class HeadImpulseTest(unittest.TestCase):
+    vor = load_script(f"{SKILL}/Reaction, Coordination & Reflex/Vestibulo-OcularReflex.py")
+
+    def test_segments_every_impulse(self):
+        head, _ = impulses([(1, 1.0), (-1, 1.0)] * 3)
+        start, end, peak = self.vor.segment_impulses(head, RATE)
+        self.assertEqual(len(start), 6)
+        self.assertTrue(((start < peak) & (peak < end)).all())
+        self.assertTrue((np.abs(head[peak]) == 250).all())
+
+    def test_side_gains_and_asymmetry(self):
+        head, eye = impulses([(1, 0.95), (-1, 0.6)] * 5)
+        time = np.arange(len(head)) / RATE
+        for method in ("area", "regression"):
+            result = self.vor.analyze_head_impulses(head, eye, time=time, method=method)
+            self.assertEqual((result["Left Impulses"], result["Right Impulses"]), (5, 5))
+            self.assertAlmostEqual(result["Right VOR Gain"], 0.95, 2)
+            self.assertAlmostEqual(result["Left VOR Gain"], 0.6, 2)
+            self.assertAlmostEqual(result["Gain Asymmetry (%)"], 35 / 155 * 100, 1)
+            self.assertEqual(result["Left Covert Saccades (%)"], 0.0)
+
+    def test_covert_and_overt_saccades(self):
+        head, eye = impulses([(1, 0.95), (-1, 0.6)] * 4, saccades={1: 0.36, 3: 0.36, 5: 0.5})
+        result = self.vor.analyze_head_impulses(head, eye, rate_hz=RATE)
+        self.assertEqual(result["Left Covert Saccades (%)"], 50.0)
+        self.assertEqual(result["Left Overt Saccades (%)"], 25.0)
+        self.assertEqual(result["Right Covert Saccades (%)"], 0.0)
+        # Desaccading keeps the gain close to the true one
+        self.assertAlmostEqual(result["Left VOR Gain"], 0.6, delta=0.05)
+
+    def test_no_impulses(self):
+        with self.assertRaises(ValueError):
+            self.vor.analyze_head_impulses(np.zeros(500), np.zeros(500), rate_hz=RATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
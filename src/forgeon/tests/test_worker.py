@@ -0,0 +1,118 @@
+import io
+import json
+import unittest
+
+from forgeon import frames, worker
+from forgeon.cache import ResultCache
+from forgeon.calculators import to_json
+
+
+def serve_lines(*lines, **kwargs):
+    """Run the NDJSON worker over the given input lines; returns the replies after the banner."""
+    out = io.StringIO()
+    worker.serve(io.StringIO("".join(line + "\n" for line in lines)), out, **kwargs)
+    banner, *replies = out.getvalue().splitlines()
+    assert json.loads(banner) == {"ready": True}
+    return [json.loads(reply) for reply in replies]
+
+
+class HandleLineTest(unittest.TestCase):
+    def test_ok_reply(self):
+        reply = json.loads(worker.handle_line({"id": 7, "testId": "cooper-test", "inputs": {"distance": 2800}}))
+        self.assertEqual(reply["id"], 7)
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["testId"], "cooper-test")
+        self.assertIn("Estimated VO₂ Max (ml/kg/min)", reply["output"])
+
+    def test_calculator_error_is_a_reply(self):
+        reply = json.loads(worker.handle_line({"id": 1, "testId": "cooper-test", "inputs": {}}))
+        self.assertFalse(reply["ok"])
+        self.assertEqual(reply["error"]["type"], "ValueError")
+
+    def test_unknown_test(self):
+        reply = json.loads(worker.handle_line({"id": 2, "testId": "no-such-test", "inputs": {}}))
+        self.assertFalse(reply["ok"])
+        self.assertEqual(reply["testId"], "no-such-test")
+
+    def test_non_object_requests_are_rejected(self):
+        for request in ([1, 2], "cooper-test", 3, None):
+            reply = json.loads(worker.handle_line(request))
+            self.assertFalse(reply["ok"])
+            self.assertEqual(reply["error"]["type"], "ValueError")
+
+    def test_non_finite_output_is_null(self):
+        self.assertEqual(to_json({"a": float("nan"), "b": [float("inf"), 1.5]}), '{"a": null, "b": [null, 1.5]}')
+        # The 30-15 IFT VO2max needs sex, age and body mass; without them it is NaN
+        request = {"id": 3, "testId": "shuttle-squad",
+                   "inputs": {"protocol": "ift-30-15", "athletes": [{"athlete": "A", "level": 10}]}}
+        for cache in (None, ResultCache()):
+            text = worker.handle_line(request, cache)
+            self.assertNotIn("NaN", text)
+            self.assertIsNone(json.loads(text)["output"][0]["Estimated VO2max (ml/kg/min)"])
+
+    def test_cached_reply_matches_uncached(self):
+        request = {"id": "x", "testId": "cooper-test", "inputs": {"distance": 2800}}
+        cache = ResultCache()
+        self.assertEqual(json.loads(worker.handle_line(request, cache)), json.loads(worker.handle_line(request)))
+        self.assertEqual(worker.handle_line(request, cache), worker.handle_line(request, cache))
+        self.assertEqual(cache.stats()["hits"], 2)
+
+
+class ServeTest(unittest.TestCase):
+    def test_malformed_lines_do_not_stop_the_worker(self):
+        replies = serve_lines(
+            "not json",
+            "",
+            "[1, 2]",
+            '{"id": 1, "op": "ping"}',
+            '{"id": 2, "testId": "cooper-test", "inputs": {"distance": 2800}}',
+        )
+        self.assertEqual(len(replies), 4)
+        self.assertEqual(replies[0]["error"]["type"], "JSONDecodeError")
+        self.assertFalse(replies[1]["ok"])
+        self.assertEqual(replies[2], {"id": 1, "ok": True})
+        self.assertTrue(replies[3]["ok"])
+        self.assertEqual(replies[3]["id"], 2)
+
+    def test_metrics_every_ignores_bad_lines(self):
+        from forgeon.metrics import Metrics
+
+        metrics, metrics_out = Metrics(), io.StringIO()
+        serve_lines("not json", '{"id": 1, "testId": "cooper-test", "inputs": {"distance": 2800}}',
+                    metrics=metrics, metrics_out=metrics_out, metrics_every=1)
+        self.assertEqual(metrics.requests, 1)
+        self.assertEqual(len(metrics_out.getvalue().splitlines()), 2)  # after the request, and at exit
+
+
+class ServeFramedTest(unittest.TestCase):
+    def serve(self, *frames_in):
+        out = io.BytesIO()
+        worker.serve_framed(io.BytesIO(b"".join(frames_in)), out)
+        out.seek(0)
+        replies = []
+        while True:
+            frame = frames.read_frame(out)
+            if frame is None:
+                return replies[1:]
+            replies.append(frame[0])
+
+    def test_arrays_and_bad_headers(self):
+        import numpy as np
+
+        force = np.full(3000, 800.0)
+        force[1000:1400] = 0.0
+        ok = frames.encode_frame({"id": 1, "testId": "jump-force-trace", "inputs": {"sampling_rate": 1000}},
+                                 [("force", force)])
+        overrun = frames.encode_frame({"id": 2, "testId": "jump-force-trace", "inputs": {},
+                                       "arrays": [{"name": "force", "dtype": "f8", "length": 10}]})
+        no_id = frames.encode_frame({"id": 3, "testId": "cooper-test", "inputs": [{"value": 2800}]})
+        replies = self.serve(ok, overrun, no_id)
+        self.assertEqual([r["id"] for r in replies], [1, 2, 3])
+        self.assertTrue(replies[0]["ok"])
+        self.assertEqual(replies[0]["output"]["Jump Count"], 1)
+        self.assertFalse(replies[1]["ok"])
+        self.assertEqual(replies[2]["error"]["type"], "FrameError")
+
+
+if __name__ == "__main__":
+    unittest.main()
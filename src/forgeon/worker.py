@@ -0,0 +1,240 @@
+"""
+Long-lived calculator worker.
+
+Reads newline-delimited JSON requests on stdin and answers each with one JSON
+line on stdout, tagged with the request id:
+
+    -> {"id": 7, "testId": "bia", "inputs": [{"id": "impedance", "value": 480}, ...], "meta": {}}
+    <- {"id": 7, "ok": true, "testId": "bia", "output": {...}}
+    <- {"id": 7, "ok": false, "error": {"type": "ValueError", "message": "..."}}
+
+A ``{"id": 8, "op": "ping"}`` request is answered with ``{"id": 8, "ok": true}``
+so a supervisor can check that the worker is alive.
+
+With ``--cache-size N`` results are kept in an LRU cache (see
+``forgeon.cache``) so a repeated request is answered without recalculating
+or re-serialising; ``--no-cache TESTID`` (repeatable) excludes a test. A
+``{"id": 9, "op": "cache-stats"}`` request returns the hit/miss/eviction
+counters under ``"cache"`` (``null`` when caching is off).
+
+Every call is timed by phase (script import, calculation, serialisation)
+and counted per testId (see ``forgeon.metrics``); ``{"id": 10, "op":
+"metrics"}`` returns the figures under ``"metrics"``. ``--metrics FILE``
+(``-`` for stderr) also appends them as a ``{"type": "metrics", ...}`` line
+every ``--metrics-every`` requests and on exit, so stdout only ever carries
+replies. ``--trace-memory`` adds each test's peak allocation (tracemalloc).
+A request with ``"profile": true`` runs under cProfile; the stats file is
+written to ``--profile-dir`` (default: the temp dir) and named in the reply's
+``"profile"``.
+
+With ``--framed`` requests and replies are binary frames instead of lines
+(see ``forgeon.frames``): the request header is the usual JSON request and
+large numeric inputs travel as raw little-endian arrays, inline or as a
+memory-mapped file. Requests carrying arrays skip the result cache, as do
+requests that name an input file (``path``, ``hr_path``).
+
+The worker writes ``{"ready": true}`` as soon as it starts. Each test script
+is imported the first time one of its tests is requested; pass ``--preload``
+to import them all before signalling ready instead. Run with
+``python -m forgeon.worker`` from ``src/``.
+"""
+import argparse
+import contextlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+from forgeon import calculators
+from forgeon.calculators import to_json
+from forgeon.cache import ResultCache
+from forgeon.metrics import Metrics, profile_call
+
+
+def _error(request_id, test_id, e):
+    return {
+        "id": request_id,
+        "ok": False,
+        "testId": test_id,
+        "error": {"type": type(e).__name__, "message": str(e)},
+    }
+
+
+def handle(request, metrics=None):
+    request_id = request.get("id")
+    if request.get("op") == "ping":
+        return {"id": request_id, "ok": True}
+
+    test_id = request.get("testId")
+    run = metrics.run if metrics else calculators.run_test
+    try:
+        output = run(test_id, request.get("inputs"), request.get("meta"))
+    except Exception as e:
+        return _error(request_id, test_id, e)
+    return {"id": request_id, "ok": True, "testId": test_id, "output": output}
+
+
+def _profile_path(profile_dir, request):
+    name = re.sub(r"[^\w.-]", "_", f"{request.get('testId')}-{request.get('id')}")
+    return os.path.join(profile_dir or tempfile.gettempdir(), f"forgeon-{name}-{time.time_ns()}.prof")
+
+
+def handle_line(request, cache=None, metrics=None, profile_dir=None):
+    """Answer one request as a JSON line, going through the result cache if there is one."""
+    if not isinstance(request, dict):
+        return to_json(_error(None, None, ValueError("A request must be a JSON object")))
+    op = request.get("op")
+    if op == "cache-stats":
+        return to_json({"id": request.get("id"), "ok": True, "cache": cache and cache.stats()})
+    if op == "metrics":
+        return to_json({"id": request.get("id"), "ok": True, "metrics": metrics and metrics.snapshot()})
+    if op is not None:
+        return to_json(handle(request))
+
+    request_id = request.get("id")
+    test_id = request.get("testId")
+    start = time.perf_counter()
+    serialize_s = 0.0
+    if request.get("profile"):
+        path = _profile_path(profile_dir, request)
+        reply = profile_call(path, handle, request, metrics)
+        reply["profile"] = path
+        text = to_json(reply)
+        ok = reply["ok"]
+    elif cache is None:
+        reply = handle(request, metrics)
+        serialized = time.perf_counter()
+        text = to_json(reply)
+        serialize_s = time.perf_counter() - serialized
+        ok = reply["ok"]
+    else:
+        try:
+            output = cache.run_json(test_id, request.get("inputs"), request.get("meta"))
+        except Exception as e:
+            text = to_json(_error(request_id, test_id, e))
+            ok = False
+        else:
+            serialize_s = cache.last_serialize_s
+            # Same text json.dumps(reply) would give, without re-serialising the output
+            text = f'{{"id": {to_json(request_id)}, "ok": true, "testId": {to_json(test_id)}, "output": {output}}}'
+            ok = True
+    if metrics is not None:
+        metrics.observe(test_id, time.perf_counter() - start, ok, serialize_s)
+    return text
+
+
+def _write_metrics(metrics, out):
+    if metrics is not None and out is not None:
+        out.write(json.dumps(metrics.snapshot()) + "\n")
+        out.flush()
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout, preload=False, cache=None, metrics=None,
+          metrics_out=None, metrics_every=0, profile_dir=None):
+    banner = {"ready": True}
+    if preload:
+        start = time.perf_counter()
+        calculators.load_all()
+        banner["preloadMs"] = round((time.perf_counter() - start) * 1000, 3)
+    write = stdout.write
+    write(json.dumps(banner) + "\n")
+    stdout.flush()
+
+    # Anything a calculator prints goes to stderr so stdout stays one JSON reply per line
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            for line in stdin:
+                line = line.strip()
+                if not line:
+                    continue
+                counted = False  # only calculator requests count towards --metrics-every
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    reply = json.dumps({"id": None, "ok": False, "error": {"type": "JSONDecodeError", "message": str(e)}})
+                else:
+                    counted = isinstance(request, dict) and request.get("op") is None
+                    reply = handle_line(request, cache, metrics, profile_dir)
+                write(reply + "\n")
+                stdout.flush()
+                if metrics_every and metrics is not None and metrics.requests % metrics_every == 0 and counted:
+                    _write_metrics(metrics, metrics_out)
+        finally:
+            _write_metrics(metrics, metrics_out)
+
+
+def serve_framed(stdin=None, stdout=None, preload=False, cache=None, metrics=None,
+                 metrics_out=None, metrics_every=0, profile_dir=None):
+    """serve() for binary frames: one reply frame per request frame."""
+    # Frames need NumPy; the plain NDJSON worker runs without it
+    from forgeon.frames import attach_arrays, encode_frame, encode_text_frame, read_frame
+
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    if preload:
+        calculators.load_all()
+    stdout.write(encode_frame({"ready": True}))
+    stdout.flush()
+
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            while True:
+                try:
+                    frame = read_frame(stdin)
+                except ValueError as e:
+                    # The stream cannot be resynchronised after a malformed frame
+                    stdout.write(encode_frame({"id": None, "ok": False,
+                                               "error": {"type": type(e).__name__, "message": str(e)}}))
+                    stdout.flush()
+                    break
+                if frame is None:
+                    break
+                header, payload = frame
+                has_arrays = bool(header.get("arrays"))
+                counted = False
+                try:
+                    request = attach_arrays(header, payload)
+                except (ValueError, OSError) as e:
+                    reply = to_json(_error(header.get("id"), header.get("testId"), e))
+                else:
+                    counted = request.get("op") is None
+                    reply = handle_line(request, None if has_arrays else cache, metrics, profile_dir)
+                stdout.write(encode_text_frame(reply))
+                stdout.flush()
+                if metrics_every and metrics is not None and metrics.requests % metrics_every == 0 and counted:
+                    _write_metrics(metrics, metrics_out)
+        finally:
+            _write_metrics(metrics, metrics_out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forgeon.worker", description="NDJSON calculator worker.")
+    parser.add_argument("--preload", action="store_true", help="import every test script before signalling ready")
+    parser.add_argument("--cache-size", type=int, default=0, help="cache up to N results (default 0: off)")
+    parser.add_argument("--no-cache", action="append", default=[], metavar="TESTID",
+                        help="never cache this test (repeatable)")
+    parser.add_argument("--metrics", metavar="FILE", help="append metrics records to FILE ('-' for stderr)")
+    parser.add_argument("--metrics-every", type=int, default=100, metavar="N",
+                        help="write a metrics record every N requests (default 100; 0: only on exit)")
+    parser.add_argument("--trace-memory", action="store_true", help="record each test's peak allocation")
+    parser.add_argument("--profile-dir", help="where cProfile dumps for 'profile' requests go")
+    parser.add_argument("--framed", action="store_true", help="speak binary frames (forgeon.frames) instead of NDJSON")
+    args = parser.parse_args(argv)
+
+    metrics = Metrics(trace_memory=args.trace_memory)
+    cache = ResultCache(args.cache_size, args.no_cache, run=metrics.run) if args.cache_size > 0 else None
+    with contextlib.ExitStack() as stack:
+        metrics_out = None
+        if args.metrics == "-":
+            metrics_out = sys.stderr
+        elif args.metrics:
+            metrics_out = stack.enter_context(open(args.metrics, "a", encoding="utf-8"))
+        run = serve_framed if args.framed else serve
+        run(preload=args.preload, cache=cache, metrics=metrics, metrics_out=metrics_out,
+            metrics_every=args.metrics_every, profile_dir=args.profile_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 const { spawn } = require('child_process');
+const path = require('path');
+const readline = require('readline');
+
+const PYTHON = process.env.PYTHON_BIN || 'python';
+const SRC_DIR = path.join(__dirname, '..');
 
 // Runs a python script with JSON stdin; expects JSON on stdout
 function runPython(scriptPath, payload) {
   return new Promise((resolve, reject) => {
-    const py = spawn('python', [scriptPath]);
+    const py = spawn(PYTHON, [scriptPath]);
     let stdout = '';
     let stderr = '';
 
@@ -28,6 +33,201 @@ function runPython(scriptPath, payload) {
   });
 }
 
-module.exports = { runPython };
+const DTYPE_CODES = new Map([
+  [Float64Array, 'f8'],
+  [Float32Array, 'f4'],
+  [Int32Array, 'i4'],
+  [Int16Array, 'i2'],
+  [Uint16Array, 'u2']
+]);
+
+// Encodes a worker request as a binary frame (see src/forgeon/frames.py):
+// typed-array input values travel as raw little-endian bytes, everything
+// else in the JSON header.
+function encodeFrame(request) {
+  const arrays = [];
+  const chunks = [];
+  // Moves a typed array into the payload; returns false so the caller drops it from the header
+  const keepInHeader = (name, value) => {
+    const code = value && DTYPE_CODES.get(value.constructor);
+    if (!code) return true;
+    arrays.push({ name, dtype: code, length: value.length });
+    chunks.push(Buffer.from(value.buffer, value.byteOffset, value.byteLength));
+    return false;
+  };
+
+  let { inputs } = request;
+  if (Array.isArray(inputs)) {
+    inputs = inputs.filter((item) => keepInHeader(item.id, item.value));
+  } else if (inputs) {
+    inputs = Object.fromEntries(Object.entries(inputs).filter(([name, value]) => keepInHeader(name, value)));
+  }
+  const header = Buffer.from(JSON.stringify({ ...request, inputs, ...(arrays.length ? { arrays } : {}) }));
+  const payloadLength = chunks.reduce((n, c) => n + c.length, 0);
+  const prefix = Buffer.alloc(12);
+  prefix.writeUInt32LE(header.length, 0);
+  prefix.writeBigUInt64LE(BigInt(payloadLength), 4);
+  return Buffer.concat([prefix, header, ...chunks]);
+}
+
+// Calls onHeader with the parsed JSON header of every frame on a stream
+// (worker replies carry no payload).
+function readFrames(stream, onHeader) {
+  let buffered = Buffer.alloc(0);
+  stream.on('data', (chunk) => {
+    buffered = buffered.length ? Buffer.concat([buffered, chunk]) : chunk;
+    while (buffered.length >= 12) {
+      const headerLength = buffered.readUInt32LE(0);
+      const frameLength = 12 + headerLength + Number(buffered.readBigUInt64LE(4));
+      if (buffered.length < frameLength) break;
+      onHeader(buffered.toString('utf8', 12, 12 + headerLength));
+      buffered = buffered.subarray(frameLength);
+    }
+  });
+}
+
+// Supervises one long-lived `python -m forgeon.worker` process.
+// Requests are written as NDJSON and matched to replies by id. A worker that
+// exits is restarted on the next request (after a short backoff); a worker
+// that does not answer within requestTimeoutMs is killed and restarted.
+// cacheSize > 0 turns on the worker's result cache for repeated payloads.
+// metricsFile makes the worker append per-testId timing records to that file
+// (stdout stays reserved for replies); metrics() asks for them directly.
+// framed switches to binary frames, so Float64Array (etc.) inputs such as
+// force traces are sent as raw bytes instead of JSON text.
+class PythonWorker {
+  constructor({
+    requestTimeoutMs = 10000,
+    restartDelayMs = 500,
+    cacheSize = Number(process.env.PYTHON_RESULT_CACHE_SIZE) || 0,
+    metricsFile = process.env.PYTHON_METRICS_FILE || null,
+    framed = false
+  } = {}) {
+    this.framed = framed;
+    this.requestTimeoutMs = requestTimeoutMs;
+    this.cacheSize = cacheSize;
+    this.metricsFile = metricsFile;
+    this.restartDelayMs = restartDelayMs;
+    this.proc = null;
+    this.nextId = 0;
+    this.pending = new Map();
+    this.restartTimer = null;
+    this.stopped = false;
+    this.spawnedAt = null;
+    this.startupMs = null; // spawn to ready banner: interpreter start plus worker imports
+  }
+
+  start() {
+    if (this.proc) return;
+    this.stopped = false;
+
+    const args = ['-m', 'forgeon.worker'];
+    if (this.cacheSize > 0) args.push('--cache-size', String(this.cacheSize));
+    if (this.metricsFile) args.push('--metrics', this.metricsFile);
+    if (this.framed) args.push('--framed');
+    const proc = spawn(PYTHON, args, { cwd: SRC_DIR });
+    this.proc = proc;
+    this.spawnedAt = Date.now();
+    this.startupMs = null;
+
+    if (this.framed) {
+      readFrames(proc.stdout, (header) => this._onLine(header));
+    } else {
+      readline.createInterface({ input: proc.stdout }).on('line', (line) => this._onLine(line));
+    }
+    proc.stderr.on('data', (d) => console.warn('Python worker stderr:', d.toString()));
+    proc.stdin.on('error', () => {}); // surfaced through 'exit'
+    proc.on('error', (err) => this._onExit(proc, err));
+    proc.on('exit', (code, signal) => {
+      this._onExit(proc, new Error(`Python worker exited (${signal || code})`));
+    });
+  }
+
+  stop() {
+    this.stopped = true;
+    clearTimeout(this.restartTimer);
+    if (this.proc) this.proc.kill();
+  }
+
+  run(testId, inputs, meta) {
+    return this._send({ testId, inputs, meta }, testId, (reply) => reply.output);
+  }
 
+  // Per-testId call counts, phase timings and latency histograms from the worker
+  metrics() {
+    return this._send({ op: 'metrics' }, 'metrics', (reply) => ({
+      ...reply.metrics,
+      startupMs: this.startupMs
+    }));
+  }
+
+  _send(request, label, pick) {
+    if (!this.proc) this.start();
+
+    const id = ++this.nextId;
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id);
+        reject(new Error(`Python worker timed out on ${label} after ${this.requestTimeoutMs}ms`));
+        // A hung worker would block every request queued behind this one
+        if (this.proc) this.proc.kill('SIGKILL');
+      }, this.requestTimeoutMs);
+
+      this.pending.set(id, { resolve, reject, timer, pick });
+      this.proc.stdin.write(this.framed ? encodeFrame({ id, ...request }) : JSON.stringify({ id, ...request }) + '\n');
+    });
+  }
+
+  _onLine(line) {
+    let reply;
+    try {
+      reply = JSON.parse(line);
+    } catch (e) {
+      console.warn('Invalid JSON from python worker:', line);
+      return;
+    }
+    if (reply.ready) {
+      this.startupMs = Date.now() - this.spawnedAt;
+      return;
+    }
+    const entry = this.pending.get(reply.id);
+    if (!entry) return; // a reply that already timed out
+    this.pending.delete(reply.id);
+    clearTimeout(entry.timer);
+
+    if (reply.ok) {
+      entry.resolve(entry.pick(reply));
+    } else {
+      const err = new Error(reply.error.message);
+      err.type = reply.error.type;
+      err.status = reply.error.type === 'UnknownTest' ? 404 : 422;
+      entry.reject(err);
+    }
+  }
+
+  _onExit(proc, err) {
+    if (this.proc !== proc) return;
+    this.proc = null;
+
+    for (const { reject, timer } of this.pending.values()) {
+      clearTimeout(timer);
+      reject(err);
+    }
+    this.pending.clear();
+
+    if (!this.stopped) {
+      clearTimeout(this.restartTimer);
+      this.restartTimer = setTimeout(() => this.start(), this.restartDelayMs);
+      this.restartTimer.unref();
+    }
+  }
+}
+
+let sharedWorker = null;
+
+function getPythonWorker() {
+  if (!sharedWorker) sharedWorker = new PythonWorker();
+  return sharedWorker;
+}
 
+module.exports = { runPython, PythonWorker, getPythonWorker, encodeFrame };
@@ -159,8 +159,8 @@ const healthRelatedFitnessModule = {
           hasAudio: false,
           dataFields: [
             { id: 'final_level', name: 'Final Level', type: 'number', required: true, min: 1, max: 21 },
-            { id: 'final_shuttles', name: 'Final Shuttles', type: 'number', required: true, min: 0, max: 15 },
-            { id: 'total_shuttles', name: 'Total Shuttles', type: 'number', required: true }
+            { id: 'final_shuttles', name: 'Final Shuttles', type: 'number', required: true, min: 0, max: 16 },
+            { id: 'total_shuttles', name: 'Total Shuttles', type: 'number', required: false }
           ],
           calculations: [
             {
@@ -178,7 +178,8 @@ async function testPythonIntegration(drillId) {
     const executeResponse = await api.post('/execute-drill', {
       drillId,
       athleteId: 'athlete-1',
-      duration: 30
+      duration: 30,
+      responses: [320, 285, 410, null, 298, 350, 275, 505, 330, 301]
     });
     
     console.log('✅ Python script executed successfully');
@@ -188,7 +189,7 @@ async function testPythonIntegration(drillId) {
       score: executeResponse.data.session.metrics.score
     });
     
-    console.log('🐍 Python output preview:', executeResponse.data.pythonOutput.substring(0, 100) + '...');
+    console.log('🐍 Python output preview:', JSON.stringify(executeResponse.data.pythonOutput).substring(0, 100) + '...');
     
     return executeResponse.data.session._id;
   } catch (error) {
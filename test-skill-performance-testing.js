@@ -93,7 +93,7 @@ const testNeuromuscularReadiness = async () => {
     // Execute daily readiness (Python integration)
     const executeResponse = await axios.post(
       `${BASE_URL}/neuromuscular-readiness/execute-daily-readiness`,
-      { athleteId: ATHLETE_ID }
+      { athleteId: ATHLETE_ID, scores: testData.dailyReadiness.scores }
     );
     console.log('✅ Daily Readiness Executed:', executeResponse.data.message);
     